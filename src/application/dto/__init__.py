@@ -3,3 +3,6 @@ from .auth_dto import *
 from .category_dto import *
 from .user_profile_dto import *
 from .tag_dto import *
+from .product_dto import *
+from .suggestion_dto import *
+from .catalog_import_dto import *
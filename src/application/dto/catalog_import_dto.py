@@ -0,0 +1,88 @@
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from core.settings import settings
+
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _localized(value: object) -> object:
+    """Plain text is the default locale's name"""
+    if isinstance(value, str):
+        return {settings.LANGUAGES[0]: value}
+    return value
+
+
+def _check_locales(value: dict[str, str], required: bool) -> dict[str, str]:
+    unknown = set(value) - set(settings.LANGUAGES)
+    if unknown:
+        raise ValueError(f"unknown locales {sorted(unknown)}, expected {settings.LANGUAGES}")
+    if required and not value.get(settings.LANGUAGES[0]):
+        raise ValueError(f"'{settings.LANGUAGES[0]}' name is required")
+    # PostgreSQL text (and the jsonb COPY) can't hold NUL - one such cell would fail the whole import
+    if any("\x00" in text for text in value.values()):
+        raise ValueError("NUL character is not allowed")
+    return value
+
+
+class ProductImportDTO(BaseModel):
+    """
+    One product row of a catalogue feed
+
+    Localized fields are `{locale: text}` or plain text (default locale).
+    Category and tags are given by name - the default locale name is the key
+    they are matched by. Rows without uuid are new products.
+    """
+    uuid: Optional[UUID] = None
+    name: dict[str, str]
+    description: dict[str, str] = {}
+    price: float = Field(ge=0)
+    stock: int = Field(default=0, ge=0)
+    category: dict[str, str]
+    tags: List[dict[str, str]] = []
+
+    @field_validator("name", "description", "category", mode="before")
+    @classmethod
+    def _localized_text(cls, value: object) -> object:
+        return _localized(value)
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def _localized_tags(cls, value: object) -> object:
+        if isinstance(value, list):
+            return [_localized(tag) for tag in value]
+        return value
+
+    @field_validator("name", "category")
+    @classmethod
+    def _required_locales(cls, value: dict[str, str]) -> dict[str, str]:
+        return _check_locales(value, required=True)
+
+    @field_validator("description")
+    @classmethod
+    def _optional_locales(cls, value: dict[str, str]) -> dict[str, str]:
+        return _check_locales(value, required=False)
+
+    @field_validator("tags")
+    @classmethod
+    def _tag_locales(cls, value: List[dict[str, str]]) -> List[dict[str, str]]:
+        return [_check_locales(tag, required=True) for tag in value]
+
+
+class ImportErrorDTO(BaseModel):
+    line: int
+    message: str
+
+
+class ImportResultDTO(BaseModel):
+    rows: int  # data rows read from the file
+    created: int
+    updated: int
+    failed: int
+    errors: List[ImportErrorDTO] = []  # first IMPORT_MAX_ERRORS of them
@@ -4,5 +4,5 @@ from uuid import UUID
 
 class CategoryDTO(BaseModel):
     uuid: UUID | None
-    name: dict[str, str]
-    description: Optional[dict[str, str]] = None
\ No newline at end of file
+    name: dict[str, str] | str
+    description: Optional[dict[str, str] | str] = None
\ No newline at end of file
@@ -1,14 +1,31 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 from pydantic import BaseModel
 
 T = TypeVar('T')
 
 class PagingDTO(BaseModel, Generic[T]):
-    page: int
+    page: Optional[int]
     size: int
     total: int
     items: List[T]
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
 
     @classmethod
-    def new(cls, page: int, size: int, total: int, items: List[T]) -> 'PagingDTO[T]':
-        return cls(page=page, size=size, total=total, items=items)
+    def new(
+            cls,
+            page: Optional[int],
+            size: int,
+            total: int,
+            items: List[T],
+            next_cursor: Optional[str] = None,
+            total_estimated: bool = False,
+    ) -> 'PagingDTO[T]':
+        return cls(
+            page=page,
+            size=size,
+            total=total,
+            items=items,
+            next_cursor=next_cursor,
+            total_estimated=total_estimated,
+        )
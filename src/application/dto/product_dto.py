@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import List
+from uuid import UUID
+
+from .category_dto import CategoryDTO
+from .tag_dto import TagDTO
+
+
+class ProductCreateDTO(BaseModel):
+    name: dict[str, str]
+    description: dict[str, str]
+    price: float
+    stock: int
+    category_id: UUID
+    tags: List[UUID] = []
+    images: List[UUID] = []
+
+
+class ProductImageDTO(BaseModel):
+    uuid: UUID
+    image_url: str
+
+
+class ProductDetailDTO(BaseModel):
+    uuid: UUID
+    name: dict[str, str]
+    description: dict[str, str]
+    price: float
+    stock: int
+    category: CategoryDTO
+    tags: List[TagDTO]
+    images: List[ProductImageDTO]
+
+
+class ProductDTO(BaseModel):
+    uuid: UUID
+    name: dict[str, str] | str
+    category_name: dict[str, str] | str
+    price: float
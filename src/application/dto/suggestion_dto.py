@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import List
+from uuid import UUID
+
+
+class SuggestionDTO(BaseModel):
+    uuid: UUID
+    name: str
+
+
+class AutocompleteDTO(BaseModel):
+    categories: List[SuggestionDTO] = []
+    tags: List[SuggestionDTO] = []
+    products: List[SuggestionDTO] = []
@@ -2,3 +2,6 @@ from .auth_mapper import *
 from .user_profile_mapper import *
 from .category_mapper import *
 from .tag_mapper import *
+from .product_mapper import *
+from .suggestion_mapper import *
+from .catalog_import_mapper import *
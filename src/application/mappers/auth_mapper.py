@@ -1,12 +1,11 @@
-import uuid
-
 from application.dto.auth_dto import UserRegisterDTO
 from domain.entity.user_entity import UserEntity
+from utils.uuid7 import uuid7
 
 
 def to_entity(dto: UserRegisterDTO, hashed_pw: str) -> UserEntity:
     return UserEntity(
-        uuid=uuid.uuid4(),
+        uuid=uuid7(),
         first_name=dto.first_name,
         last_name=dto.last_name,
         phone_number=dto.phone_number,
@@ -0,0 +1,20 @@
+from application.dto import ImportErrorDTO, ProductImportDTO
+from domain.entity import ImportErrorEntity, ImportRowEntity
+from utils.uuid7 import uuid7
+
+
+def product_import_to_entity(line: int, dto: ProductImportDTO) -> ImportRowEntity:
+    return ImportRowEntity(
+        line=line,
+        uuid=dto.uuid or uuid7(),
+        name=dto.name,
+        description=dto.description,
+        price=dto.price,
+        stock=dto.stock,
+        category=dto.category,
+        tags=dto.tags,
+    )
+
+
+def import_error_to_dto(error: ImportErrorEntity) -> ImportErrorDTO:
+    return ImportErrorDTO.model_construct(line=error.line, message=error.message)
@@ -10,7 +10,8 @@ def cat_to_entity(dto: CategoryDTO) -> CategoryEntity:
     )
 
 def cat_to_dto(entity: CategoryEntity) -> CategoryDTO:
-    return CategoryDTO(
+    # List hot path - values come from the database, skip pydantic validation
+    return CategoryDTO.model_construct(
         uuid=entity.uuid,
         name=entity.name,
         description=entity.description
@@ -0,0 +1,44 @@
+from application.dto import (
+    ProductCreateDTO,
+    ProductDetailDTO,
+    ProductImageDTO,
+    ProductDTO,
+)
+from application.mappers.category_mapper import cat_to_dto
+from application.mappers.tag_mapper import tag_entity_to_dto
+from domain.entity import ProductCreateEntity, ProductDetailEntity, ProductEntity
+
+
+def product_dto_to_entity(dto: ProductCreateDTO) -> ProductCreateEntity:
+    return ProductCreateEntity(
+        name=dto.name,
+        description=dto.description,
+        price=dto.price,
+        stock=dto.stock,
+        category_id=dto.category_id,
+        tags=dto.tags,
+        images=dto.images,
+    )
+
+
+def product_detail_to_dto(entity: ProductDetailEntity) -> ProductDetailDTO:
+    return ProductDetailDTO(
+        uuid=entity.uuid,
+        name=entity.name,
+        description=entity.description,
+        price=entity.price,
+        stock=entity.stock,
+        category=cat_to_dto(entity.category),
+        tags=[tag_entity_to_dto(tag) for tag in entity.tags],
+        images=[ProductImageDTO(uuid=image.uuid, image_url=image.image_url) for image in entity.images],
+    )
+
+
+def product_to_dto(entity: ProductEntity) -> ProductDTO:
+    # List hot path - values come from the database, skip pydantic validation
+    return ProductDTO.model_construct(
+        uuid=entity.uuid,
+        name=entity.name,
+        category_name=entity.category_name,
+        price=entity.price,
+    )
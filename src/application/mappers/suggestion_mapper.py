@@ -0,0 +1,20 @@
+from typing import List
+
+from application.dto import AutocompleteDTO, SuggestionDTO
+from domain.entity import SuggestionEntity
+
+# SuggestionEntity.kind -> AutocompleteDTO field
+_SUGGESTION_GROUPS = {
+    "category": "categories",
+    "tag": "tags",
+    "product": "products",
+}
+
+
+def suggestions_to_dto(entities: List[SuggestionEntity]) -> AutocompleteDTO:
+    groups: dict[str, List[SuggestionDTO]] = {field: [] for field in _SUGGESTION_GROUPS.values()}
+    for entity in entities:
+        groups[_SUGGESTION_GROUPS[entity.kind]].append(
+            SuggestionDTO.model_construct(uuid=entity.uuid, name=entity.name)
+        )
+    return AutocompleteDTO.model_construct(None, **groups)
@@ -0,0 +1,60 @@
+import csv
+import json
+from typing import Any, Iterator, TextIO
+
+from application.dto import ImportFormat
+
+# (line, record) - record is the decoded row, or why it couldn't be decoded
+ImportRecord = tuple[int, dict[str, Any] | ValueError]
+
+
+def _csv_cell(value: str) -> Any:
+    # Localized {locale: text} cells and tag lists are JSON - as the exports write them
+    if value[:1] in ("{", "["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _read_csv(file: TextIO) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(file)
+    for row in reader:
+        if None in row:
+            yield reader.line_num, ValueError(f"more cells than the header's {len(reader.fieldnames or ())}")
+            continue
+        # Empty cells are missing values - field defaults apply
+        yield reader.line_num, {key: _csv_cell(value) for key, value in row.items() if value}
+
+
+def _read_ndjson(file: TextIO) -> Iterator[ImportRecord]:
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            yield line, ValueError(f"invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield line, ValueError("expected a JSON object")
+            continue
+        yield line, record
+
+
+def read_records(file: TextIO, import_format: ImportFormat) -> Iterator[ImportRecord]:
+    """
+    Rows of a catalogue feed, one at a time - the file is never read whole
+
+    NDJSON - one JSON object per line. CSV - a header row, then one product
+    per row; `{...}` / `[...]` cells are decoded as JSON.
+
+    Usage:
+        with open("feed.csv", newline="", encoding="utf-8-sig") as file:
+            for line, record in read_records(file, ImportFormat.CSV):
+                ...
+    """
+    if import_format is ImportFormat.CSV:
+        return _read_csv(file)
+    return _read_ndjson(file)
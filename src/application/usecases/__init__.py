@@ -1,3 +1,18 @@
 from .auth_usecase import SignUpUseCase, SignInUseCase
 from .category_usecase import CategoryUseCase
-from .user_profile_usecase import UserProfileUseCase
\ No newline at end of file
+from .user_profile_usecase import UserProfileUseCase
+from .product_usecase import ProductUseCase
+from .autocomplete_usecase import AutocompleteUseCase
+from .tag_usecase import TagUseCase
+from .catalog_import_usecase import CatalogImportUseCase
+
+__all__ = [
+    "SignUpUseCase",
+    "SignInUseCase",
+    "CategoryUseCase",
+    "UserProfileUseCase",
+    "ProductUseCase",
+    "AutocompleteUseCase",
+    "TagUseCase",
+    "CatalogImportUseCase",
+]
@@ -1,4 +1,4 @@
-from injector import inject, singleton
+from injector import inject
 
 from application.dto import (
     UserLoginDTO,
@@ -9,32 +9,36 @@ from application.mappers import to_entity
 from core.exceptions import ValidationException, ApplicationException
 from core.response import ApiResponse, ErrorCode
 from domain.entity import UserEntity
-from domain.repository import UserRepository
+from domain.repository import UserRepository, UnitOfWork
 from domain.services.security import TokenService
 
 
-@singleton
 class SignUpUseCase:
 
     @inject
-    def __init__(self, repo: UserRepository, token_service: TokenService):
+    def __init__(self, repo: UserRepository, token_service: TokenService, uow: UnitOfWork):
         self.repo = repo
         self.token_service = token_service
+        self.uow = uow
 
     async def execute(self, dto: UserRegisterDTO) -> ApiResponse[dict[str, str]] | None:
         try:
             # Validate input data
             self._validate_registration_data(dto)
 
-            # Check if the user already exists
-            existing_email = await self.repo.get_by_email(dto.email)
-            if existing_email:
-                raise ValidationException(
-                    "email", "Email already in use",
-                )
+            # Email check and insert commit together
+            async with self.uow.transaction():
+                # Check if the user already exists
+                existing_email = await self.repo.get_by_email(dto.email)
+                if existing_email:
+                    raise ValidationException(
+                        "email", "Email already in use",
+                    )
+
+                # Save the user to the repository
+                user_id = await self.repo.save(self._create_user_entity(dto))
 
-            # Save the user to the repository
-            if user_id := await self.repo.save(self._create_user_entity(dto)):
+            if user_id:
                 return ApiResponse.success_response(
                     data={"user_id": str(user_id)},
                     message="User registered successfully",
@@ -69,7 +73,6 @@ class SignUpUseCase:
         return to_entity(dto, hashed_pwd)
 
 
-@singleton
 class SignInUseCase:
 
     @inject
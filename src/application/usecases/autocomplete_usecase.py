@@ -0,0 +1,35 @@
+from injector import inject
+
+from application.dto import AutocompleteDTO
+from application.mappers import suggestions_to_dto
+from core.settings import settings
+from domain.repository import AutocompleteRepository
+from utils.cache import TTLCache
+
+# Process-wide - typeahead repeats the same short prefixes across users
+suggestion_cache: TTLCache[tuple[str, str, int], AutocompleteDTO] = TTLCache(
+    maxsize=settings.AUTOCOMPLETE_CACHE_SIZE,
+    ttl=settings.AUTOCOMPLETE_CACHE_TTL,
+)
+
+
+class AutocompleteUseCase:
+
+    @inject
+    def __init__(self, repository: AutocompleteRepository):
+        self.repository = repository
+
+    async def suggest(self, term: str, lang: str, limit: int = settings.AUTOCOMPLETE_LIMIT) -> AutocompleteDTO:
+        """
+        Category, tag and product names matching `term` - cached for a few seconds
+
+        IMPORTANT: Cache da eskirgan nom AUTOCOMPLETE_CACHE_TTL gacha qolishi mumkin.
+        """
+        key = (lang, " ".join(term.lower().split()), limit)
+        cached = suggestion_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = suggestions_to_dto(await self.repository.suggest(key[1], lang, limit=limit))
+        suggestion_cache.set(key, result)
+        return result
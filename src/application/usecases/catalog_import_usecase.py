@@ -0,0 +1,104 @@
+import asyncio
+import csv
+from itertools import islice
+from typing import Iterator, TextIO
+from uuid import UUID
+
+from injector import inject
+from pydantic import ValidationError
+
+from application.dto import ImportFormat, ImportResultDTO, ProductImportDTO
+from application.mappers import import_error_to_dto, product_import_to_entity
+from application.services.catalog_reader import ImportRecord, read_records
+from application.usecases.autocomplete_usecase import suggestion_cache
+from core.exceptions import ApplicationException, ValidationException
+from core.response import ErrorCode
+from core.settings import settings
+from domain.entity import ImportErrorEntity, ImportRowEntity
+from domain.repository import CatalogImportRepository, UnitOfWork, UserProfileRepository
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class CatalogImportUseCase:
+
+    @inject
+    def __init__(self, repository: CatalogImportRepository, users: UserProfileRepository, uow: UnitOfWork):
+        self.repository = repository
+        self.users = users
+        self.uow = uow
+
+    async def ensure_can_import(self, requester_id: UUID) -> None:
+        if not await self.users.is_superuser(requester_id):
+            raise ApplicationException(
+                "Only superusers can import the catalogue",
+                ErrorCode.PERMISSION_DENIED
+            )
+
+    async def import_file(
+            self,
+            file: TextIO,
+            import_format: ImportFormat,
+            chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+    ) -> ImportResultDTO:
+        """
+        Products (with their categories and tags) of a CSV / NDJSON feed
+
+        The file is read and validated `chunk_size` rows at a time, every chunk
+        is COPYed into staging, then everything is merged at once. Invalid
+        rows are skipped and reported by line; the valid ones are imported
+        in one transaction - all of them or none. A file that can't be read
+        at all (not UTF-8, malformed CSV) is a ValidationException.
+        """
+        records = read_records(file, import_format)
+        errors: list[ImportErrorEntity] = []
+        rows_read = failed = 0
+
+        def reject(line: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.IMPORT_MAX_ERRORS:
+                errors.append(ImportErrorEntity(line=line, message=message))
+
+        async with self.uow.transaction():
+            while chunk := await self._read_chunk(records, chunk_size, rows_read):
+                rows_read += len(chunk)
+                rows: list[ImportRowEntity] = []
+                for line, record in chunk:
+                    if isinstance(record, ValueError):
+                        reject(line, str(record))
+                        continue
+                    try:
+                        rows.append(product_import_to_entity(line, ProductImportDTO.model_validate(record)))
+                    except ValidationError as e:
+                        reject(line, _validation_message(e))
+                await self.repository.stage(rows)
+
+            result = await self.repository.merge()
+
+        # New names must show up in typeahead right away
+        suggestion_cache.clear()
+
+        errors = sorted(errors + result.errors, key=lambda error: error.line)
+        return ImportResultDTO(
+            rows=rows_read,
+            created=result.created,
+            updated=result.updated,
+            failed=failed + len(result.errors),
+            errors=[import_error_to_dto(error) for error in errors[:settings.IMPORT_MAX_ERRORS]],
+        )
+
+    @staticmethod
+    async def _read_chunk(records: Iterator[ImportRecord], chunk_size: int, rows_read: int) -> list[ImportRecord]:
+        try:
+            # Reading (and CSV parsing) blocks - off the event loop
+            return await asyncio.to_thread(list, islice(records, chunk_size))
+        except UnicodeDecodeError as e:
+            raise ValidationException("file", f"not UTF-8 text after row {rows_read}: {e.reason}")
+        except csv.Error as e:
+            raise ValidationException("file", f"malformed CSV after row {rows_read}: {e}")
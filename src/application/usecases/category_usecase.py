@@ -1,6 +1,8 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from injector import inject, singleton
+from injector import inject
 
 from application.dto import CategoryDTO, PagingDTO
 from application.exceptions import errors
@@ -9,7 +11,6 @@ from core.response import ApiResponse
 from domain.repository import CategoryRepository
 
 
-@singleton
 class CategoryUseCase:
 
     @inject
@@ -37,12 +38,55 @@ class CategoryUseCase:
             message="Category found successfully"
         )
 
-    async def list_categories(self, skip: int = 1, limit: int = 10) -> PagingDTO[CategoryDTO]:
-        result = await self.repository.list(skip=skip, limit=limit)
+    async def category_version(self, category_id: Optional[UUID] = None) -> Optional[str]:
+        """Changes whenever the category (or, without an id, any category) does - ETag source"""
+        return await self.repository.version(category_id)
+
+    async def list_categories(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            lang: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> PagingDTO[CategoryDTO]:
+        result = await self.repository.list(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            lang=lang,
+            created_after=created_after,
+            created_before=created_before,
+        )
 
         return PagingDTO.new(
             page=result.page,
             size=result.size,
             total=result.total,
-            items=[cat_to_dto(item) for item in result.items]
-        )
\ No newline at end of file
+            items=[cat_to_dto(item) for item in result.items],
+            next_cursor=result.next_cursor,
+            total_estimated=result.total_estimated,
+        )
+
+    async def search_categories(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> PagingDTO[CategoryDTO]:
+        result = await self.repository.search(query, lang, limit=limit, cursor=cursor)
+
+        return PagingDTO.new(
+            page=result.page,
+            size=result.size,
+            total=result.total,
+            items=[cat_to_dto(item) for item in result.items],
+            next_cursor=result.next_cursor,
+        )
+
+    async def export_categories(self) -> AsyncIterator[CategoryDTO]:
+        """Every category, all locales - streamed, never held in memory"""
+        async for category in self.repository.stream():
+            yield cat_to_dto(category)
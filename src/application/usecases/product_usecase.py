@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from injector import inject
+
+from application.dto import ProductCreateDTO, ProductDetailDTO, ProductDTO, PagingDTO
+from application.mappers import product_dto_to_entity, product_detail_to_dto, product_to_dto
+from core.response import ApiResponse
+from domain.repository import ProductRepository
+
+
+class ProductUseCase:
+
+    @inject
+    def __init__(self, repository: ProductRepository):
+        self.repository = repository
+
+    async def create_product(self, dto: ProductCreateDTO) -> ApiResponse[ProductDetailDTO]:
+        product_id = await self.repository.create(product_dto_to_entity(dto))
+        return await self._detail_response(product_id, "Product created successfully")
+
+    async def get_product(self, product_id: UUID) -> ApiResponse[ProductDetailDTO]:
+        return await self._detail_response(product_id, "Product found successfully")
+
+    async def update_product(self, product_id: UUID, dto: ProductCreateDTO) -> ApiResponse[ProductDetailDTO]:
+        await self.repository.update(product_id, product_dto_to_entity(dto))
+        return await self._detail_response(product_id, "Product updated successfully")
+
+    async def list_products(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            lang: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> PagingDTO[ProductDTO]:
+        result = await self.repository.list(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            lang=lang,
+            created_after=created_after,
+            created_before=created_before,
+        )
+
+        return PagingDTO.new(
+            page=result.page,
+            size=result.size,
+            total=result.total,
+            items=[product_to_dto(item) for item in result.items],
+            next_cursor=result.next_cursor,
+            total_estimated=result.total_estimated,
+        )
+
+    async def search_products(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> PagingDTO[ProductDTO]:
+        result = await self.repository.search(query, lang, limit=limit, cursor=cursor)
+
+        return PagingDTO.new(
+            page=result.page,
+            size=result.size,
+            total=result.total,
+            items=[product_to_dto(item) for item in result.items],
+            next_cursor=result.next_cursor,
+        )
+
+    async def export_products(self) -> AsyncIterator[ProductDTO]:
+        """Every product as a list item, all locales - streamed"""
+        async for product in self.repository.stream():
+            yield product_to_dto(product)
+
+    async def _detail_response(self, product_id: UUID, message: str) -> ApiResponse[ProductDetailDTO]:
+        product = await self.repository.get_by_id(product_id)
+        if product is None:
+            return ApiResponse.error_response(
+                message="Product not found",
+                error_code=404
+            )
+        return ApiResponse.success_response(
+            data=product_detail_to_dto(product),
+            message=message
+        )
@@ -1,6 +1,8 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from injector import inject, singleton
+from injector import inject
 
 from application.dto import TagDTO, PagingDTO
 from application.mappers import tag_dto_to_entity, tag_entity_to_dto
@@ -9,7 +11,6 @@ from core.response import ApiResponse
 from domain.repository import TagRepository
 
 
-@singleton
 class TagUseCase:
 
     @inject
@@ -39,15 +40,39 @@ class TagUseCase:
             message="Tag found successfully"
         )
 
-    async def list(self, skip: int = 0, limit: int = 10) -> PagingDTO[TagDTO]:
-        result = await self.repository.list(skip=skip, limit=limit)
+    async def version(self, tag_id: Optional[UUID] = None) -> Optional[str]:
+        """Changes whenever the tag (or, without an id, any tag) does - ETag source"""
+        return await self.repository.version(tag_id)
+
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> PagingDTO[TagDTO]:
+        result = await self.repository.list(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            created_after=created_after,
+            created_before=created_before,
+        )
         return PagingDTO.new(
             page=result.page,
             size=result.size,
             total=result.total,
-            items=[tag_entity_to_dto(item) for item in result.items]
+            items=[tag_entity_to_dto(item) for item in result.items],
+            next_cursor=result.next_cursor,
+            total_estimated=result.total_estimated,
         )
 
+    async def export(self) -> AsyncIterator[TagDTO]:
+        """Every tag, all locales - streamed"""
+        async for tag in self.repository.stream():
+            yield tag_entity_to_dto(tag)
+
     async def update(self, tag_id: UUID, dto: TagDTO) -> UUID | ApiResponse[None]:
         try:
             tag_entity = tag_dto_to_entity(dto)
@@ -1,15 +1,15 @@
+from typing import AsyncIterator
 from uuid import UUID
 
-from injector import inject, singleton
+from injector import inject
 
 from application.dto import UserProfileDTO
 from application.mappers import profile_entity_to_dto
-from core.exceptions import EntityNotFoundException
-from core.response import ApiResponse
+from core.exceptions import ApplicationException, EntityNotFoundException
+from core.response import ApiResponse, ErrorCode
 from domain.repository import UserProfileRepository
 
 
-@singleton
 class UserProfileUseCase:
 
     @inject
@@ -28,3 +28,29 @@ class UserProfileUseCase:
             entity_name="User",
             entity_id=str(pk)
         )
+
+    async def ensure_superuser(self, requester_id: UUID) -> None:
+        """Internal endpoints (pool / cache statistics) - superusers only"""
+        if not await self.repo.is_superuser(requester_id):
+            raise ApplicationException(
+                "Only superusers can read internal statistics",
+                ErrorCode.PERMISSION_DENIED
+            )
+
+    async def export_users(self, requester_id: UUID) -> AsyncIterator[UserProfileDTO]:
+        """
+        Every user profile - superusers only
+
+        The permission check runs before anything is streamed, so a refusal
+        is a normal error response, not a broken stream.
+        """
+        if not await self.repo.is_superuser(requester_id):
+            raise ApplicationException(
+                "Only superusers can export users",
+                ErrorCode.PERMISSION_DENIED
+            )
+        return self._export_users()
+
+    async def _export_users(self) -> AsyncIterator[UserProfileDTO]:
+        async for user in self.repo.stream():
+            yield profile_entity_to_dto(user)
@@ -0,0 +1,96 @@
+"""
+Catalogue import throughput benchmark - COPY staging + set-based merge
+
+Writes a synthetic NDJSON (or CSV) feed of --rows products spread over a few
+categories and tags, imports it through CatalogImportUseCase and reports
+rows/s - once as new products, once more as updates of the same uuids.
+The imported rows are deleted afterwards.
+
+Usage (from src/):
+    python -m benchmarks.catalog_import_throughput --rows 500000 --format csv
+"""
+import argparse
+import asyncio
+import csv
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import delete
+
+from application.dto import ImportFormat
+from application.usecases import CatalogImportUseCase
+from di import container, request_context
+from infrastructure.persistence.db_session import get_db_session_manager, startup_db, shutdown_db
+from infrastructure.persistence.models import CategoryModel, ProductModel, TagModel
+from utils.uuid7 import uuid7
+
+PREFIX = "Benchmark import"
+
+
+def _write_feed(path: Path, rows: int, import_format: ImportFormat) -> None:
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file) if import_format is ImportFormat.CSV else None
+        if writer:
+            writer.writerow(["uuid", "name", "description", "price", "stock", "category", "tags"])
+        for i in range(rows):
+            row = {
+                "uuid": str(uuid7()),
+                "name": {"en": f"{PREFIX} product {i}", "ru": f"Товар {i}"},
+                "description": {"en": "bulk import benchmark"},
+                "price": i % 1000 + 0.99,
+                "stock": i % 50,
+                "category": f"{PREFIX} category {i % 20}",
+                "tags": [f"{PREFIX} tag {i % 7}", f"{PREFIX} tag {i % 11}"],
+            }
+            if writer:
+                writer.writerow([
+                    json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                    for value in row.values()
+                ])
+            else:
+                file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+async def _import(path: Path, import_format: ImportFormat) -> float:
+    started = time.perf_counter()
+    async with request_context():
+        with path.open(encoding="utf-8", newline="") as file:
+            result = await container.get(CatalogImportUseCase).import_file(file, import_format)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{result.rows / elapsed:10.0f} rows/s  {elapsed:8.2f} s  "
+        f"created={result.created} updated={result.updated} failed={result.failed}"
+    )
+    return elapsed
+
+
+async def _cleanup() -> None:
+    async with get_db_session_manager().session() as session:
+        await session.execute(delete(ProductModel).where(ProductModel.name["en"].astext.startswith(PREFIX)))
+        await session.execute(delete(TagModel).where(TagModel.name["en"].astext.startswith(PREFIX)))
+        await session.execute(delete(CategoryModel).where(CategoryModel.name["en"].astext.startswith(PREFIX)))
+
+
+async def main(rows: int, import_format: ImportFormat) -> None:
+    await startup_db()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"feed.{import_format.value}"
+            _write_feed(path, rows, import_format)
+            print(f"\nImporting {rows} rows ({import_format.value}, {path.stat().st_size / 1024 / 1024:.1f} MB):")
+            await _import(path, import_format)
+            await _import(path, import_format)
+        print()
+    finally:
+        await _cleanup()
+        await shutdown_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000, help="Products in the feed")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], default="ndjson")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, ImportFormat(args.format)))
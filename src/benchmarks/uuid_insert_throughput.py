@@ -0,0 +1,90 @@
+"""
+Insert throughput benchmark - uuid4 vs uuid7 primary keys
+
+Inserts the same number of rows into two scratch tables that differ only in
+how the uuid primary key is generated, in batches, and reports rows/s and the
+final size of the primary key index. Random uuid4 keys split pages all over
+the B-tree (bigger, colder index); uuid7 keys append to its right edge.
+The gap grows once the index no longer fits in shared_buffers - use --rows
+large enough for your server.
+
+Usage (from src/):
+    python -m benchmarks.uuid_insert_throughput --rows 1000000 --batch 1000
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import Column, MetaData, String, Table, insert, select, func, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from infrastructure.persistence.db_session import get_db_session_manager, startup_db, shutdown_db
+from utils.uuid7 import uuid7
+
+metadata = MetaData()
+
+TABLES = {
+    name: Table(
+        f"benchmark_{name}_keys",
+        metadata,
+        Column("uuid", PG_UUID(as_uuid=True), primary_key=True),
+        Column("payload", String(64), nullable=False),
+    )
+    for name in ("uuid4", "uuid7")
+}
+
+GENERATORS: dict[str, Callable[[], UUID]] = {
+    "uuid4": uuid4,
+    "uuid7": uuid7,
+}
+
+
+async def _insert(table: Table, generate: Callable[[], UUID], rows: int, batch: int) -> float:
+    """Seconds spent inserting `rows` rows, one transaction per batch"""
+    engine = get_db_session_manager().engine
+    elapsed = 0.0
+    for start in range(0, rows, batch):
+        values = [{"uuid": generate(), "payload": f"row {i}"} for i in range(start, min(start + batch, rows))]
+        started = time.perf_counter()
+        async with engine.begin() as connection:
+            await connection.execute(insert(table), values)
+        elapsed += time.perf_counter() - started
+    return elapsed
+
+
+async def _index_size(table: Table) -> int:
+    async with get_db_session_manager().engine.connect() as connection:
+        size = await connection.scalar(
+            select(func.pg_relation_size(text(f"'{table.name}_pkey'::regclass")))
+        )
+        return size or 0
+
+
+async def main(rows: int, batch: int) -> None:
+    await startup_db()
+    engine = get_db_session_manager().engine
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.drop_all)
+            await connection.run_sync(metadata.create_all)
+
+        print(f"\nInserting {rows} rows in batches of {batch}:")
+        for name, table in TABLES.items():
+            elapsed = await _insert(table, GENERATORS[name], rows, batch)
+            index_mb = await _index_size(table) / 1024 / 1024
+            print(f"{name:<6} {rows / elapsed:10.0f} rows/s  {elapsed:8.2f} s  pkey index {index_mb:8.1f} MB")
+        print()
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.drop_all)
+        await shutdown_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per variant")
+    parser.add_argument("--batch", type=int, default=1000, help="Rows per INSERT transaction")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch))
@@ -0,0 +1,103 @@
+"""
+Write latency benchmark - commit + refresh vs INSERT ... RETURNING
+
+Measures the per-write latency of creating a category the old way
+(add + commit + refresh, 3 round trips) and through CategoryRepositoryImpl.create
+(INSERT ... RETURNING + unit of work commit) against the configured database.
+
+Usage (from src/):
+    python -m benchmarks.write_latency --rows 2000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+from uuid import UUID
+
+from sqlalchemy import delete
+
+from di import container, request_context
+from domain.entity import CategoryEntity
+from infrastructure.persistence.db_session import get_db_session_manager, startup_db, shutdown_db
+from infrastructure.persistence.models import CategoryModel
+from infrastructure.persistence.repository import CategoryRepositoryImpl
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _category(i: int) -> CategoryEntity:
+    return CategoryEntity(
+        uuid=None,
+        name={"en": f"Benchmark {i}", "uz": f"Benchmark {i}", "ru": f"Бенчмарк {i}"},
+        description={"en": "write latency benchmark"},
+    )
+
+
+async def _measure(rows: int, write: Callable[[int], Awaitable[UUID]]) -> tuple[List[float], List[UUID]]:
+    latencies: List[float] = []
+    created: List[UUID] = []
+    for i in range(rows):
+        started = time.perf_counter()
+        created.append(await write(i))
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies, created
+
+
+def _report(title: str, latencies: List[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{title:<32} mean={statistics.mean(latencies):7.3f} ms  "
+        f"p50={quantiles[49]:7.3f} ms  p95={quantiles[94]:7.3f} ms  "
+        f"p99={quantiles[98]:7.3f} ms"
+    )
+
+
+async def main(rows: int) -> None:
+    await startup_db()
+    db_manager = get_db_session_manager()
+    created: List[UUID] = []
+
+    try:
+        async with request_context():
+            uow = container.get(SqlAlchemyUnitOfWork)
+            session = uow.session
+
+            async def legacy_write(i: int) -> UUID:
+                model = CategoryModel(name=_category(i).name, description=_category(i).description)
+                session.add(model)
+                await session.commit()
+                await session.refresh(model)
+                return model.uuid
+
+            repository = container.get(CategoryRepositoryImpl)
+
+            async def returning_write(i: int) -> UUID:
+                entity = await repository.create(_category(i))
+                await uow.commit()
+                assert entity is not None and entity.uuid is not None
+                return entity.uuid
+
+            # Warm up the pool and the statement caches
+            await _measure(min(rows, 50), legacy_write)
+            await _measure(min(rows, 50), returning_write)
+
+            before, legacy_ids = await _measure(rows, legacy_write)
+            after, returning_ids = await _measure(rows, returning_write)
+            created.extend(legacy_ids + returning_ids)
+
+        print(f"\nPer-write latency, {rows} rows each:")
+        _report("before: add + commit + refresh", before)
+        _report("after:  INSERT ... RETURNING", after)
+        print(f"speedup (mean): {statistics.mean(before) / statistics.mean(after):.2f}x\n")
+    finally:
+        async with db_manager.session() as session:
+            await session.execute(delete(CategoryModel).where(
+                CategoryModel.description["en"].as_string() == "write latency benchmark"
+            ))
+        await shutdown_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Writes per variant")
+    asyncio.run(main(parser.parse_args().rows))
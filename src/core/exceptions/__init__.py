@@ -5,3 +5,11 @@ from .base_exceptions import (
     InfrastructureException,
     BaseApplicationException,
 )
+
+__all__ = [
+    "ValidationException",
+    "ApplicationException",
+    "EntityNotFoundException",
+    "InfrastructureException",
+    "BaseApplicationException",
+]
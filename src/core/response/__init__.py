@@ -1,2 +1,7 @@
 from .response_code import ErrorCode
-from .api_response import ApiResponse
\ No newline at end of file
+from .api_response import ApiResponse
+
+__all__ = [
+    "ErrorCode",
+    "ApiResponse",
+]
@@ -25,7 +25,7 @@ class ApiResponse(BaseModel, Generic[T]):
         message: str,
         error_code: int = None,
         error_details: dict = None
-    ) -> "ApiResponse[None]":
+    ) -> "ApiResponse[Any]":
         return cls(
             success=False,
             message=message,
@@ -43,6 +43,65 @@ class Settings(BaseSettings):
     DATABASE_URL: str = (
         f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
+    # Connection pool (per engine - primary and every replica)
+    DB_POOL_SIZE: int = env.int("DB_POOL_SIZE", 20)
+    DB_MAX_OVERFLOW: int = env.int("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = env.float("DB_POOL_TIMEOUT", 30.0)
+    DB_POOL_RECYCLE: int = env.int("DB_POOL_RECYCLE", 3600)
+    DB_POOL_PRE_PING: bool = env.bool("DB_POOL_PRE_PING", True)
+
+    # N+1 detection - one request repeating a statement shape more than N times
+    # is logged as a warning; strict mode raises instead (enabled in tests)
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = env.int("SQL_REPEATED_STATEMENT_THRESHOLD", 10)
+    SQL_REPEATED_STATEMENT_STRICT: bool = env.bool("SQL_REPEATED_STATEMENT_STRICT", False)
+    # A request slower than this is logged as a warning with its N slowest statements
+    SLOW_REQUEST_MS: float = env.float("SLOW_REQUEST_MS", 1000.0)
+    SLOW_REQUEST_TOP_QUERIES: int = env.int("SLOW_REQUEST_TOP_QUERIES", 10)
+
+    # Locales of the localized (JSONB) fields, `?lang=` / Accept-Language pick one of them
+    LANGUAGES: list[str] = env.list("LANGUAGES", ["en", "ru", "uz"])
+
+    # Rows fetched per round trip by streaming (server-side cursor) queries
+    DB_STREAM_FETCH_SIZE: int = env.int("DB_STREAM_FETCH_SIZE", 1000)
+
+    # Repository read-through cache (categories, tags) - memory | redis | none
+    CACHE_BACKEND: str = env.str("CACHE_BACKEND", "memory")
+    CACHE_TTL: float = env.float("CACHE_TTL", 300.0)
+    CACHE_MAXSIZE: int = env.int("CACHE_MAXSIZE", 10_000)
+    # XFetch early refresh aggressiveness - 1.0 is optimal for most loads, 0 disables it
+    CACHE_XFETCH_BETA: float = env.float("CACHE_XFETCH_BETA", 1.0)
+    REDIS_URL: str = env.str("REDIS_URL", "redis://localhost:6379/0")
+    # Writes NOTIFY this channel; every worker LISTENs and evicts its in-process (memory) cache
+    CACHE_INVALIDATION_CHANNEL: str = env.str("CACHE_INVALIDATION_CHANNEL", "cache_invalidation")
+    CACHE_INVALIDATION_LISTEN: bool = env.bool("CACHE_INVALIDATION_LISTEN", True)
+
+    # HTTP caching of catalogue reads (categories, tags) - with max-age 0 clients revalidate
+    # with If-None-Match on every use; shared max-age lets a CDN keep the response
+    HTTP_CACHE_MAX_AGE: int = env.int("HTTP_CACHE_MAX_AGE", 0)
+    HTTP_CACHE_SHARED_MAX_AGE: int = env.int("HTTP_CACHE_SHARED_MAX_AGE", 0)
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = env.int("HTTP_CACHE_STALE_WHILE_REVALIDATE", 0)
+
+    # gzip of text responses - smaller bodies go as they are; level 1 (fast) .. 9 (small), 0 - off.
+    # Exports are large and streamed - a cheaper level keeps up with the cursor
+    COMPRESSION_MIN_SIZE: int = env.int("COMPRESSION_MIN_SIZE", 1024)
+    COMPRESSION_LEVEL: int = env.int("COMPRESSION_LEVEL", 6)
+    COMPRESSION_EXPORT_LEVEL: int = env.int("COMPRESSION_EXPORT_LEVEL", 1)
+
+    # Catalogue import - rows validated and COPYed per chunk, errors listed in the report
+    IMPORT_CHUNK_SIZE: int = env.int("IMPORT_CHUNK_SIZE", 5000)
+    IMPORT_MAX_ERRORS: int = env.int("IMPORT_MAX_ERRORS", 1000)
+
+    # Autocomplete - suggestions per source and the in-process cache of frequent prefixes
+    AUTOCOMPLETE_LIMIT: int = env.int("AUTOCOMPLETE_LIMIT", 5)
+    AUTOCOMPLETE_CACHE_SIZE: int = env.int("AUTOCOMPLETE_CACHE_SIZE", 2048)
+    AUTOCOMPLETE_CACHE_TTL: float = env.float("AUTOCOMPLETE_CACHE_TTL", 30.0)
+
+    # Comma separated read replica URLs (postgresql+asyncpg://...), empty - primary only
+    DATABASE_REPLICA_URLS: str = env.str("DATABASE_REPLICA_URLS", "")
+
+    @property
+    def database_replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
 
     @property
     def db_url(self) -> str:
@@ -1,8 +1,19 @@
 import injector
 from .repository_module import RepositoryModule
+from .usecase_module import UseCaseModule
+from .request_scope import request_scope, request_context
 
 container = injector.Injector(
     [
         RepositoryModule(),
+        UseCaseModule(),
     ]
-)
\ No newline at end of file
+)
+
+__all__ = [
+    "RepositoryModule",
+    "UseCaseModule",
+    "request_scope",
+    "request_context",
+    "container",
+]
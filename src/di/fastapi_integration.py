@@ -0,0 +1,24 @@
+from typing import Any, Type, TypeVar
+
+from fastapi import Depends
+
+from di import container
+
+T = TypeVar("T")
+
+
+def resolve(interface: Type[T]) -> Any:
+    """
+    FastAPI dependency resolving `interface` from the DI container
+
+    Request scoped bindings (use cases, repositories, unit of work) are created
+    once per request, inside the scope opened by request_scope_middleware.
+
+    Usage:
+        async def list_categories(use_case: CategoryUseCase = resolve(CategoryUseCase)): ...
+    """
+    # async - resolves on the event loop, inside the request's context
+    async def dependency() -> T:
+        return container.get(interface)
+
+    return Depends(dependency)
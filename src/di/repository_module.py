@@ -1,27 +1,36 @@
 from injector import Module, singleton, Binder, provider
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.repository import (
     TagRepository,
     UserRepository,
     CategoryRepository,
+    ProductRepository,
     UploadFileRepository,
     UserProfileRepository,
+    UnitOfWork,
+    AutocompleteRepository,
+    CatalogImportRepository,
 )
 from domain.services.security import (
     TokenService,
 )
+from infrastructure.cache import CacheBackend, get_cache_backend
 from infrastructure.persistence.db_session import DatabaseSessionManager, get_db_session_manager
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from infrastructure.persistence.repository import (
-    TagRepositoryImpl,
+    CachedTagRepositoryImpl,
     UserRepositoryImpl,
-    CategoryRepositoryImpl,
+    CachedCategoryRepositoryImpl,
+    ProductRepositoryImpl,
     UploadFileRepositoryImpl,
     UserProfileRepositoryImpl,
+    AutocompleteRepositoryImpl,
+    CatalogImportRepositoryImpl,
 )
 from infrastructure.security import (
     JwtToken
 )
+from .request_scope import request_scope
 
 
 class RepositoryModule(Module):
@@ -36,27 +45,35 @@ class RepositoryModule(Module):
         return get_db_session_manager()
 
     @provider
-    def provide_async_session(self, db_manager: DatabaseSessionManager) -> AsyncSession:
-        """
-        Har bir request uchun yangi session yaratadi
+    @singleton
+    def provide_cache_backend(self) -> CacheBackend:
+        """Repository cache - process-wide, picked by CACHE_BACKEND"""
+        return get_cache_backend()
 
-        IMPORTANT: Bu singleton EMAS! Har safar yangi session instance qaytaradi.
-        Bu session FastAPI dependency injection orqali har bir request uchun
-        alohida yaratiladi va avtomatik yopiladi.
-        """
-        return db_manager.session_factory()
+    @provider
+    @request_scope
+    def provide_unit_of_work(self, uow: SqlAlchemyUnitOfWork) -> UnitOfWork:
+        """Use cases see the same unit of work as the repositories of the request"""
+        return uow
 
     def configure(self, binder: Binder) -> None:
         # Services - singleton (stateless)
-        binder.bind(TokenService, to=JwtToken, scope=singleton)
+        binder.bind(TokenService, to=JwtToken, scope=singleton)  # type: ignore[type-abstract]
+
+        # Unit of work - bitta session har request uchun, birinchi query da ochiladi
+        binder.bind(SqlAlchemyUnitOfWork, scope=request_scope)
 
         # IMPORTANT: Repositories MUST NOT be singleton!
-        # Har bir request uchun yangi repository instance yaratiladi
-        # Repository ichida session inject qilinadi, va session har request uchun yangi
+        # Har bir request uchun yangi repository instance yaratiladi (request_scope)
+        # Repository session ni request ning unit of work idan oladi
         # Agar singleton qilsak - bir session barcha request larda ishlatiladi (MEMORY LEAK!)
+        # (type-abstract: mypy abstract interface ni bind qilishni tushunmaydi - injector uchun to'g'ri)
 
-        binder.bind(UserProfileRepository, to=UserProfileRepositoryImpl)  # NO SINGLETON!
-        binder.bind(UserRepository, to=UserRepositoryImpl)  # NO SINGLETON!
-        binder.bind(CategoryRepository, to=CategoryRepositoryImpl)  # NO SINGLETON!
-        binder.bind(TagRepository, to=TagRepositoryImpl)  # NO SINGLETON!
-        binder.bind(UploadFileRepository, to=UploadFileRepositoryImpl)  # NO SINGLETON!
+        binder.bind(UserProfileRepository, to=UserProfileRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(UserRepository, to=UserRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(CategoryRepository, to=CachedCategoryRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(TagRepository, to=CachedTagRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(ProductRepository, to=ProductRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(UploadFileRepository, to=UploadFileRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(AutocompleteRepository, to=AutocompleteRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
+        binder.bind(CatalogImportRepository, to=CatalogImportRepositoryImpl, scope=request_scope)  # type: ignore[type-abstract]
@@ -0,0 +1,89 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Optional, Type, TypeVar
+
+from injector import InstanceProvider, Provider, Scope, ScopeDecorator
+
+from core.exceptions import InfrastructureException
+from core.response import ErrorCode
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+T = TypeVar("T")
+
+
+class RequestContext:
+    """Instances created by RequestScope during one request"""
+
+    def __init__(self) -> None:
+        self.instances: dict[Any, Any] = {}
+
+    def get_created(self, key: Type[T]) -> Optional[T]:
+        """Instance of `key` if the request already created it - never creates one"""
+        return self.instances.get(key)
+
+    async def commit(self) -> None:
+        if uow := self.get_created(SqlAlchemyUnitOfWork):
+            await uow.commit()
+
+    async def rollback(self) -> None:
+        if uow := self.get_created(SqlAlchemyUnitOfWork):
+            await uow.rollback()
+
+    async def close(self) -> None:
+        if uow := self.get_created(SqlAlchemyUnitOfWork):
+            await uow.close()
+        self.instances.clear()
+
+
+_current_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+class RequestScope(Scope):
+    """
+    A Scope that returns one instance per request (per `request_context()` block)
+
+    IMPORTANT: Request scoped objects can't be resolved outside request_context() -
+    a singleton holding them would share one session between all requests.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        context = _current_context.get()
+        if context is None:
+            raise InfrastructureException(
+                f"{getattr(key, '__name__', key)} is request scoped - resolve it inside request_context()",
+                ErrorCode.CONFIGURATION_ERROR,
+            )
+        try:
+            return InstanceProvider(context.instances[key])
+        except KeyError:
+            instance = provider.get(self.injector)
+            context.instances[key] = instance
+            return InstanceProvider(instance)
+
+
+request_scope = ScopeDecorator(RequestScope)
+
+
+@asynccontextmanager
+async def request_context() -> AsyncGenerator[RequestContext, None]:
+    """
+    Open a request scope
+
+    The unit of work, if any repository used it, commits once on success,
+    rolls back on error and always returns its connection to the pool.
+
+    Usage:
+        async with request_context():
+            await container.get(CategoryRepository).create(...)
+    """
+    context = RequestContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+        await context.commit()
+    except BaseException:
+        await context.rollback()
+        raise
+    finally:
+        await context.close()
+        _current_context.reset(token)
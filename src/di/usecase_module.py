@@ -0,0 +1,29 @@
+from injector import Module, Binder
+
+from application.usecases import (
+    SignInUseCase,
+    SignUpUseCase,
+    CategoryUseCase,
+    ProductUseCase,
+    UserProfileUseCase,
+    AutocompleteUseCase,
+    CatalogImportUseCase,
+)
+from application.usecases.tag_usecase import TagUseCase
+from .request_scope import request_scope
+
+
+class UseCaseModule(Module):
+    def configure(self, binder: Binder) -> None:
+        # IMPORTANT: Use case lar repository larni ushlab turadi - singleton bo'lsa
+        # birinchi request ning session i keyingi barcha request larga o'tib ketadi.
+        # Shuning uchun har request uchun yangi instance (request_scope).
+
+        binder.bind(SignInUseCase, scope=request_scope)
+        binder.bind(SignUpUseCase, scope=request_scope)
+        binder.bind(CategoryUseCase, scope=request_scope)
+        binder.bind(TagUseCase, scope=request_scope)
+        binder.bind(ProductUseCase, scope=request_scope)
+        binder.bind(UserProfileUseCase, scope=request_scope)
+        binder.bind(AutocompleteUseCase, scope=request_scope)
+        binder.bind(CatalogImportUseCase, scope=request_scope)
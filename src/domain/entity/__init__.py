@@ -7,4 +7,6 @@ from .project_image_entity import *
 from .product_list_entity import *
 from .product_create_entity import *
 from .product_detail_entity import *
-from .upload_file_entity import *
\ No newline at end of file
+from .upload_file_entity import *
+from .suggestion_entity import *
+from .catalog_import_entity import *
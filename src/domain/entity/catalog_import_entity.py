@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class ImportRowEntity:
+    """One validated product row of a catalogue feed"""
+    line: int  # line of the source file - for error reports
+    uuid: UUID
+    name: dict[str, str]
+    description: dict[str, str]
+    price: float
+    stock: int
+    category: dict[str, str]  # localized name - matched by the default locale
+    tags: List[dict[str, str]]  # localized names - matched by the default locale
+
+
+@dataclass(slots=True)
+class ImportErrorEntity:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportResultEntity:
+    created: int = 0
+    updated: int = 0
+    errors: List[ImportErrorEntity] = field(default_factory=list)
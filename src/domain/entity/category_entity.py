@@ -5,11 +5,12 @@ from uuid import UUID
 from application.dto import CategoryDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryEntity:
     uuid: UUID | None
-    name: dict[str, str]
-    description: dict[str, str] | None
+    # One locale (str) in localized lists
+    name: dict[str, str] | str
+    description: dict[str, str] | str | None
 
     def to_dto(self) -> CategoryDTO:
         return CategoryDTO(
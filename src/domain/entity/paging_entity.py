@@ -1,15 +1,33 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 
 T = TypeVar('T')
 
 
 class PagingEntity(Generic[T]):
-    def __init__(self, page: int, size: int, total: int, items: List[T]):
+    def __init__(
+            self,
+            page: Optional[int],
+            size: int,
+            total: int,
+            items: List[T],
+            next_cursor: Optional[str] = None,
+            total_estimated: bool = False,
+    ):
         self.page = page
         self.size = size
         self.total = total
         self.items = items
+        self.next_cursor = next_cursor
+        self.total_estimated = total_estimated
 
     @classmethod
-    def new(cls, page: int, size: int, total: int, items: List[T]) -> 'PagingEntity[T]':
-        return cls(page, size, total, items)
+    def new(
+            cls,
+            page: Optional[int],
+            size: int,
+            total: int,
+            items: List[T],
+            next_cursor: Optional[str] = None,
+            total_estimated: bool = False,
+    ) -> 'PagingEntity[T]':
+        return cls(page, size, total, items, next_cursor, total_estimated)
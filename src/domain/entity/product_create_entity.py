@@ -11,4 +11,4 @@ class ProductCreateEntity:
     stock: int
     category_id: UUID
     tags: List[UUID]
-    images: List[str]
+    images: List[UUID]  # upload_files uuid lari
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductEntity:
     uuid: UUID
-    name: dict[str, str]
-    category_name: str
+    # One locale (str) in localized lists
+    name: dict[str, str] | str
+    category_name: dict[str, str] | str
     price: float
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class SuggestionEntity:
+    kind: str  # "category" | "tag" | "product"
+    uuid: UUID
+    name: str
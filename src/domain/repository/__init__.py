@@ -3,3 +3,19 @@ from .user_profile_repository import UserProfileRepository
 from .category_repository import CategoryRepository
 from .upload_file_repository import UploadFileRepository
 from .tag_repository import TagRepository
+from .product_repository import ProductRepository
+from .unit_of_work import UnitOfWork
+from .autocomplete_repository import AutocompleteRepository
+from .catalog_import_repository import CatalogImportRepository
+
+__all__ = [
+    "UserRepository",
+    "UserProfileRepository",
+    "CategoryRepository",
+    "UploadFileRepository",
+    "TagRepository",
+    "ProductRepository",
+    "UnitOfWork",
+    "AutocompleteRepository",
+    "CatalogImportRepository",
+]
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from domain import entity
+
+
+class AutocompleteRepository(ABC):
+    @abstractmethod
+    async def suggest(self, term: str, lang: str, limit: int = 5) -> List[entity.SuggestionEntity]:
+        """Up to `limit` category, tag and product names each matching `term` in `lang`"""
+        ...
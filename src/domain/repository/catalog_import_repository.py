@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from domain import entity
+
+
+class CatalogImportRepository(ABC):
+    """
+    Bulk catalogue import - rows are staged chunk by chunk, then merged at once
+
+    IMPORTANT: stage() and merge() of one import must run in one transaction
+    (`UnitOfWork.transaction()`) - the staged rows live only until it ends.
+    """
+
+    @abstractmethod
+    async def stage(self, rows: Sequence[entity.ImportRowEntity]) -> None:
+        """Add validated rows to the import"""
+        ...
+
+    @abstractmethod
+    async def merge(self) -> entity.ImportResultEntity:
+        """
+        Merge every staged row into categories, tags, products and product_tag
+
+        Products are upserted by uuid, categories and tags are matched by
+        their default locale name and created when missing.
+        """
+        ...
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Sequence
 from uuid import UUID
 
 from domain.entity.category_entity import CategoryEntity
@@ -12,9 +13,52 @@ class CategoryRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, skip: int = 1, limit: int = 10) -> PagingEntity[CategoryEntity]:
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+            lang: Optional[str] = None,
+    ) -> PagingEntity[CategoryEntity]:
+        pass
+
+    @abstractmethod
+    async def search(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> PagingEntity[CategoryEntity]:
+        pass
+
+    @abstractmethod
+    def stream(self, fetch_size: int = 1000) -> AsyncIterator[CategoryEntity]:
         pass
 
     @abstractmethod
     async def get_by_uuid(self, uuid: UUID) -> Optional[CategoryEntity]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_many_by_uuid(self, uuids: Sequence[UUID]) -> List[CategoryEntity]:
+        pass
+
+    @abstractmethod
+    async def version(self, uuid: Optional[UUID] = None) -> Optional[str]:
+        """Change marker of one category or of every list page - None if missing or not cheap to get"""
+        pass
+
+    @abstractmethod
+    async def create_many(self, data: Sequence[CategoryEntity]) -> List[CategoryEntity]:
+        pass
+
+    @abstractmethod
+    async def upsert_many(self, data: Sequence[CategoryEntity]) -> List[CategoryEntity]:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, uuids: Sequence[UUID]) -> int:
+        pass
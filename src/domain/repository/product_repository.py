@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from domain import entity
@@ -6,13 +8,33 @@ from domain import entity
 
 class ProductRepository(ABC):
     @abstractmethod
-    async def create(self, product: entity.ProductCreateEntity) -> int: ...
+    async def create(self, product: entity.ProductCreateEntity) -> UUID: ...
 
     @abstractmethod
-    async def get_by_id(self, product_id: UUID) -> entity.ProductDetailEntity: ...
+    async def get_by_id(self, product_id: UUID) -> Optional[entity.ProductDetailEntity]: ...
 
     @abstractmethod
-    async def list(self) -> entity.PagingEntity[entity.ProductEntity]: ...
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+            lang: Optional[str] = None,
+    ) -> entity.PagingEntity[entity.ProductEntity]: ...
 
     @abstractmethod
-    async def update(self, product_id: UUID, product: entity.ProductCreateEntity) -> int: ...
+    def stream(self, fetch_size: int = 1000) -> AsyncIterator[entity.ProductEntity]: ...
+
+    @abstractmethod
+    async def search(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> entity.PagingEntity[entity.ProductEntity]: ...
+
+    @abstractmethod
+    async def update(self, product_id: UUID, product: entity.ProductCreateEntity) -> UUID: ...
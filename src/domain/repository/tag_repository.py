@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Sequence
 from uuid import UUID
 
 from domain import entity
@@ -13,7 +14,33 @@ class TagRepository(ABC):
     async def get_by_uuid(self, tag_id: UUID) -> Optional[entity.TagEntity]: ...
 
     @abstractmethod
-    async def list(self, skip: int = 1, limit: int = 10) -> entity.PagingEntity[entity.TagEntity]: ...
+    async def get_many_by_uuid(self, tag_ids: Sequence[UUID]) -> List[entity.TagEntity]: ...
+
+    @abstractmethod
+    async def version(self, tag_id: Optional[UUID] = None) -> Optional[str]:
+        """Change marker of one tag or of every list page - None if missing or not cheap to get"""
+
+    @abstractmethod
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> entity.PagingEntity[entity.TagEntity]: ...
+
+    @abstractmethod
+    def stream(self, fetch_size: int = 1000) -> AsyncIterator[entity.TagEntity]: ...
 
     @abstractmethod
     async def update(self, tag_id: UUID, tag: entity.TagEntity) -> UUID: ...
+
+    @abstractmethod
+    async def create_many(self, tags: Sequence[entity.TagEntity]) -> List[entity.TagEntity]: ...
+
+    @abstractmethod
+    async def upsert_many(self, tags: Sequence[entity.TagEntity]) -> List[entity.TagEntity]: ...
+
+    @abstractmethod
+    async def delete_many(self, tag_ids: Sequence[UUID]) -> int: ...
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager
+
+
+class UnitOfWork(ABC):
+    """Transaction boundary shared by all repositories of one request"""
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        """Group several repository calls - all of them commit or none"""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
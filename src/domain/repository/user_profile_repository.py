@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from domain.entity import UserProfileEntity
@@ -10,3 +10,11 @@ class UserProfileRepository(ABC):
     @abstractmethod
     async def get_by_uuid(self, uuid: UUID) -> Optional[UserProfileEntity]:
         pass
+
+    @abstractmethod
+    async def is_superuser(self, uuid: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    def stream(self, fetch_size: int = 1000) -> AsyncIterator[UserProfileEntity]:
+        pass
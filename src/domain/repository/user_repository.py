@@ -30,6 +30,11 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, skip: int = 0, limit: int = 10) -> PagingEntity[UserEntity]:
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+    ) -> PagingEntity[UserEntity]:
         pass
 
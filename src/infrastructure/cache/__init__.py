@@ -0,0 +1,25 @@
+from .backend import *
+from .entry import CacheEntry, content_version
+from .memory_backend import MemoryCacheBackend
+from .redis_backend import RedisCacheBackend
+from .invalidation import entity_key, version_key, evict, notify_invalidation
+from .invalidation_listener import CacheInvalidationListener
+from .cache_manager import get_cache_backend, startup_cache, shutdown_cache
+
+__all__ = [
+    "CacheStats",
+    "CacheBackend",
+    "NullCacheBackend",
+    "CacheEntry",
+    "content_version",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "entity_key",
+    "version_key",
+    "evict",
+    "notify_invalidation",
+    "CacheInvalidationListener",
+    "get_cache_backend",
+    "startup_cache",
+    "shutdown_cache",
+]
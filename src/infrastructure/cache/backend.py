@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Optional
+
+
+class CacheStats:
+    """Hit / miss / invalidation counters of one cache backend, per namespace (table)"""
+
+    def __init__(self) -> None:
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.invalidations: Counter[str] = Counter()
+        self.early_refreshes: Counter[str] = Counter()
+        self.errors = 0
+
+    def hit(self, namespace: str) -> None:
+        self.hits[namespace] += 1
+
+    def miss(self, namespace: str) -> None:
+        self.misses[namespace] += 1
+
+    def invalidation(self, namespace: str) -> None:
+        self.invalidations[namespace] += 1
+
+    def early_refresh(self, namespace: str) -> None:
+        self.early_refreshes[namespace] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counters and hit ratio per namespace, JSON serializable"""
+        namespaces = sorted(set(self.hits) | set(self.misses) | set(self.invalidations))
+        return {
+            "errors": self.errors,
+            "namespaces": {
+                namespace: {
+                    "hits": self.hits[namespace],
+                    "misses": self.misses[namespace],
+                    "invalidations": self.invalidations[namespace],
+                    "early_refreshes": self.early_refreshes[namespace],
+                    "hit_ratio": (
+                        self.hits[namespace] / (self.hits[namespace] + self.misses[namespace])
+                        if self.hits[namespace] + self.misses[namespace] else 0.0
+                    ),
+                }
+                for namespace in namespaces
+            },
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store behind the repository cache (CachedRepositoryMixin)
+
+    Values are entities / pages of entities; `ttl` in seconds, None - no expiry
+    (the backend may still evict the entry).
+
+    IMPORTANT: A broken cache must not break reads - backends report their
+    own errors as a miss (`stats.errors`), never raise from get/set/delete.
+    """
+
+    name: str = "cache"
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        """Release connections - application shutdown"""
+        pass
+
+
+class NullCacheBackend(CacheBackend):
+    """Caching disabled (CACHE_BACKEND=none) - every read is a miss"""
+
+    name = "none"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
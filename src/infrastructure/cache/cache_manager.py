@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+from core.exceptions import InfrastructureException
+from core.response import ErrorCode
+from core.settings import settings
+from .backend import CacheBackend, NullCacheBackend
+from .invalidation_listener import start_cache_listener, stop_cache_listener
+from .memory_backend import MemoryCacheBackend
+from .redis_backend import RedisCacheBackend
+
+
+@lru_cache()
+def get_cache_backend() -> CacheBackend:
+    """
+    Process-wide repository cache backend, picked by CACHE_BACKEND
+
+    memory - in-process LRU + TTL (default), redis - shared (REDIS_URL),
+    none - caching disabled.
+    """
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(maxsize=settings.CACHE_MAXSIZE, ttl=settings.CACHE_TTL)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(url=settings.REDIS_URL)
+    if settings.CACHE_BACKEND == "none":
+        return NullCacheBackend()
+    raise InfrastructureException(
+        f"Unknown CACHE_BACKEND '{settings.CACHE_BACKEND}', expected memory, redis or none",
+        ErrorCode.CONFIGURATION_ERROR,
+    )
+
+
+async def startup_cache() -> None:
+    """Application startup - cross-node invalidation listener of the in-process cache"""
+    await start_cache_listener(get_cache_backend())
+
+
+async def shutdown_cache() -> None:
+    """Application shutdown - stops the listener, closes the Redis connection pool, if any"""
+    await stop_cache_listener()
+    if get_cache_backend.cache_info().currsize:
+        await get_cache_backend().close()
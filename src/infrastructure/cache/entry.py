@@ -0,0 +1,45 @@
+import hashlib
+import math
+import pickle
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """
+    Cached value with what XFetch needs to refresh it early
+
+    delta - seconds it took to compute the value, expires_at - wall clock
+    (time.time(), same on every node for a shared backend), version - hash
+    of the value (`content_version`, HTTP ETags), computed once per load.
+    """
+    value: Any
+    delta: float
+    expires_at: float
+    version: str = ""
+
+    def refresh_due(
+            self,
+            beta: float,
+            now: Optional[float] = None,
+            rand: Callable[[], float] = random.random,
+    ) -> bool:
+        """
+        XFetch - probabilistic early expiration (Vattani et al.)
+
+        True with a probability growing as expiry approaches, faster for
+        values that are slow to compute: `now - delta * beta * ln(rand) >= expires_at`.
+        One reader refreshes ahead of time while the rest keep getting the
+        cached value - expiry never sends every reader to the database at once.
+        beta > 1 refreshes earlier, 0 disables early refresh.
+        """
+        now = time.time() if now is None else now
+        return now - self.delta * beta * math.log(rand() or 1e-300) >= self.expires_at
+
+
+def content_version(value: Any) -> str:
+    """Hash of a value - equal values give the same version on every node"""
+    return hashlib.blake2b(pickle.dumps(value), digest_size=16).hexdigest()
@@ -0,0 +1,46 @@
+import json
+from typing import Any, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import settings
+from .backend import CacheBackend
+
+# NOTIFY payloads must stay under 8000 bytes - 100 uuids are ~4 KB
+NOTIFY_KEYS_PER_PAYLOAD = 100
+
+
+def entity_key(namespace: str, entity_id: Any) -> str:
+    return f"{namespace}:uuid:{entity_id}"
+
+
+def version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+async def evict(backend: CacheBackend, namespace: str, entity_ids: Sequence[Any] = ()) -> None:
+    """Drop the cached entities and every cached page (the version token) of `namespace`"""
+    await backend.delete(version_key(namespace), *(entity_key(namespace, entity_id) for entity_id in entity_ids))
+    backend.stats.invalidation(namespace)
+
+
+def notification_payloads(namespace: str, entity_ids: Sequence[Any] = ()) -> list[str]:
+    """`{"table": ..., "keys": [...]}` JSON payloads, the keys split to fit NOTIFY's size limit"""
+    keys = [str(entity_id) for entity_id in entity_ids]
+    chunks = [keys[i:i + NOTIFY_KEYS_PER_PAYLOAD] for i in range(0, len(keys), NOTIFY_KEYS_PER_PAYLOAD)] or [[]]
+    return [json.dumps({"table": namespace, "keys": chunk}) for chunk in chunks]
+
+
+async def notify_invalidation(session: AsyncSession, namespace: str, entity_ids: Sequence[Any] = ()) -> None:
+    """
+    Tell every node to evict - `pg_notify` in the writer's transaction
+
+    NOTIFY is transactional: listeners get it only when the transaction
+    commits, and never on rollback.
+    """
+    for payload in notification_payloads(namespace, entity_ids):
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.CACHE_INVALIDATION_CHANNEL, "payload": payload},
+        )
@@ -0,0 +1,115 @@
+import asyncio
+import json
+from typing import Any, Optional
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy.engine import make_url
+
+from core.settings import settings
+from utils.logger import logger
+from .backend import CacheBackend
+from .invalidation import evict
+
+
+class CacheInvalidationListener:
+    """
+    LISTEN on a dedicated asyncpg connection, evict the local cache on NOTIFY
+
+    Every worker runs one (started from the app lifespan). Writers on any
+    node `pg_notify` the table and keys in their transaction
+    (notify_invalidation), so a commit anywhere evicts the in-process cache
+    everywhere within milliseconds - no broker besides Postgres.
+
+    The connection is outside the pool and is re-opened when it drops.
+    Notifications sent while it was down are lost, so the whole local cache
+    is cleared on every reconnect.
+    """
+
+    def __init__(self, backend: CacheBackend, dsn: str, channel: str, reconnect_delay: float = 1.0):
+        self.backend = backend
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.received = 0
+        self._connection: Optional[asyncpg.Connection] = None
+        self._supervisor: Optional[asyncio.Task[None]] = None
+        self._lost = asyncio.Event()
+        self._pending: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        """Connect and LISTEN - the first connection must succeed"""
+        await self._connect()
+        self._supervisor = asyncio.create_task(self._reconnect_forever())
+
+    async def stop(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def _connect(self) -> None:
+        self._lost.clear()
+        self._connection = await asyncpg.connect(self.dsn)
+        self._connection.add_termination_listener(lambda _connection: self._lost.set())
+        await self._connection.add_listener(self.channel, self._on_notification)
+
+    async def _reconnect_forever(self) -> None:
+        while True:
+            await self._lost.wait()
+            logger.warning("cache_listener_disconnected", channel=self.channel)
+            while True:
+                await asyncio.sleep(self.reconnect_delay)
+                try:
+                    await self._connect()
+                    break
+                except Exception as e:
+                    logger.warning("cache_listener_reconnect_failed", channel=self.channel, error=str(e))
+            await self.backend.clear()
+            logger.info("cache_listener_reconnected", channel=self.channel)
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        # asyncpg callbacks are sync - evict in a task, keep a reference until it is done
+        task = asyncio.create_task(self.handle(payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def handle(self, payload: str) -> None:
+        """Evict what one notification names - malformed payloads are logged and ignored"""
+        self.received += 1
+        try:
+            message = json.loads(payload)
+            await evict(self.backend, message["table"], message.get("keys") or ())
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("cache_listener_bad_payload", payload=payload, error=str(e))
+
+
+_listener: Optional[CacheInvalidationListener] = None
+
+
+async def start_cache_listener(backend: CacheBackend) -> None:
+    """
+    Application startup - LISTEN for invalidations of the in-process cache
+
+    Only the memory backend needs it: a shared (Redis) cache is already
+    invalidated by the writer itself.
+    """
+    global _listener
+    if _listener is not None or not settings.CACHE_INVALIDATION_LISTEN or backend.name != "memory":
+        return
+    dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+    listener = CacheInvalidationListener(backend, dsn, settings.CACHE_INVALIDATION_CHANNEL)
+    await listener.start()
+    _listener = listener
+
+
+async def stop_cache_listener() -> None:
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
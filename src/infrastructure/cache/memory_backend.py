@@ -0,0 +1,34 @@
+import math
+from typing import Any, Optional
+
+from utils.cache import TTLCache
+from .backend import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU + TTL cache - no network hop, no serialization
+
+    IMPORTANT: Har bir worker ning o'z nusxasi bor - boshqa worker dagi
+    yozuv bu cache ni tozalamaydi (TTL gacha eskirgan bo'lishi mumkin).
+    Cached objects are shared by every reader - treat them as read-only.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__()
+        self._items: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._items.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self._items.set(key, value, ttl=math.inf if ttl is None else ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._items.delete(key)
+
+    async def clear(self) -> None:
+        self._items.clear()
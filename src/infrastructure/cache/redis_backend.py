@@ -0,0 +1,79 @@
+import pickle
+from typing import Any, Optional
+
+from core.exceptions import InfrastructureException
+from core.response import ErrorCode
+from utils.logger import logger
+from .backend import CacheBackend
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared cache - every worker and every node sees the same entries
+
+    Values are pickled (entities are plain dataclasses). Any Redis error is
+    logged and treated as a miss - the database still answers.
+
+    Usage:
+        RedisCacheBackend(url="redis://localhost:6379/0")
+        RedisCacheBackend(client=fake_redis)  # anything with async get/set/delete/scan_iter
+    """
+
+    name = "redis"
+
+    def __init__(self, url: Optional[str] = None, client: Any = None, prefix: str = "cache:"):
+        super().__init__()
+        if client is None:
+            try:
+                from redis import asyncio as redis
+            except ImportError as e:
+                raise InfrastructureException(
+                    "CACHE_BACKEND=redis needs the 'redis' package",
+                    ErrorCode.CONFIGURATION_ERROR,
+                    cause=e
+                )
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            data = await self.client.get(self.prefix + key)
+            return None if data is None else pickle.loads(data)
+        except Exception as e:
+            self._failed("get", e)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        try:
+            await self.client.set(
+                self.prefix + key,
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                px=None if ttl is None else int(ttl * 1000),
+            )
+        except Exception as e:
+            self._failed("set", e)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            self._failed("delete", e)
+
+    async def clear(self) -> None:
+        """Every key under `prefix` - SCAN, not KEYS, so Redis isn't blocked"""
+        try:
+            keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+            if keys:
+                await self.client.delete(*keys)
+        except Exception as e:
+            self._failed("clear", e)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        self.stats.errors += 1
+        logger.warning("cache_error", backend=self.name, operation=operation, error=str(error))
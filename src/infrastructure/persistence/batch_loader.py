@@ -0,0 +1,72 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, List, Mapping, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader style batching of single-key lookups
+
+    Every `load(key)` made in the same event-loop tick is collected and resolved
+    by one `batch_fn(keys)` call, e.g. `asyncio.gather(*(load(i) for i in ids))`
+    becomes a single `WHERE uuid = ANY(:ids)` query instead of N queries.
+    Results are memoized for the loader's lifetime (one request) - call `clear()`
+    after writes.
+
+    IMPORTANT: One AsyncSession can't run queries concurrently - batching also
+    makes gather() over repository lookups safe.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[Mapping[K, V]]]):
+        self._batch_fn = batch_fn
+        self._futures: dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._queue: List[K] = []
+        self._tasks: set["asyncio.Task[None]"] = set()
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        """Value of `key` (None if missing), fetched with the rest of this tick's keys"""
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            # Dispatch after the other tasks scheduled in this tick had their turn
+            loop.call_soon(self._start_dispatch)
+        return future
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self) -> None:
+        """Forget memoized values - pending lookups still complete"""
+        self._futures = {key: future for key, future in self._futures.items() if not future.done()}
+
+    def _start_dispatch(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._dispatch())
+        # The loop keeps only weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        futures = [self._futures[key] for key in keys]
+        try:
+            values = await self._batch_fn(keys)
+        except Exception as e:
+            for key, future in zip(keys, futures):
+                # Failed lookups are retried on the next load
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in zip(keys, futures):
+            if not future.done():
+                future.set_result(values.get(key))
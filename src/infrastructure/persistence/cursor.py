@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID
+
+from core.exceptions import ValidationException
+
+_DECODERS: dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    UUID: UUID,
+    float: float,
+    int: int,
+    str: str,
+}
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode keyset values (e.g. created_at, uuid) into an opaque cursor
+
+    IMPORTANT: Clients must treat the cursor as opaque - the format may change.
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """
+    Decode a cursor back into keyset values of the given types
+
+    Raises:
+        ValidationException: cursor is malformed or was issued for another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(_DECODERS[value_type](value) for value_type, value in zip(types, values))
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValidationException("cursor", "Invalid pagination cursor")
@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Sequence
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -11,6 +11,9 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from core.settings import settings
+from infrastructure.persistence.pool_metrics import InstrumentedAsyncQueuePool, PoolMetrics
+from infrastructure.persistence.query_stats import instrument_engine
+from infrastructure.persistence.routing import RoutingSession
 
 
 class DatabaseSessionManager:
@@ -23,36 +26,66 @@ class DatabaseSessionManager:
     IMPORTANT: Bu class Singleton pattern bilan ishlatiladi!
     """
 
-    def __init__(self, db_url: str, echo: bool = False):
+    def __init__(self, db_url: str, echo: bool = False, replica_urls: Sequence[str] = ()):
         """
         Constructor - Faqat bir marta chaqiriladi
 
         Args:
             db_url: Database URL (postgresql+asyncpg://...)
             echo: SQL query larni console ga chiqarish
+            replica_urls: Read replica URL lari - @read_only SELECT lar shu yerga
         """
+        # Har bir pool ning statistikasi (pool_stats() / /internal/db-pool)
+        self.pool_metrics: list[PoolMetrics] = []
+
         # Engine yaratish - Connection Pool
-        self.engine: AsyncEngine = create_async_engine(
-            db_url,
-            echo=echo,
-            future=True,
-            pool_pre_ping=True,  # Connection dead yoki yo'qligini tekshiradi
-            pool_size=20,  # Maksimal 20 ta connection
-            max_overflow=10,  # Pool to'lganda qo'shimcha 10 ta
-            pool_recycle=3600,  # Har 1 soatda connection yangilanadi
-            pool_timeout=30,  # Connection kutish vaqti (seconds)
-        )
+        self.engine: AsyncEngine = self._create_engine(db_url, echo, "primary")
+
+        # Har bir replica uchun alohida pool
+        self.replica_engines: list[AsyncEngine] = [
+            self._create_engine(replica_url, echo, f"replica_{i}")
+            for i, replica_url in enumerate(replica_urls)
+        ]
 
         # Session Factory yaratish
         # Bu factory - har safar yangi AsyncSession instance qaytaradi
         self._session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,  # Read replica / primary routing
+            replicas=[engine.sync_engine for engine in self.replica_engines],
             expire_on_commit=False,  # Commit dan keyin object expire bo'lmasligi
             autoflush=False,  # Manual flush qilish
             autocommit=False,  # Manual commit qilish
         )
 
+    def _create_engine(self, db_url: str, echo: bool, name: str) -> AsyncEngine:
+        engine = create_async_engine(
+            db_url,
+            echo=echo,
+            future=True,
+            poolclass=InstrumentedAsyncQueuePool,  # Checkout wait / timeout metrics
+            pool_pre_ping=settings.DB_POOL_PRE_PING,  # Connection dead yoki yo'qligini tekshiradi
+            pool_size=settings.DB_POOL_SIZE,  # Doimiy connection lar soni (default 20)
+            max_overflow=settings.DB_MAX_OVERFLOW,  # Pool to'lganda qo'shimcha (default 10)
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Connection yangilanish davri (seconds)
+            pool_timeout=settings.DB_POOL_TIMEOUT,  # Connection kutish vaqti (seconds)
+        )
+        metrics = PoolMetrics(name)
+        metrics.attach(engine)
+        self.pool_metrics.append(metrics)
+        instrument_engine(engine)  # Per-request statement stats (QueryStatsMiddleware)
+        return engine
+
+    def pool_stats(self) -> list[dict[str, Any]]:
+        """
+        Live statistics of every connection pool (primary first, then replicas)
+
+        Usage:
+            db_manager.pool_stats()[0]["checked_out"]
+        """
+        return [metrics.snapshot() for metrics in self.pool_metrics]
+
     def session_factory(self) -> AsyncSession:
         """
         Session Factory Method
@@ -127,6 +160,8 @@ class DatabaseSessionManager:
             async def shutdown():
                 await db_manager.close()
         """
+        for replica_engine in self.replica_engines:
+            await replica_engine.dispose()
         if self.engine:
             await self.engine.dispose()
 
@@ -172,7 +207,8 @@ def get_db_session_manager() -> DatabaseSessionManager:
     if _db_session_manager is None:
         _db_session_manager = DatabaseSessionManager(
             db_url=settings.DATABASE_URL,
-            echo=settings.DEBUG
+            echo=settings.DEBUG,
+            replica_urls=settings.database_replica_urls,
         )
 
     return _db_session_manager
@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+from sqlalchemy import func, literal_column
+
+
+def localized(column: Any, lang: Optional[str]) -> Any:
+    """
+    One locale of a localized JSONB column, extracted in SQL
+
+    With `lang` - `coalesce(column ->> lang, '')`, a plain string (empty if the
+    locale is missing); without - the whole `{locale: text}` dict.
+
+    Usage:
+        await self.list_projection(
+            (CategoryModel.uuid, localized(CategoryModel.name, lang)),
+            CategoryEntity,
+        )
+    """
+    if lang is None:
+        return column
+    return func.coalesce(column[lang].astext, "")
+
+
+def localized_text(column: Any, locale: str) -> Any:
+    """
+    `column ->> '<locale>'` with the locale inlined, not bound
+
+    Matches `(name ->> 'en')` expression indexes - with a bind parameter a
+    generic (prepared) plan can't use them.
+
+    IMPORTANT: locale must be a trusted constant (SEARCH_CONFIGS key).
+    """
+    return column.op("->>")(literal_column(f"'{locale}'"))
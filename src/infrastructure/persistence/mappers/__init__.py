@@ -1,3 +1,4 @@
 from .user_mapper import *
 from .user_profile_mapper import *
 from .category_mapper import *
+from .product_mapper import *
@@ -4,6 +4,7 @@ from infrastructure.persistence.models.category_model import CategoryModel
 
 def category_entity_to_model(category_entity: CategoryEntity) -> CategoryModel:
     return CategoryModel(
+        uuid=category_entity.uuid,
         name=category_entity.name,
         description=category_entity.description
     )
@@ -0,0 +1,33 @@
+from domain import entity
+from infrastructure.persistence import models
+
+
+def product_model_to_detail_entity(product: models.ProductModel) -> entity.ProductDetailEntity:
+    """IMPORTANT: category, tags va images oldindan yuklangan bo'lishi kerak (eager loading)"""
+    return entity.ProductDetailEntity(
+        uuid=product.uuid,
+        name=product.name,
+        description=product.description,
+        price=product.price,
+        stock=product.stock,
+        category=entity.CategoryEntity(
+            uuid=product.category.uuid,
+            name=product.category.name,
+            description=product.category.description,
+        ),
+        tags=[entity.TagEntity(uuid=tag.uuid, name=tag.name) for tag in product.tags],
+        images=[
+            entity.ProjectImageEntity(uuid=image.image_id, image_url=image.image.url)
+            for image in product.images
+        ],
+    )
+
+
+def product_create_entity_to_model(product: entity.ProductCreateEntity) -> models.ProductModel:
+    return models.ProductModel(
+        name=product.name,
+        description=product.description,
+        price=product.price,
+        stock=product.stock,
+        category_id=product.category_id,
+    )
@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
@@ -18,6 +19,14 @@ target_metadata = BaseModel.metadata
 def get_sync_url():
     return settings.DATABASE_URL.replace("+asyncpg", "+psycopg2")
 
+
+def get_lock_timeout() -> str:
+    """`-x lock_timeout=5s` (manage.py migrate --lock-timeout) - empty: wait forever"""
+    lock_timeout = context.get_x_argument(as_dictionary=True).get("lock_timeout", "")
+    if lock_timeout and not re.fullmatch(r"\d+(ms|s|min)?", lock_timeout):
+        raise ValueError(f"Invalid lock_timeout: {lock_timeout!r}")
+    return lock_timeout
+
 def run_migrations_offline():
     """Offline rejim (sql fayl yozish)."""
     url = get_sync_url()
@@ -26,6 +35,7 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -41,9 +51,19 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
+        # DDL kutib qolgan lock navbati hamma yozuvlarni to'xtatadi - tezda xato berib chiqsin.
+        # CONCURRENTLY index lar (operations.py) bundan mustasno - ular yozuvlarni to'xtatmaydi
+        lock_timeout = get_lock_timeout()
+        if lock_timeout:
+            connection.exec_driver_sql(f"SET lock_timeout = '{lock_timeout}'")
+            connection.commit()
+
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            # Har revision o'z tranzaksiyasida - CREATE INDEX CONCURRENTLY
+            # (autocommit_block) oldingi revision larni yarim qoldirmaydi
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,36 @@
+"""20261018_101500_keyset_pagination_indexes
+
+Revision ID: 4b7d2e9a1c3f
+Revises: 26285028c53c
+Create Date: 2026-10-18 10:15:00.412873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d2e9a1c3f'
+down_revision: Union[str, Sequence[str], None] = '26285028c53c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KEYSET_TABLES = ('categories', 'tags', 'products', 'users')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Writes to the (large) users / products tables keep going while the indexes build
+    for table in KEYSET_TABLES:
+        create_index_concurrently(f'ix_{table}_created_at_uuid', table, ['created_at', 'uuid'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(KEYSET_TABLES):
+        drop_index_concurrently(f'ix_{table}_created_at_uuid', table)
@@ -0,0 +1,42 @@
+"""20261018_124500_trigram_name_indexes
+
+Revision ID: 5d08e2b6f913
+Revises: c41e9b7f5a02
+Create Date: 2026-10-18 12:45:00.107342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d08e2b6f913'
+down_revision: Union[str, Sequence[str], None] = 'c41e9b7f5a02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AUTOCOMPLETE_TABLES = ('categories', 'tags', 'products')
+LOCALES = ('en', 'ru', 'uz')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in AUTOCOMPLETE_TABLES:
+        for locale in LOCALES:
+            # Writes to products keep going while the index builds
+            create_index_concurrently(f'ix_{table}_name_{locale}_trgm', table,
+                                      [sa.text(f"(name ->> '{locale}') gin_trgm_ops")],
+                                      postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(AUTOCOMPLETE_TABLES):
+        for locale in LOCALES:
+            drop_index_concurrently(f'ix_{table}_name_{locale}_trgm', table)
+    # pg_trgm is left installed - other objects may depend on it
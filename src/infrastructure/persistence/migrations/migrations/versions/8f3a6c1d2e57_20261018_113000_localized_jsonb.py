@@ -0,0 +1,56 @@
+"""20261018_113000_localized_jsonb
+
+Revision ID: 8f3a6c1d2e57
+Revises: 4b7d2e9a1c3f
+Create Date: 2026-10-18 11:30:00.218407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6c1d2e57'
+down_revision: Union[str, Sequence[str], None] = '4b7d2e9a1c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOCALIZED_COLUMNS = (
+    ('categories', 'name'),
+    ('categories', 'description'),
+    ('tags', 'name'),
+    ('products', 'name'),
+    ('products', 'description'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in LOCALIZED_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb',
+        )
+    # After the type change is committed - GIN builds are long, writes keep going meanwhile
+    for table, column in LOCALIZED_COLUMNS:
+        create_index_concurrently(f'ix_{table}_{column}_gin', table, [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(LOCALIZED_COLUMNS):
+        drop_index_concurrently(f'ix_{table}_{column}_gin', table)
+    for table, column in reversed(LOCALIZED_COLUMNS):
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,59 @@
+"""20261018_134500_server_side_timestamps
+
+Revision ID: 9b1f4d7e3a28
+Revises: e2a7c5f09d61
+Create Date: 2026-10-18 13:45:00.291750
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f4d7e3a28'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c5f09d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = ('categories', 'clients', 'tags', 'upload_files', 'users', 'products', 'product_images')
+BRIN_TABLES = ('users', 'products', 'upload_files')
+UTC_NOW = "timezone('utc', now())"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := {UTC_NOW};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), server_default=sa.text(UTC_NOW))
+        op.alter_column(table, 'updated_at', existing_type=sa.DateTime(), server_default=sa.text(UTC_NOW))
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+    # Big tables - build without blocking writes (commits the DDL above first)
+    for table in BRIN_TABLES:
+        create_index_concurrently(f'ix_{table}_created_at_brin', table, ['created_at'], postgresql_using='brin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(BRIN_TABLES):
+        drop_index_concurrently(f'ix_{table}_created_at_brin', table)
+
+    for table in reversed(TIMESTAMPED_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+        op.alter_column(table, 'updated_at', existing_type=sa.DateTime(), server_default=None)
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), server_default=None)
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
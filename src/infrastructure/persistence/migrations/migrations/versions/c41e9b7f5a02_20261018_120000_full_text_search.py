@@ -0,0 +1,61 @@
+"""20261018_120000_full_text_search
+
+IMPORTANT: needs a maintenance window. A STORED generated column can't be
+added without rewriting the table - categories and products are rewritten
+once each (all locales in one ALTER TABLE) under ACCESS EXCLUSIVE, reads and
+writes of the table wait for it. The GIN indexes are then built CONCURRENTLY.
+
+Revision ID: c41e9b7f5a02
+Revises: 8f3a6c1d2e57
+Create Date: 2026-10-18 12:00:00.530194
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e9b7f5a02'
+down_revision: Union[str, Sequence[str], None] = '8f3a6c1d2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCHABLE_TABLES = ('categories', 'products')
+# Frozen copy of models.search_vector.SEARCH_CONFIGS at this revision
+SEARCH_CONFIGS = {'en': 'english', 'ru': 'russian', 'uz': 'simple'}
+
+
+def search_vector_expression(locale: str) -> str:
+    config = SEARCH_CONFIGS[locale]
+    return (
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce(name ->> '{locale}', '')), 'A') || "
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce(description ->> '{locale}', '')), 'B')"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SEARCHABLE_TABLES:
+        # One statement - one table rewrite, not one per locale
+        op.execute(f'ALTER TABLE {table} ' + ', '.join(
+            f'ADD COLUMN search_{locale} tsvector GENERATED ALWAYS AS ({search_vector_expression(locale)}) STORED'
+            for locale in SEARCH_CONFIGS
+        ))
+    for table in SEARCHABLE_TABLES:
+        for locale in SEARCH_CONFIGS:
+            create_index_concurrently(f'ix_{table}_search_{locale}', table, [f'search_{locale}'],
+                                      postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(SEARCHABLE_TABLES):
+        for locale in SEARCH_CONFIGS:
+            drop_index_concurrently(f'ix_{table}_search_{locale}', table)
+    for table in reversed(SEARCHABLE_TABLES):
+        for locale in SEARCH_CONFIGS:
+            op.drop_column(table, f'search_{locale}')
@@ -0,0 +1,40 @@
+"""20261018_131500_foreign_key_indexes
+
+Revision ID: e2a7c5f09d61
+Revises: 5d08e2b6f913
+Create Date: 2026-10-18 13:15:00.684215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.persistence.migrations.operations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c5f09d61'
+down_revision: Union[str, Sequence[str], None] = '5d08e2b6f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Referencing columns without an index - every parent lookup and ON DELETE CASCADE scanned the table
+FOREIGN_KEY_INDEXES = (
+    ('ix_products_category_id', 'products', 'category_id'),
+    ('ix_product_tag_tag_id', 'product_tag', 'tag_id'),
+    ('ix_product_images_product_id', 'product_images', 'product_id'),
+    ('ix_product_images_image_id', 'product_images', 'image_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, table_name, column in FOREIGN_KEY_INDEXES:
+        create_index_concurrently(index_name, table_name, [column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, table_name, _ in reversed(FOREIGN_KEY_INDEXES):
+        drop_index_concurrently(index_name, table_name)
@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def _is_invalid_index(index_name: str) -> bool:
+    """Index left INVALID by a failed CONCURRENTLY build (lock_timeout, deadlock, cancel)"""
+    if op.get_context().as_sql:
+        return False
+    result = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": index_name},
+    )
+    return bool(result.scalar())
+
+
+@contextmanager
+def _concurrently() -> Iterator[None]:
+    """
+    Autocommit block without the session's lock_timeout (`migrate --lock-timeout`)
+
+    A CONCURRENTLY build waits for every transaction touching the table - with
+    lock_timeout it fails on a busy table and leaves an INVALID index behind.
+    It doesn't block writes while waiting, so it may wait; the timeout is
+    restored for the DDL of the following revisions.
+    """
+    context = op.get_context()
+    with context.autocommit_block():
+        if context.as_sql:
+            yield
+            return
+        bind = op.get_bind()
+        lock_timeout = bind.execute(sa.text("SHOW lock_timeout")).scalar()
+        bind.execute(sa.text("SET lock_timeout = 0"))
+        try:
+            yield
+        finally:
+            bind.execute(sa.text("SELECT set_config('lock_timeout', :value, false)"), {"value": lock_timeout})
+
+
+def create_index_concurrently(
+        index_name: str,
+        table_name: str,
+        columns: Sequence[Any],
+        unique: bool = False,
+        postgresql_using: Optional[str] = None,
+) -> None:
+    """
+    CREATE INDEX CONCURRENTLY, outside the migration's transaction
+
+    Writes to the table keep going while the index builds (SHARE UPDATE
+    EXCLUSIVE instead of SHARE lock). Re-runnable: an INVALID leftover of an
+    earlier failed build is dropped first, a valid index is kept.
+
+    Runs without lock_timeout - see `_concurrently`.
+
+    IMPORTANT: CONCURRENTLY tranzaksiya ichida ishlamaydi - autocommit_block
+    shu revision gacha bo'lgan hamma narsani commit qiladi
+    (env.py da transaction_per_migration=True).
+    """
+    with _concurrently():
+        if _is_invalid_index(index_name):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            unique=unique,
+            postgresql_using=postgresql_using,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """DROP INDEX CONCURRENTLY, outside the migration's transaction, without lock_timeout"""
+    with _concurrently():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
@@ -5,4 +5,15 @@ from .category_model import CategoryModel
 from .tag_model import TagModel
 from .upload_model import UploadModel
 from .product_image_model import ProductImageModel
-from .product_model import ProductModel
\ No newline at end of file
+from .product_model import ProductModel
+
+__all__ = [
+    "BaseModel",
+    "UserModel",
+    "ClientModel",
+    "CategoryModel",
+    "TagModel",
+    "UploadModel",
+    "ProductImageModel",
+    "ProductModel",
+]
@@ -1,20 +1,32 @@
 from datetime import datetime
-from uuid import uuid4, UUID as UUIDType
+from uuid import UUID as UUIDType
 from typing import Any
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, declarative_base
 
+from utils.uuid7 import uuid7
+
 Base: Any = declarative_base()
 
+# Current time as naive UTC - timestamp columns are `timestamp without time zone`
+UTC_NOW = "timezone('utc', now())"
+
 
 class BaseModel(Base):
     __abstract__ = True
+    # flush() da server qiymatlari (created_at, updated_at) RETURNING bilan olinadi -
+    # expire bo'lib, async da lazy load qilinmasin
+    __mapper_args__ = {"eager_defaults": True}
 
-    uuid: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    uuid: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # Database da to'ldiriladi (naive UTC) - INSERT/UPDATE ... RETURNING bilan qaytadi.
+    # updated_at ni har UPDATE da `set_updated_at` trigger yangilaydi.
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=text(UTC_NOW))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=text(UTC_NOW), server_onupdate=FetchedValue()
+    )
 
     def __repr__(self):
         return f"<{self.__class__.__name__} uuid={self.uuid}>"
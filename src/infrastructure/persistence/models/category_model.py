@@ -1,18 +1,32 @@
 from typing import Dict
 
-from sqlalchemy import JSON
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base_model import BaseModel
+from .search_vector import add_search_vectors, add_trigram_indexes
 
 
 class CategoryModel(BaseModel):
     __tablename__ = "categories"
+    __table_args__ = (
+        Index("ix_categories_created_at_uuid", "created_at", "uuid"),
+        Index("ix_categories_name_gin", "name", postgresql_using="gin"),
+        Index("ix_categories_description_gin", "description", postgresql_using="gin"),
+    )
 
-    name: Mapped[Dict] = mapped_column(JSON, default=dict)
-    description: Mapped[Dict] = mapped_column(JSON, default=dict)
+    name: Mapped[Dict] = mapped_column(JSONB, default=dict)
+    description: Mapped[Dict] = mapped_column(JSONB, default=dict)
 
     products = relationship("ProductModel", back_populates="category")
 
     def __repr__(self):
-        return f"<CategoryModel name={self.name}>"
\ No newline at end of file
+        return f"<CategoryModel name={self.name}>"
+
+
+# Full-text search - name (weight A) and description (weight B) of every locale
+add_search_vectors(CategoryModel.__table__, (("name", "A"), ("description", "B")))
+
+# Autocomplete - trigram index of the name of every locale
+add_trigram_indexes(CategoryModel.__table__)
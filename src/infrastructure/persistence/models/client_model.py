@@ -1,17 +1,17 @@
-from uuid import uuid4
 
 from sqlalchemy import String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from domain.entity.enum.client_type import ClientTypeEnum
+from utils.uuid7 import uuid7
 from .base_model import BaseModel
 
 
 class ClientModel(BaseModel):
     __tablename__ = "clients"
 
-    client_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4())
+    client_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     client_secret: Mapped[str] = mapped_column(String, unique=True, index=True)
     redirect_uris: Mapped[str] = mapped_column(String, nullable=True)
     client_type: Mapped[ClientTypeEnum] = mapped_column(String, nullable=False)
@@ -1,9 +1,11 @@
 from typing import List, Dict
 
-from sqlalchemy import JSON, ForeignKey, Table, Column
+from sqlalchemy import ForeignKey, Table, Column, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base_model import BaseModel
+from .search_vector import add_search_vectors, add_trigram_indexes
 from .category_model import CategoryModel
 from .product_image_model import ProductImageModel
 from .tag_model import TagModel
@@ -13,19 +15,27 @@ product_tag = Table(
     "product_tag",
     BaseModel.metadata,
     Column("product_id", ForeignKey("products.uuid"), primary_key=True),
-    Column("tag_id", ForeignKey("tags.uuid"), primary_key=True),
+    # (product_id, tag_id) primary key covers product_id lookups, tag_id needs its own
+    Column("tag_id", ForeignKey("tags.uuid"), primary_key=True, index=True),
 )
 
 
 class ProductModel(BaseModel):
     __tablename__ = "products"
-
-    name: Mapped[Dict] = mapped_column(JSON, default=dict)
-    description: Mapped[Dict] = mapped_column(JSON, default=dict)
+    __table_args__ = (
+        Index("ix_products_created_at_uuid", "created_at", "uuid"),
+        # Append-mostly - BRIN is a few pages for the whole table, serves created_at ranges
+        Index("ix_products_created_at_brin", "created_at", postgresql_using="brin"),
+        Index("ix_products_name_gin", "name", postgresql_using="gin"),
+        Index("ix_products_description_gin", "description", postgresql_using="gin"),
+    )
+
+    name: Mapped[Dict] = mapped_column(JSONB, default=dict)
+    description: Mapped[Dict] = mapped_column(JSONB, default=dict)
     price: Mapped[float] = mapped_column(default=0.0)
     stock: Mapped[int] = mapped_column(default=0)
 
-    category_id: Mapped[str] = mapped_column(ForeignKey("categories.uuid", ondelete="CASCADE"))
+    category_id: Mapped[str] = mapped_column(ForeignKey("categories.uuid", ondelete="CASCADE"), index=True)
     category: Mapped[CategoryModel] = relationship("CategoryModel", back_populates="products")
 
     tags: Mapped[List[TagModel]] = relationship("TagModel", secondary=product_tag, back_populates="products")
@@ -35,3 +45,10 @@ class ProductModel(BaseModel):
 
     def __repr__(self):
         return f"<ProductModel name={self.name} price={self.price} stock={self.stock}>"
+
+
+# Full-text search - name (weight A) and description (weight B) of every locale
+add_search_vectors(ProductModel.__table__, (("name", "A"), ("description", "B")))
+
+# Autocomplete - trigram index of the name of every locale
+add_trigram_indexes(ProductModel.__table__)
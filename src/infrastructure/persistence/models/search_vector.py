@@ -0,0 +1,67 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Column, Computed, Index, Table, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# Text search configuration of every searchable locale (uz has no stemmer in Postgres)
+SEARCH_CONFIGS: dict[str, str] = {
+    "en": "english",
+    "ru": "russian",
+    "uz": "simple",
+}
+
+
+def search_vector_expression(locale: str, weighted_columns: Sequence[tuple[str, str]]) -> str:
+    """
+    `tsvector` of one locale of localized JSONB columns
+
+    `(("name", "A"), ("description", "B"))` ->
+        setweight(to_tsvector('english', coalesce(name ->> 'en', '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description ->> 'en', '')), 'B')
+    """
+    config = SEARCH_CONFIGS[locale]
+    return " || ".join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({column} ->> '{locale}', '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
+def add_search_vectors(table: Table, weighted_columns: Sequence[tuple[str, str]]) -> None:
+    """
+    Add generated (STORED) `search_<locale>` tsvector columns with GIN indexes to `table`
+
+    Postgres keeps them in sync with the JSONB columns - the app never writes them.
+
+    IMPORTANT: Mapping dan keyin qo'shiladi - ustunlar model ga kirmaydi, shuning
+    uchun model SELECT / INSERT ... RETURNING ularni o'qimaydi. Search query lar
+    `search_vector(Model, locale)` orqali ishlatadi.
+    """
+    for locale in SEARCH_CONFIGS:
+        column = Column(
+            f"search_{locale}",
+            TSVECTOR,
+            Computed(search_vector_expression(locale, weighted_columns), persisted=True),
+        )
+        table.append_column(column)
+        Index(f"ix_{table.name}_search_{locale}", column, postgresql_using="gin")
+
+
+def search_vector(model: Any, locale: str) -> Column[Any]:
+    """`search_<locale>` column of a model's table"""
+    column: Column[Any] = model.__table__.c[f"search_{locale}"]
+    return column
+
+
+def add_trigram_indexes(table: Table, column: str = "name") -> None:
+    """
+    pg_trgm GIN index on `(column ->> '<locale>')` of every locale - LIKE/ILIKE and similarity
+
+    IMPORTANT: Query ifodasi index bilan bir xil bo'lishi kerak - locale bind
+    parameter emas, literal bo'lsin (`localized_text(Model.name, locale)`).
+    """
+    for locale in SEARCH_CONFIGS:
+        table.append_constraint(Index(
+            f"ix_{table.name}_{column}_{locale}_trgm",
+            text(f"({column} ->> '{locale}') gin_trgm_ops"),
+            postgresql_using="gin",
+        ))
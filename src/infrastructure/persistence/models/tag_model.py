@@ -1,15 +1,21 @@
 from typing import Dict
 
-from sqlalchemy import JSON
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base_model import BaseModel
+from .search_vector import add_trigram_indexes
 
 
 class TagModel(BaseModel):
     __tablename__ = "tags"
+    __table_args__ = (
+        Index("ix_tags_created_at_uuid", "created_at", "uuid"),
+        Index("ix_tags_name_gin", "name", postgresql_using="gin"),
+    )
 
-    name: Mapped[Dict] = mapped_column(JSON, default=dict)
+    name: Mapped[Dict] = mapped_column(JSONB, default=dict)
 
     products = relationship("ProductModel", secondary="product_tag", back_populates="tags")
 
@@ -17,3 +23,5 @@ class TagModel(BaseModel):
         return f"<TagModel name={self.name}>"
 
 
+# Autocomplete - trigram index of the name of every locale
+add_trigram_indexes(TagModel.__table__)
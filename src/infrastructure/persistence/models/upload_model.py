@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base_model import BaseModel
@@ -6,6 +6,10 @@ from .base_model import BaseModel
 
 class UploadModel(BaseModel):
     __tablename__ = "upload_files"
+    __table_args__ = (
+        # Append-mostly - BRIN is a few pages for the whole table, serves created_at ranges
+        Index("ix_upload_files_created_at_brin", "created_at", postgresql_using="brin"),
+    )
 
     url: Mapped[str] = mapped_column(String(255))
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base_model import BaseModel
@@ -8,6 +8,11 @@ from .base_model import BaseModel
 
 class UserModel(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_uuid", "created_at", "uuid"),
+        # Append-mostly - BRIN is a few pages for the whole table, serves created_at ranges
+        Index("ix_users_created_at_brin", "created_at", postgresql_using="brin"),
+    )
 
     email: Mapped[str] = mapped_column(String, unique=True, index=True)
     _hashed_password: Mapped[str] = mapped_column("hashed_password", String)
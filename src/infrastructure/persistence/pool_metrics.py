@@ -0,0 +1,140 @@
+import bisect
+import time
+import weakref
+from typing import Any, Optional, cast
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets, the last bucket is +Inf
+CHECKOUT_WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """
+    Counters of one connection pool, fed by SQLAlchemy pool/engine events
+
+    - checkouts, timeouts: every Pool.connect() and the ones that hit pool_timeout
+    - checkout wait: time spent in Pool.connect() (waiting for a free slot,
+      opening a new connection, pre-ping), as a histogram of per-bucket counts
+    - recycles: connections replaced because of pool_recycle (or soft invalidation)
+    - invalidations: connections dropped as broken
+    - pre_ping_failures: pool_pre_ping found a dead connection
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.recycles = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+        self.wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self._engine: Optional[AsyncEngine] = None
+        # Connection records that already had a connection / were invalidated
+        self._connected: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._invalidated: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Start collecting for `engine` (its pool must be an InstrumentedAsyncQueuePool)"""
+        self._engine = engine
+        sync_engine = engine.sync_engine
+        if isinstance(sync_engine.pool, InstrumentedPoolMixin):
+            sync_engine.pool.metrics = self
+
+        # Pool events registered on the engine survive pool.recreate() (engine.dispose())
+        event.listen(sync_engine, "connect", self._on_connect)
+        event.listen(sync_engine, "invalidate", self._on_invalidate)
+        event.listen(sync_engine, "handle_error", self._on_handle_error)
+
+    def observe_checkout(self, wait_ms: float, timed_out: bool) -> None:
+        self.checkouts += 1
+        if timed_out:
+            self.timeouts += 1
+        self.wait_buckets[bisect.bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)] += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current pool state plus the counters, JSON serializable"""
+        pool: Optional[Pool] = self._engine.sync_engine.pool if self._engine else None
+        state: dict[str, Any] = {}
+        if isinstance(pool, QueuePool):
+            state = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                # QueuePool counts overflow from -pool_size; only positive values are in use
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            }
+
+        return {
+            "name": self.name,
+            **state,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "recycles": self.recycles,
+            "invalidations": self.invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+            "checkout_wait_ms": {
+                "mean": self.wait_total_ms / self.checkouts if self.checkouts else 0.0,
+                "max": self.wait_max_ms,
+                "buckets": {
+                    **{f"le_{bound:g}": count
+                       for bound, count in zip(CHECKOUT_WAIT_BUCKETS_MS, self.wait_buckets)},
+                    "le_inf": self.wait_buckets[-1],
+                },
+            },
+        }
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        if connection_record in self._connected:
+            if connection_record in self._invalidated:
+                self._invalidated.discard(connection_record)
+            else:
+                self.recycles += 1
+        self._connected.add(connection_record)
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        self.invalidations += 1
+        self._invalidated.add(connection_record)
+
+    def _on_handle_error(self, context: Any) -> None:
+        if getattr(context, "is_pre_ping", False):
+            self.pre_ping_failures += 1
+
+
+class InstrumentedPoolMixin:
+    """Times every Pool.connect() into `metrics` (set by PoolMetrics.attach)"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self) -> Any:
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()  # type: ignore[misc]
+
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            metrics.observe_checkout((time.perf_counter() - started) * 1000, timed_out)
+
+    def recreate(self) -> QueuePool:
+        """engine.dispose() swaps the pool - keep counting into the same metrics"""
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return cast(QueuePool, pool)
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
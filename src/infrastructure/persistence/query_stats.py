@@ -0,0 +1,104 @@
+import heapq
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:, \?)+")
+_ROW_LIST = re.compile(r"(\(\?\))(?:, \(\?\))+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Statement with literals, bind parameters and IN/VALUES lists collapsed
+
+    `... WHERE uuid = $1` and `... WHERE uuid = $2` - the same shape, so N
+    lookups of one row each show up as one shape repeated N times.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _LITERALS.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _ROW_LIST.sub(r"\1", shape)
+
+
+class QueryStats:
+    """SQL statements executed during one request"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.timings: list[tuple[str, float]] = []
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        shape = statement_shape(statement)
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.timings.append((shape, elapsed_ms))
+        self.shapes[shape] += 1
+
+    @property
+    def max_ms(self) -> float:
+        return max((elapsed for _, elapsed in self.timings), default=0.0)
+
+    def slowest(self, limit: int) -> list[tuple[str, float]]:
+        """`limit` slowest statements, slowest first"""
+        return heapq.nlargest(limit, self.timings, key=lambda timing: timing[1])
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes executed more than `threshold` times - N+1 candidates"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value"""
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries", '
+            f"db-max;dur={self.max_ms:.2f}"
+        )
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def collect_query_stats() -> Generator[QueryStats, None, None]:
+    """
+    Record every statement executed inside the block
+
+    Usage:
+        with collect_query_stats() as stats:
+            await repo.list()
+        assert not stats.repeated(10)
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Feed `collect_query_stats()` blocks from the engine's cursor events"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                               context: Any, executemany: bool) -> None:
+        # Per execution context - failed statements leave nothing behind
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                              context: Any, executemany: bool) -> None:
+        stats = _current_stats.get()
+        if stats is not None and context is not None:
+            stats.record(statement, (time.perf_counter() - context._query_started_at) * 1000)
@@ -1,6 +1,27 @@
 from .base_repository import BaseRepository
-from .category_repository_impl import CategoryRepositoryImpl
-from .tag_repository_impl import TagRepositoryImpl
+from .count_strategy import CountStrategy
+from .cached_repository import CachedRepositoryMixin
+from .category_repository_impl import CategoryRepositoryImpl, CachedCategoryRepositoryImpl
+from .product_repository_impl import ProductRepositoryImpl
+from .tag_repository_impl import TagRepositoryImpl, CachedTagRepositoryImpl
 from .upload_repository_impl import UploadFileRepositoryImpl
 from .user_profile_repository_impl import UserProfileRepositoryImpl
 from .user_repository_impl import UserRepositoryImpl
+from .autocomplete_repository_impl import AutocompleteRepositoryImpl
+from .catalog_import_repository_impl import CatalogImportRepositoryImpl
+
+__all__ = [
+    "BaseRepository",
+    "CountStrategy",
+    "CachedRepositoryMixin",
+    "CategoryRepositoryImpl",
+    "CachedCategoryRepositoryImpl",
+    "ProductRepositoryImpl",
+    "TagRepositoryImpl",
+    "CachedTagRepositoryImpl",
+    "UploadFileRepositoryImpl",
+    "UserProfileRepositoryImpl",
+    "UserRepositoryImpl",
+    "AutocompleteRepositoryImpl",
+    "CatalogImportRepositoryImpl",
+]
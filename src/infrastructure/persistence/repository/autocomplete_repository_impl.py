@@ -0,0 +1,73 @@
+from typing import Any, List
+
+from injector import inject
+from sqlalchemy import Select, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.exceptions import InfrastructureException, ValidationException
+from core.response import ErrorCode
+from domain.entity import SuggestionEntity
+from domain.repository import AutocompleteRepository
+from infrastructure.persistence.localized import localized_text
+from infrastructure.persistence.models import CategoryModel, ProductModel, TagModel
+from infrastructure.persistence.models.search_vector import SEARCH_CONFIGS
+from infrastructure.persistence.routing import read_only
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+SUGGESTION_SOURCES: tuple[tuple[str, Any], ...] = (
+    ("category", CategoryModel),
+    ("tag", TagModel),
+    ("product", ProductModel),
+)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class AutocompleteRepositoryImpl(AutocompleteRepository):
+    """
+    Typeahead over localized names - pg_trgm GIN indexes, one round trip
+
+    Every source matches `name ->> '<locale>'` by prefix (ILIKE 'term%') or by
+    word similarity (`term <% name`, typos) - both served by the trigram index.
+    Prefix matches come first, then the most similar names.
+    All sources are one UNION ALL statement, each limited on its own.
+    """
+
+    @inject
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        self.uow = uow
+
+    @property
+    def db(self) -> AsyncSession:
+        return self.uow.session
+
+    @read_only
+    async def suggest(self, term: str, lang: str, limit: int = 5) -> List[SuggestionEntity]:
+        if lang not in SEARCH_CONFIGS:
+            raise ValidationException("lang", f"Autocomplete is not available for '{lang}'")
+        try:
+            stmt = union_all(*(
+                self._source_select(kind, model, term, lang, limit)
+                for kind, model in SUGGESTION_SOURCES
+            ))
+            result = await self.db.execute(stmt)
+            return [SuggestionEntity(*row) for row in result.all()]
+        except Exception as e:
+            raise InfrastructureException(
+                "Error getting suggestions",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    @staticmethod
+    def _source_select(kind: str, model: Any, term: str, lang: str, limit: int) -> Select[Any]:
+        name = localized_text(model.name, lang)
+        is_prefix = name.ilike(f"{_escape_like(term)}%", escape="\\")
+        return (
+            select(literal(kind), model.uuid, name)
+            .where(or_(is_prefix, literal(term).op("<%")(name)))
+            .order_by(is_prefix.desc(), func.word_similarity(term, name).desc(), name)
+            .limit(limit)
+        )
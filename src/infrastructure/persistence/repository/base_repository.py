@@ -1,17 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List, Type
+from datetime import datetime
+from typing import Generic, TypeVar, Optional, List, Type, Any, Sequence, Callable, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, insert, update, delete, func, tuple_, text, any_, literal, inspect, Select, and_, or_, literal_column, ColumnClause
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
 
-from core.exceptions import EntityNotFoundException, InfrastructureException
+from core.exceptions import EntityNotFoundException, InfrastructureException, ValidationException
 from core.response import ErrorCode
+from core.settings import settings
 from domain.entity.paging_entity import PagingEntity
+from infrastructure.persistence.batch_loader import BatchLoader
+from infrastructure.persistence.cursor import encode_cursor, decode_cursor
+from infrastructure.persistence.models.base_model import BaseModel
+from infrastructure.persistence.models.search_vector import SEARCH_CONFIGS, search_vector
+from infrastructure.persistence.routing import read_only
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from utils.timezone import to_utc_naive
+from .count_strategy import CountStrategy, count_cache
 
-ModelType = TypeVar('ModelType', bound=DeclarativeBase)
+ModelType = TypeVar('ModelType', bound=BaseModel)
 EntityType = TypeVar('EntityType')
+RowType = TypeVar('RowType')
 
 
 class BaseRepository(Generic[ModelType, EntityType], ABC):
@@ -19,13 +30,28 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
         Constructor - DI container tomonidan chaqiriladi
 
         Args:
-            db_session: Injector tomonidan beriladi (provide_async_session)
+            uow: Injector tomonidan beriladi - har request uchun bitta (request_scope)
             model_class: Child class tomonidan beriladi (UserModel, CategoryModel, etc.)
+
+        IMPORTANT: Repository commit qilmaydi - session va transaction
+        request ning unit of work i ga tegishli (SqlAlchemyUnitOfWork).
     """
 
-    def __init__(self, db_session: AsyncSession, model_class: Type[ModelType]):
+    # Total count strategy of `list` - override per repository
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cache_ttl: float = 60.0
+    count_estimate_threshold: int = 10_000
+
+    def __init__(self, uow: SqlAlchemyUnitOfWork, model_class: Type[ModelType]):
+        self.uow = uow
         self.model_class = model_class
-        self.db = db_session
+        # Repository is request scoped - so is the loader and its memoized rows
+        self.loader: BatchLoader[UUID, EntityType] = BatchLoader(self._load_by_uuids)
+
+    @property
+    def db(self) -> AsyncSession:
+        """Session of the request - opened on the first query"""
+        return self.uow.session
 
     @abstractmethod
     def model_to_entity(self, model: ModelType) -> EntityType:
@@ -37,11 +63,18 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
         """Convert entity to model"""
         pass
 
+    @read_only
     async def get_by_uuid(self, entity_id: UUID) -> Optional[EntityType]:
-        """Get entity by ID"""
+        """
+        Get entity by ID
+
+        Goes through the request's batch loader: concurrent calls made in the
+        same event-loop tick share one `uuid = ANY(:ids)` query.
+        """
         try:
-            result = await self.db.get(self.model_class, entity_id)
-            return self.model_to_entity(result) if result else None
+            return await self.loader.load(entity_id)
+        except InfrastructureException:
+            raise
         except Exception as e:
             raise InfrastructureException(
                 f"Error getting {self.model_class.__name__} by id {entity_id}",
@@ -49,28 +82,136 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
                 cause=e
             )
 
-    async def list(self, skip: int = 1, limit: int = 100) -> PagingEntity[EntityType]:
-        """Get all entities with pagination"""
-        try:
-            offset = (skip - 1) * limit
+    @read_only
+    async def get_many_by_uuid(self, entity_ids: Sequence[UUID]) -> List[EntityType]:
+        """
+        Get entities by IDs with a single `uuid = ANY(:ids)` query
 
-            # Get items
+        Returns found entities in the order of `entity_ids`; missing IDs are skipped.
+        """
+        if not entity_ids:
+            return []
+        found = await self._load_by_uuids(entity_ids)
+        return [found[entity_id] for entity_id in dict.fromkeys(entity_ids) if entity_id in found]
+
+    async def _load_by_uuids(self, entity_ids: Sequence[UUID]) -> dict[UUID, EntityType]:
+        try:
             result = await self.db.execute(
-                select(self.model_class).offset(offset).limit(limit)
+                self._entity_select().where(self.model_class.uuid == any_(self._uuid_array(entity_ids)))
             )
-            items = result.scalars().all()
+            return {model.uuid: self.model_to_entity(model) for model in result.scalars().all()}
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error getting {self.model_class.__name__} by ids",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    def _entity_select(self) -> Select[Any]:
+        """
+        SELECT of full entities - override to add eager loading options
+
+        IMPORTANT: Async session lazy load qila olmaydi - model_to_entity ishlatadigan
+        relationship lar shu yerda yuklanishi kerak.
+        """
+        return select(self.model_class)
+
+    @read_only
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 100,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> PagingEntity[EntityType]:
+        """
+        Get all entities with pagination
+
+        Without a cursor the page is fetched with OFFSET (page number in `skip`).
+        With a cursor the page is fetched by keyset `(created_at, uuid) > cursor`,
+        so deep pages cost the same as the first one.
+        Every full page returns `next_cursor` to continue from.
+        The total is computed with the repository's `count_strategy`.
+
+        `created_after` (inclusive) / `created_before` (exclusive) limit the
+        page and the total to a created_at range (BRIN / created_at indexes);
+        a filtered total is always exact.
+        """
+        keyset = decode_cursor(cursor, datetime, UUID) if cursor else None
+        try:
+            rows, total, total_estimated = await self._paginate(
+                self._entity_select(), skip, limit, keyset,
+                self._created_range(created_after, created_before),
+            )
+            items = [row[0] for row in rows]
+
+            return PagingEntity.new(
+                None if keyset is not None else skip,
+                limit,
+                total,
+                [self.model_to_entity(item) for item in items],
+                next_cursor=self._next_cursor(items, limit),
+                total_estimated=total_estimated,
+            )
+
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error getting all {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    @read_only
+    async def list_projection(
+            self,
+            columns: Sequence[Any],
+            row_factory: Callable[..., RowType],
+            skip: int = 1,
+            limit: int = 100,
+            cursor: Optional[str] = None,
+            joins: Sequence[Any] = (),
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+    ) -> PagingEntity[RowType]:
+        """
+        Paginated list of the given columns only - the fast path for list endpoints
+
+        No ORM models, identity map or model -> entity mapping: every row is
+        built with `row_factory(*values)` straight from the result tuple,
+        values in the order of `columns` (use a slots dataclass).
+        Paging, cursor, created_at range and total behave exactly like `list`.
 
-            # Get total count
-            total_result = await self.db.execute(
-                select(func.count()).select_from(self.model_class)
+        Usage:
+            await self.list_projection(
+                (ProductModel.uuid, ProductModel.name, CategoryModel.name, ProductModel.price),
+                ProductEntity,
+                joins=(ProductModel.category,),
+            )
+        """
+        keyset = decode_cursor(cursor, datetime, UUID) if cursor else None
+        keyset_columns = self._keyset_columns()
+        try:
+            stmt = select(*columns, *keyset_columns).select_from(self.model_class)
+            for target in joins:
+                stmt = stmt.join(target)
+            rows, total, total_estimated = await self._paginate(
+                stmt, skip, limit, keyset, self._created_range(created_after, created_before)
             )
-            total = total_result.scalar_one()
+
+            width = len(columns)
+            next_cursor = None
+            if rows and len(rows) >= limit:
+                next_cursor = encode_cursor(*rows[-1][width:])
 
             return PagingEntity.new(
-                skip // limit + 1 if limit > 0 else 1,
+                None if keyset is not None else skip,
                 limit,
                 total,
-                [self.model_to_entity(item) for item in items])
+                [row_factory(*row[:width]) for row in rows],
+                next_cursor=next_cursor,
+                total_estimated=total_estimated,
+            )
 
         except Exception as e:
             raise InfrastructureException(
@@ -79,21 +220,190 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
                 cause=e
             )
 
+    @read_only
+    async def search_projection(
+            self,
+            columns: Sequence[Any],
+            row_factory: Callable[..., RowType],
+            query: str,
+            locale: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            joins: Sequence[Any] = (),
+    ) -> PagingEntity[RowType]:
+        """
+        Full-text search over the table's `search_<locale>` tsvector column
+
+        `websearch_to_tsquery` syntax ("quoted phrase", or, -exclude), matched
+        through the GIN index and ordered by `ts_rank_cd` desc, uuid.
+        Keyset pagination only - the cursor carries (rank, uuid, total), the
+        total is counted once with the first page (count(*) OVER ()).
+        Rows are built like `list_projection`.
+
+        Raises:
+            ValidationException: locale has no search configuration
+        """
+        if locale not in SEARCH_CONFIGS:
+            raise ValidationException("lang", f"Search is not available for '{locale}'")
+        keyset = decode_cursor(cursor, float, UUID, int) if cursor else None
+
+        vector = search_vector(self.model_class, locale)
+        # Trusted constant - inlined rather than bound (no regconfig codec needed)
+        config: ColumnClause[Any] = literal_column(f"'{SEARCH_CONFIGS[locale]}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, query)
+        rank = func.ts_rank_cd(vector, tsquery)
+        uuid = self.model_class.uuid
+        try:
+            stmt = select(*columns, rank, uuid).select_from(self.model_class)
+            for target in joins:
+                stmt = stmt.join(target)
+            stmt = stmt.where(vector.op("@@")(tsquery)).order_by(rank.desc(), uuid).limit(limit)
+            if keyset is None:
+                stmt = stmt.add_columns(func.count().over())
+            else:
+                last_rank, last_uuid, total = keyset
+                stmt = stmt.where(or_(rank < last_rank, and_(rank == last_rank, uuid > last_uuid)))
+
+            rows = (await self.db.execute(stmt)).all()
+            if keyset is None:
+                total = rows[0][-1] if rows else 0
+
+            width = len(columns)
+            next_cursor = None
+            if rows and len(rows) >= limit:
+                next_cursor = encode_cursor(rows[-1][width], rows[-1][width + 1], total)
+
+            return PagingEntity.new(
+                None,
+                limit,
+                total,
+                [row_factory(*row[:width]) for row in rows],
+                next_cursor=next_cursor,
+            )
+
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error searching {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def _paginate(
+            self,
+            stmt: Select[Any],
+            skip: int,
+            limit: int,
+            keyset: Optional[tuple[Any, ...]],
+            filters: Sequence[Any] = (),
+    ) -> tuple[List[tuple[Any, ...]], int, bool]:
+        """
+        Apply filters, ordering, offset/keyset and limit to `stmt` and compute the total
+
+        With filters the table-wide count strategies don't apply - the total
+        is the window count or an exact filtered count.
+
+        Returns:
+            (rows, total, total_estimated)
+        """
+        stmt = stmt.where(*filters).order_by(*self._keyset_columns()).limit(limit)
+        if keyset is not None:
+            stmt = stmt.where(tuple_(*self._keyset_columns()) > tuple_(*keyset))
+        else:
+            stmt = stmt.offset(max(skip - 1, 0) * limit)
+
+        use_window = self.count_strategy is CountStrategy.WINDOW and keyset is None
+        if use_window:
+            stmt = stmt.add_columns(func.count().over().label("window_total"))
+
+        result = await self.db.execute(stmt)
+        rows = [tuple(row) for row in result.all()]
+
+        if use_window:
+            if rows:
+                return [row[:-1] for row in rows], rows[0][-1], False
+            if skip <= 1:
+                return rows, 0, False
+
+        if filters:
+            return rows, await self._exact_count(*filters), False
+
+        total, total_estimated = await self._count_total()
+        return rows, total, total_estimated
+
+    async def _count_total(self) -> tuple[int, bool]:
+        """Total rows of the table according to `count_strategy`"""
+        table = self.model_class.__tablename__
+
+        if self.count_strategy is CountStrategy.ESTIMATE:
+            # Schema qualified - a bare name resolves to NULL when the schema isn't on search_path.
+            # The table's own schema, else the one unqualified DDL (migrations) created it in
+            result = await self.db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = to_regclass(format('%I.%I', coalesce(:schema, current_schema()), :table))"
+                ),
+                {"schema": self.model_class.__table__.schema, "table": table},
+            )
+            estimate = result.scalar_one_or_none()
+            # reltuples is -1 until the table is analyzed; small tables are cheap to count
+            if estimate is not None and estimate >= self.count_estimate_threshold:
+                return estimate, True
+            return await self._exact_count(), False
+
+        if self.count_strategy in (CountStrategy.CACHED, CountStrategy.WINDOW):
+            cached = count_cache.get(table)
+            if cached is not None:
+                return cached, True
+            total = await self._exact_count()
+            count_cache.set(table, total, self.count_cache_ttl)
+            return total, False
+
+        return await self._exact_count(), False
+
+    async def _exact_count(self, *filters: Any) -> int:
+        result = await self.db.execute(
+            select(func.count()).select_from(self.model_class).where(*filters)
+        )
+        return result.scalar_one()
+
+    def _created_range(self, created_after: Optional[datetime], created_before: Optional[datetime]) -> List[Any]:
+        """WHERE clauses of a created_after (inclusive) / created_before (exclusive) range"""
+        filters = []
+        if created_after is not None:
+            filters.append(self.model_class.created_at >= to_utc_naive(created_after))
+        if created_before is not None:
+            filters.append(self.model_class.created_at < to_utc_naive(created_before))
+        return filters
+
+    def _keyset_columns(self) -> tuple[Any, ...]:
+        """Stable ordering used by both offset and keyset pagination"""
+        return self.model_class.created_at, self.model_class.uuid
+
+    @staticmethod
+    def _next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+        """Cursor pointing after the last row, None when there is no next page"""
+        if not items or len(items) < limit:
+            return None
+        last = items[-1]
+        return encode_cursor(last.created_at, last.uuid)
+
     async def create(self, entity: EntityType) -> EntityType:
         """
         Create new entity
 
-        IMPORTANT: Commit va rollback FastAPI dependency (get_db) tomonidan
-        avtomatik bajariladi. Bu yerda faqat flush qilamiz.
+        Single INSERT ... RETURNING round trip - no refresh SELECT.
         """
         try:
-            model = self.entity_to_model(entity)
-            self.db.add(model)
-            await self.db.commit()
-            await self.db.refresh(model)
+            result = await self.db.scalars(
+                insert(self.model_class)
+                .values(**self._entity_to_row(entity))
+                .returning(self.model_class)
+            )
+            model = result.one()
+            count_cache.invalidate(self.model_class.__tablename__)
+            self.loader.clear()
             return self.model_to_entity(model)
         except Exception as e:
-            await self.db.rollback()
             raise InfrastructureException(
                 f"Error creating {self.model_class.__name__}",
                 ErrorCode.DATABASE_ERROR,
@@ -104,25 +414,27 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
         """
         Update existing entity
 
-        IMPORTANT: Commit va rollback FastAPI dependency (get_db) tomonidan
-        avtomatik bajariladi. Bu yerda faqat flush qilamiz.
+        Single UPDATE ... RETURNING round trip - no SELECT before and no refresh after.
         """
         try:
-            existing = await self.db.get(self.model_class, entity_id)
-            if not existing:
+            row = self._entity_to_row(entity)
+            row.pop("uuid", None)
+            result = await self.db.scalars(
+                update(self.model_class)
+                .where(self.model_class.uuid == entity_id)
+                .values(**row)
+                .returning(self.model_class)
+                .execution_options(populate_existing=True)
+            )
+            model = result.one_or_none()
+            if model is None:
                 raise EntityNotFoundException(self.model_class.__name__, str(entity_id))
+            self.loader.clear()
 
-            # Update fields from entity
-            updated_model = self.entity_to_model(entity)
-            for key, value in updated_model.__dict__.items():
-                if not key.startswith('_') and hasattr(existing, key):
-                    setattr(existing, key, value)
-
-            await self.db.commit()
-            await self.db.refresh(existing)
-            return self.model_to_entity(existing)
+            return self.model_to_entity(model)
+        except EntityNotFoundException:
+            raise
         except Exception as e:
-            await self.db.rollback()
             raise InfrastructureException(
                 f"Error updating {self.model_class.__name__}",
                 ErrorCode.DATABASE_ERROR,
@@ -130,31 +442,128 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
             )
 
     async def delete(self, entity_id: UUID) -> bool:
-        """
-        Delete entity
-
-        IMPORTANT: Commit va rollback FastAPI dependency (get_db) tomonidan
-        avtomatik bajariladi. Bu yerda faqat flush qilamiz.
-        """
+        """Delete entity"""
         try:
             result = await self.db.execute(
                 delete(self.model_class).where(self.model_class.uuid == entity_id)
             )
-            await self.db.commit()
+            count_cache.invalidate(self.model_class.__tablename__)
+            self.loader.clear()
             return result.rowcount > 0
         except Exception as e:
-            await self.db.rollback()
             raise InfrastructureException(
                 f"Error deleting {self.model_class.__name__}",
                 ErrorCode.DATABASE_ERROR,
                 cause=e
             )
 
+    async def create_many(self, entities: Sequence[EntityType]) -> List[EntityType]:
+        """
+        Create many entities with multi-row INSERT ... RETURNING
+
+        SQLAlchemy packs the rows into multi-VALUES batches (insertmanyvalues),
+        so seeding thousands of rows is a handful of statements.
+        """
+        if not entities:
+            return []
+        try:
+            result = await self.db.scalars(
+                insert(self.model_class).returning(self.model_class, sort_by_parameter_order=True),
+                [self._entity_to_row(entity) for entity in entities],
+            )
+            models = result.all()
+            count_cache.invalidate(self.model_class.__tablename__)
+            self.loader.clear()
+            return [self.model_to_entity(model) for model in models]
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error bulk creating {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def upsert_many(
+            self,
+            entities: Sequence[EntityType],
+            conflict_columns: Sequence[str] = ("uuid",),
+    ) -> List[EntityType]:
+        """
+        Insert or update many entities with INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+
+        Rows conflicting on `conflict_columns` get every other column
+        (except primary key and created_at) replaced by the new values.
+        """
+        if not entities:
+            return []
+        try:
+            stmt = pg_insert(self.model_class)
+            protected = set(conflict_columns) | {"created_at"}
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={
+                    column.name: stmt.excluded[column.name]
+                    for column in self.model_class.__table__.columns
+                    if not column.primary_key and column.computed is None and column.name not in protected
+                },
+            )
+            result = await self.db.scalars(
+                stmt.returning(self.model_class, sort_by_parameter_order=True)
+                .execution_options(populate_existing=True),
+                [self._entity_to_row(entity) for entity in entities],
+            )
+            models = result.all()
+            count_cache.invalidate(self.model_class.__tablename__)
+            self.loader.clear()
+            return [self.model_to_entity(model) for model in models]
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error bulk upserting {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def delete_many(self, entity_ids: Sequence[UUID]) -> int:
+        """Delete many entities with a single `uuid = ANY(:ids)` statement"""
+        if not entity_ids:
+            return 0
+        try:
+            result = await self.db.execute(
+                delete(self.model_class).where(self.model_class.uuid == any_(self._uuid_array(entity_ids)))
+            )
+            count_cache.invalidate(self.model_class.__tablename__)
+            self.loader.clear()
+            return result.rowcount
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error bulk deleting {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    def _entity_to_row(self, entity: EntityType) -> dict[str, Any]:
+        """Column values of an entity keyed by mapped attribute, for bulk statements"""
+        return self._model_to_row(self.entity_to_model(entity))
+
+    def _model_to_row(self, model: ModelType) -> dict[str, Any]:
+        """Column values set on a (transient) model, keyed by mapped attribute"""
+        return {
+            attr.key: getattr(model, attr.key)
+            for attr in inspect(self.model_class).column_attrs
+            if attr.key in model.__dict__
+            and not (attr.columns[0].primary_key and getattr(model, attr.key) is None)
+        }
+
+    @staticmethod
+    def _uuid_array(entity_ids: Sequence[UUID]) -> Any:
+        """Single array bind parameter - keeps the statement size constant for any number of ids"""
+        return literal(list(entity_ids), ARRAY(PG_UUID(as_uuid=True)))
+
+    @read_only
     async def get_all(self) -> List[EntityType]:
         """Get all entities without pagination"""
         try:
             result = await self.db.execute(
-                select(self.model_class)
+                self._entity_select()
             )
             items = result.scalars().all()
             return [self.model_to_entity(item) for item in items]
@@ -164,3 +573,85 @@ class BaseRepository(Generic[ModelType, EntityType], ABC):
                 ErrorCode.DATABASE_ERROR,
                 cause=e
             )
+
+    @read_only
+    async def version(self, entity_id: Optional[UUID] = None) -> Optional[str]:
+        """
+        Change marker of one row - its `updated_at` (primary key lookup), for HTTP ETags
+
+        None if there's no such row, and always for the whole table: there's
+        nothing indexed to answer it without scanning the table - cached
+        repositories keep a list version token (CachedRepositoryMixin).
+        """
+        if entity_id is None:
+            return None
+        try:
+            result = await self.db.execute(
+                select(self.model_class.updated_at).where(self.model_class.uuid == entity_id)
+            )
+            updated_at = result.scalar_one_or_none()
+            return None if updated_at is None else updated_at.isoformat()
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error getting {self.model_class.__name__} version",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def stream(self, fetch_size: int = settings.DB_STREAM_FETCH_SIZE) -> AsyncIterator[EntityType]:
+        """
+        Every entity, one at a time, through a server-side cursor
+
+        `stream_scalars` with `yield_per` - `fetch_size` rows per round trip, so
+        memory stays flat for any table size (unlike `get_all`). Ordered by
+        (created_at, uuid). Runs in the unit of work's `stream_session()`,
+        not the request session - safe to consume from a StreamingResponse.
+
+        Usage:
+            async for category in repository.stream():
+                ...
+        """
+        stmt = (
+            self._entity_select()
+            .order_by(*self._keyset_columns())
+            .execution_options(yield_per=fetch_size)
+        )
+        try:
+            async with self.uow.stream_session() as session:
+                result = await session.stream_scalars(stmt)
+                async for model in result:
+                    yield self.model_to_entity(model)
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error streaming {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def stream_projection(
+            self,
+            columns: Sequence[Any],
+            row_factory: Callable[..., RowType],
+            fetch_size: int = settings.DB_STREAM_FETCH_SIZE,
+            joins: Sequence[Any] = (),
+    ) -> AsyncIterator[RowType]:
+        """
+        `stream` of the given columns only - rows built like `list_projection`
+
+        No ORM models and no identity map - the cheapest way to export a table.
+        """
+        stmt = select(*columns).select_from(self.model_class)
+        for target in joins:
+            stmt = stmt.join(target)
+        stmt = stmt.order_by(*self._keyset_columns()).execution_options(yield_per=fetch_size)
+        try:
+            async with self.uow.stream_session() as session:
+                result = await session.stream(stmt)
+                async for row in result:
+                    yield row_factory(*row)
+        except Exception as e:
+            raise InfrastructureException(
+                f"Error streaming {self.model_class.__name__}",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
@@ -0,0 +1,207 @@
+import inspect
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+from uuid import UUID
+
+from core.settings import settings
+from infrastructure.cache import (
+    CacheBackend,
+    CacheEntry,
+    NullCacheBackend,
+    content_version,
+    entity_key,
+    evict,
+    notify_invalidation,
+    version_key,
+)
+from infrastructure.persistence.routing import on_primary
+from utils.single_flight import SingleFlight
+from utils.uuid7 import uuid7
+
+# Process-wide - concurrent misses of one key (any request) run one query
+cache_flights: SingleFlight[Optional[CacheEntry]] = SingleFlight()
+
+
+class CachedRepositoryMixin:
+    """
+    Read-through cache in front of a BaseRepository subclass
+
+    `get_by_uuid` and `list` answer from `cache` when they can and fill it on
+    a miss. Writes (create / update / delete and their *_many variants)
+    invalidate automatically:
+        - `{table}:uuid:{uuid}` - the entity, deleted by uuid
+        - `{table}:{version}:list:...` - every page; writes replace the
+          table's version token, so all cached pages become unreachable at once
+
+    Invalidation happens right away and once more after the unit of work
+    commits. Other nodes evict on the NOTIFY sent in the same transaction
+    (CacheInvalidationListener). After its first write the repository
+    (request) bypasses the cache: uncommitted rows are never cached.
+
+    Misses are filled from the primary, never a read replica - a reader
+    after the post-commit eviction can't cache a lagging replica's old row.
+    One race remains: a reader that queried the primary before the commit
+    and stores its row after the post-commit eviction keeps that row until
+    the next write or the TTL (CACHE_TTL) - keep the TTL short for data that
+    must never be stale.
+
+    `version` answers from the cache too (HTTP ETags): the table's list
+    version token, or the content hash of the cached entity - the database
+    is queried only to fill a miss.
+
+    Misses of one key are coalesced (single-flight): concurrent requests for
+    the same cold id wait for one query. Entries are refreshed early with
+    XFetch (CACHE_XFETCH_BETA), so expiry doesn't stampede the database either.
+
+    Usage:
+        class CachedTagRepositoryImpl(CachedRepositoryMixin, TagRepositoryImpl):
+            @inject
+            def __init__(self, uow: SqlAlchemyUnitOfWork, cache: CacheBackend):
+                super().__init__(uow=uow)
+                self.cache = cache
+
+    IMPORTANT: Mixin birinchi turishi kerak (MRO) - u repository metodlarini
+    super() orqali o'rab oladi.
+    """
+
+    cache: CacheBackend
+    cache_ttl: float = settings.CACHE_TTL
+    _cache_bypass: bool = False
+
+    @property
+    def cache_namespace(self) -> str:
+        namespace: str = self.model_class.__tablename__  # type: ignore[attr-defined]
+        return namespace
+
+    def _entity_key(self, entity_id: Any) -> str:
+        return entity_key(self.cache_namespace, entity_id)
+
+    @property
+    def _version_key(self) -> str:
+        return version_key(self.cache_namespace)
+
+    async def _list_version(self) -> str:
+        version = await self.cache.get(self._version_key)
+        if version is None:
+            # Never reused - a lost / evicted version can't resurrect old pages
+            version = uuid7().hex
+            await self.cache.set(self._version_key, version, ttl=None)
+        return version
+
+    def _list_key(self, version: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        # Same page asked positionally or by keyword - same key
+        bound = inspect.signature(super().list).bind(*args, **kwargs)  # type: ignore[misc]
+        bound.apply_defaults()
+        params = ",".join(f"{name}={value!r}" for name, value in bound.arguments.items())
+        return f"{self.cache_namespace}:{version}:list:{params}"
+
+    async def _read_through(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        entry = await self._read_through_entry(key, load)
+        return None if entry is None else entry.value
+
+    async def _read_through_entry(self, key: str, load: Callable[[], Awaitable[Any]]) -> Optional[CacheEntry]:
+        entry = await self.cache.get(key)
+        if isinstance(entry, CacheEntry):
+            if not entry.refresh_due(settings.CACHE_XFETCH_BETA):
+                self.cache.stats.hit(self.cache_namespace)
+                return entry
+            self.cache.stats.early_refresh(self.cache_namespace)
+        else:
+            self.cache.stats.miss(self.cache_namespace)
+        return await cache_flights.do(key, lambda: self._load(key, load))
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[Any]]) -> Optional[CacheEntry]:
+        started = time.perf_counter()
+        with on_primary():
+            value = await load()
+        if value is None:
+            return None
+        entry = CacheEntry(
+            value,
+            time.perf_counter() - started,
+            time.time() + self.cache_ttl,
+            content_version(value),
+        )
+        await self.cache.set(key, entry, self.cache_ttl)
+        return entry
+
+    async def get_by_uuid(self, entity_id: UUID) -> Optional[Any]:
+        if self._cache_bypass:
+            return await super().get_by_uuid(entity_id)  # type: ignore[misc]
+        return await self._read_through(
+            self._entity_key(entity_id),
+            lambda: super(CachedRepositoryMixin, self).get_by_uuid(entity_id),  # type: ignore[misc]
+        )
+
+    async def list(self, *args: Any, **kwargs: Any) -> Any:
+        if self._cache_bypass:
+            return await super().list(*args, **kwargs)  # type: ignore[misc]
+        return await self._read_through(
+            self._list_key(await self._list_version(), args, kwargs),
+            lambda: super(CachedRepositoryMixin, self).list(*args, **kwargs),  # type: ignore[misc]
+        )
+
+    async def version(self, entity_id: Optional[UUID] = None) -> Optional[str]:
+        """
+        Change marker for ETags, from the cache
+
+        Without an id - the list version token (replaced by every write, so
+        every page changes with it). With an id - the content hash of the
+        cached entity, loaded like `get_by_uuid` on a miss; None if missing.
+        Caching off (or after a write) - BaseRepository.version.
+
+        IMPORTANT: memory backend da har node o'z tokeniga ega - boshqa node ga
+        tushgan client 304 o'rniga 200 oladi (eskirgan emas). Redis da umumiy.
+        """
+        if self._cache_bypass or isinstance(self.cache, NullCacheBackend):
+            version: Optional[str] = await super().version(entity_id)  # type: ignore[misc]
+            return version
+        if entity_id is None:
+            return await self._list_version()
+        entry = await self._read_through_entry(
+            self._entity_key(entity_id),
+            lambda: super(CachedRepositoryMixin, self).get_by_uuid(entity_id),  # type: ignore[misc]
+        )
+        # Entries cached before versions existed have none - the route hashes the body instead
+        entry_version: Optional[str] = getattr(entry, "version", None)
+        return entry_version or None
+
+    async def evict(self, entity_ids: Sequence[Any] = ()) -> None:
+        """Drop the cached entities and every cached page of the table"""
+        await evict(self.cache, self.cache_namespace, entity_ids)
+
+    async def _invalidate(self, entity_ids: Sequence[Any] = ()) -> None:
+        self._cache_bypass = True
+        await self.evict(entity_ids)
+        await notify_invalidation(self.db, self.cache_namespace, entity_ids)  # type: ignore[attr-defined]
+        self.uow.after_commit(lambda: self.evict(entity_ids))  # type: ignore[attr-defined]
+
+    async def create(self, entity: Any) -> Any:
+        created = await super().create(entity)  # type: ignore[misc]
+        await self._invalidate()
+        return created
+
+    async def update(self, entity_id: UUID, entity: Any) -> Any:
+        updated = await super().update(entity_id, entity)  # type: ignore[misc]
+        await self._invalidate([entity_id])
+        return updated
+
+    async def delete(self, entity_id: UUID) -> bool:
+        deleted: bool = await super().delete(entity_id)  # type: ignore[misc]
+        await self._invalidate([entity_id])
+        return deleted
+
+    async def create_many(self, entities: Sequence[Any]) -> List[Any]:
+        created: List[Any] = await super().create_many(entities)  # type: ignore[misc]
+        await self._invalidate()
+        return created
+
+    async def upsert_many(self, *args: Any, **kwargs: Any) -> List[Any]:
+        upserted: List[Any] = await super().upsert_many(*args, **kwargs)  # type: ignore[misc]
+        await self._invalidate([entity.uuid for entity in upserted])
+        return upserted
+
+    async def delete_many(self, entity_ids: Sequence[UUID]) -> int:
+        deleted: int = await super().delete_many(entity_ids)  # type: ignore[misc]
+        await self._invalidate(entity_ids)
+        return deleted
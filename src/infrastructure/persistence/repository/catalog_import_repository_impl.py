@@ -0,0 +1,245 @@
+import json
+from typing import Any, Sequence
+
+from injector import inject
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.exceptions import InfrastructureException
+from core.response import ErrorCode
+from core.settings import settings
+from domain.entity import ImportErrorEntity, ImportResultEntity, ImportRowEntity
+from domain.repository import CatalogImportRepository
+from infrastructure.cache import notify_invalidation
+from infrastructure.persistence.models import CategoryModel, ProductModel, TagModel
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from utils.uuid7 import uuid7
+from .count_strategy import count_cache
+
+# Temporary staging tables - per connection, dropped with the transaction
+STAGING_DDL = (
+    """
+    CREATE TEMP TABLE import_products (
+        line integer NOT NULL,
+        uuid uuid NOT NULL,
+        name jsonb NOT NULL,
+        description jsonb NOT NULL,
+        price double precision NOT NULL,
+        stock integer NOT NULL,
+        category text NOT NULL,
+        tags text[] NOT NULL
+    ) ON COMMIT DROP
+    """,
+    "CREATE TEMP TABLE import_categories (key text PRIMARY KEY, uuid uuid NOT NULL, name jsonb NOT NULL) ON COMMIT DROP",
+    "CREATE TEMP TABLE import_tags (key text PRIMARY KEY, uuid uuid NOT NULL, name jsonb NOT NULL) ON COMMIT DROP",
+)
+PRODUCT_COLUMNS = ("line", "uuid", "name", "description", "price", "stock", "category", "tags")
+NAMED_COLUMNS = ("key", "uuid", "name")
+
+# Imports of one database never interleave - two of them could both create the same category
+IMPORT_LOCK_ID = 0x1A9047
+
+# Last row of a uuid wins
+SUPERSEDED_SQL = """
+    DELETE FROM import_products a USING import_products b
+    WHERE a.uuid = b.uuid AND a.line < b.line
+    RETURNING a.line
+"""
+
+# Existing categories / tags keep their uuid, new locales of their name are added.
+# Matched with @> - the name GIN index, not a seq scan; of duplicate names the oldest wins.
+# (table, resolve existing, insert / merge - returns the uuids it wrote)
+NAMED_MERGE_SQL = (
+    (
+        "categories",
+        """
+        UPDATE import_categories s SET uuid = m.uuid
+        FROM (
+            SELECT DISTINCT ON (i.key) i.key, c.uuid
+            FROM import_categories i
+            JOIN categories c ON c.name @> jsonb_build_object(CAST(:locale AS text), i.key)
+            ORDER BY i.key, c.created_at, c.uuid
+        ) m
+        WHERE m.key = s.key
+        """,
+        """
+        INSERT INTO categories (uuid, name, description)
+        SELECT uuid, name, '{}'::jsonb FROM import_categories
+        ON CONFLICT (uuid) DO UPDATE SET name = categories.name || EXCLUDED.name
+        WHERE NOT categories.name @> EXCLUDED.name
+        RETURNING uuid
+        """,
+    ),
+    (
+        "tags",
+        """
+        UPDATE import_tags s SET uuid = m.uuid
+        FROM (
+            SELECT DISTINCT ON (i.key) i.key, t.uuid
+            FROM import_tags i
+            JOIN tags t ON t.name @> jsonb_build_object(CAST(:locale AS text), i.key)
+            ORDER BY i.key, t.created_at, t.uuid
+        ) m
+        WHERE m.key = s.key
+        """,
+        """
+        INSERT INTO tags (uuid, name)
+        SELECT uuid, name FROM import_tags
+        ON CONFLICT (uuid) DO UPDATE SET name = tags.name || EXCLUDED.name
+        WHERE NOT tags.name @> EXCLUDED.name
+        RETURNING uuid
+        """,
+    ),
+)
+
+# (xmax = 0) - the row was inserted, not updated
+UPSERT_PRODUCTS_SQL = """
+    WITH upserted AS (
+        INSERT INTO products (uuid, name, description, price, stock, category_id)
+        SELECT p.uuid, p.name, p.description, p.price, p.stock, c.uuid
+        FROM import_products p JOIN import_categories c ON c.key = p.category
+        ON CONFLICT (uuid) DO UPDATE SET
+            name = EXCLUDED.name,
+            description = EXCLUDED.description,
+            price = EXCLUDED.price,
+            stock = EXCLUDED.stock,
+            category_id = EXCLUDED.category_id
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted
+"""
+
+# Tags of an imported product are replaced by the feed's
+REPLACE_TAGS_SQL = (
+    """
+    DELETE FROM product_tag pt USING import_products p
+    WHERE pt.product_id = p.uuid
+    """,
+    """
+    INSERT INTO product_tag (product_id, tag_id)
+    SELECT DISTINCT p.uuid, t.uuid
+    FROM import_products p
+    CROSS JOIN LATERAL unnest(p.tags) AS k(key)
+    JOIN import_tags t ON t.key = k.key
+    """,
+)
+
+
+class CatalogImportRepositoryImpl(CatalogImportRepository):
+    """
+    COPY into temporary staging tables, then a handful of set-based statements
+
+    stage() sends product rows with asyncpg `copy_records_to_table` (binary
+    COPY - no per-row INSERT, no parameter limit). Categories and tags repeat
+    on every row, so they are deduplicated here and copied once by merge().
+    merge() resolves existing categories / tags by their default locale name,
+    upserts products by uuid and replaces their product_tag rows - one
+    statement per table, whatever the number of rows.
+
+    IMPORTANT: One instance per import (request scoped) - it keeps the
+    categories and tags seen so far until merge().
+    """
+
+    @inject
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        self.uow = uow
+        self._staged = False
+        self._categories: dict[str, dict[str, str]] = {}
+        self._tags: dict[str, dict[str, str]] = {}
+
+    @property
+    def db(self) -> AsyncSession:
+        return self.uow.session
+
+    @staticmethod
+    def _key(name: dict[str, str]) -> str:
+        return name[settings.LANGUAGES[0]]
+
+    def _remember(self, seen: dict[str, dict[str, str]], name: dict[str, str]) -> str:
+        key = self._key(name)
+        if key in seen:
+            seen[key].update(name)
+        else:
+            seen[key] = dict(name)
+        return key
+
+    async def _copy(self, table: str, records: list[tuple[Any, ...]], columns: Sequence[str]) -> None:
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        # asyncpg connection - jsonb values go as JSON text, its codec encodes them
+        driver_connection: Any = raw_connection.driver_connection
+        await driver_connection.copy_records_to_table(table, records=records, columns=columns)
+
+    async def stage(self, rows: Sequence[ImportRowEntity]) -> None:
+        try:
+            if not self._staged:
+                for statement in STAGING_DDL:
+                    await self.db.execute(text(statement))
+                self._staged = True
+
+            records = [
+                (
+                    row.line,
+                    row.uuid,
+                    json.dumps(row.name, ensure_ascii=False),
+                    json.dumps(row.description, ensure_ascii=False),
+                    row.price,
+                    row.stock,
+                    self._remember(self._categories, row.category),
+                    [self._remember(self._tags, tag) for tag in row.tags],
+                )
+                for row in rows
+            ]
+            if records:
+                await self._copy("import_products", records, PRODUCT_COLUMNS)
+        except Exception as e:
+            raise InfrastructureException(
+                "Error staging catalogue import",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def merge(self) -> ImportResultEntity:
+        result = ImportResultEntity()
+        if not self._staged:
+            return result
+
+        try:
+            await self.db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": IMPORT_LOCK_ID})
+            for table, seen in (("import_categories", self._categories), ("import_tags", self._tags)):
+                if seen:
+                    await self._copy(
+                        table,
+                        [(key, uuid7(), json.dumps(name, ensure_ascii=False)) for key, name in seen.items()],
+                        NAMED_COLUMNS,
+                    )
+
+            duplicates = await self.db.execute(text(SUPERSEDED_SQL))
+            result.errors = [
+                ImportErrorEntity(line=line, message="Superseded by a later row with the same uuid")
+                for line in sorted(duplicates.scalars())
+            ]
+            # Temporary tables are never auto-analyzed - without statistics the joins below plan badly
+            await self.db.execute(text("ANALYZE import_products"))
+            for table, resolve, merge in NAMED_MERGE_SQL:
+                await self.db.execute(text(resolve), {"locale": settings.LANGUAGES[0]})
+                written = (await self.db.execute(text(merge))).scalars().all()
+                if written:
+                    # Categories / tags are cached - every node evicts the written ones at commit
+                    await notify_invalidation(self.db, table, written)
+            result.created, result.updated = (await self.db.execute(text(UPSERT_PRODUCTS_SQL))).one()
+            for statement in REPLACE_TAGS_SQL:
+                await self.db.execute(text(statement))
+        except Exception as e:
+            raise InfrastructureException(
+                "Error merging catalogue import",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+        for model in (CategoryModel, TagModel, ProductModel):
+            count_cache.invalidate(model.__tablename__)
+        self._staged = False
+        self._categories.clear()
+        self._tags.clear()
+        return result
@@ -1,21 +1,87 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
 
-from domain.entity import CategoryEntity
+from injector import inject
+
+from domain.entity import CategoryEntity, PagingEntity
 from domain.repository import CategoryRepository
+from infrastructure.cache import CacheBackend
+from infrastructure.persistence.localized import localized
 from infrastructure.persistence.mappers import category_entity_to_model, category_model_to_entity
 from infrastructure.persistence.models import CategoryModel
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from .base_repository import BaseRepository
-from injector import inject
+from .cached_repository import CachedRepositoryMixin
+from .count_strategy import CountStrategy
 
 
 class CategoryRepositoryImpl(BaseRepository[CategoryModel, CategoryEntity], CategoryRepository):
+    count_strategy = CountStrategy.WINDOW
 
     @inject
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session=db_session, model_class=CategoryModel)
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=CategoryModel)
 
     def model_to_entity(self, model: CategoryModel) -> CategoryEntity:
         return category_model_to_entity(model)
 
     def entity_to_model(self, entity: CategoryEntity) -> CategoryModel:
         return category_entity_to_model(entity)
+
+    async def list(
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+            lang: Optional[str] = None,
+    ) -> PagingEntity[CategoryEntity]:
+        """
+        Category list - column projection, entities built straight from the rows
+
+        With `lang` name and description are that locale only (`->>` in SQL).
+        """
+        return await self.list_projection(
+            (
+                CategoryModel.uuid,
+                localized(CategoryModel.name, lang),
+                localized(CategoryModel.description, lang),
+            ),
+            CategoryEntity,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            created_after=created_after,
+            created_before=created_before,
+        )
+
+    async def search(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> PagingEntity[CategoryEntity]:
+        """Ranked full-text search, name and description in `lang` only"""
+        return await self.search_projection(
+            (
+                CategoryModel.uuid,
+                localized(CategoryModel.name, lang),
+                localized(CategoryModel.description, lang),
+            ),
+            CategoryEntity,
+            query=query,
+            locale=lang,
+            limit=limit,
+            cursor=cursor,
+        )
+
+
+class CachedCategoryRepositoryImpl(CachedRepositoryMixin, CategoryRepositoryImpl):
+    """Categories change a few times a day - detail and list pages are served from the cache"""
+
+    @inject
+    def __init__(self, uow: SqlAlchemyUnitOfWork, cache: CacheBackend):
+        super().__init__(uow=uow)
+        self.cache = cache
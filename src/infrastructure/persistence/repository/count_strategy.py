@@ -0,0 +1,45 @@
+import enum
+import time
+from typing import Optional
+
+
+class CountStrategy(str, enum.Enum):
+    """
+    How BaseRepository.list computes the `total` of a page
+
+    EXACT:    separate SELECT count(*) (full scan on Postgres)
+    WINDOW:   count(*) OVER () in the page query itself - exact, one round trip.
+              Keyset pages and pages past the end fall back to CACHED.
+    ESTIMATE: planner estimate from pg_class.reltuples (estimated)
+    CACHED:   exact count cached per table for a TTL (estimated while cached)
+    """
+    EXACT = "exact"
+    WINDOW = "window"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+
+class CountCache:
+    """Process-wide TTL cache of exact table counts"""
+
+    def __init__(self) -> None:
+        self._items: dict[str, tuple[float, int]] = {}
+
+    def get(self, table: str) -> Optional[int]:
+        item = self._items.get(table)
+        if item is None:
+            return None
+        expires_at, total = item
+        if expires_at < time.monotonic():
+            self._items.pop(table, None)
+            return None
+        return total
+
+    def set(self, table: str, total: int, ttl: float) -> None:
+        self._items[table] = (time.monotonic() + ttl, total)
+
+    def invalidate(self, table: str) -> None:
+        self._items.pop(table, None)
+
+
+count_cache = CountCache()
@@ -0,0 +1,190 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional, Sequence
+from uuid import UUID
+
+from injector import inject
+from sqlalchemy import select, insert, update, delete, Select
+from sqlalchemy.orm import joinedload, selectinload
+
+from core.exceptions import EntityNotFoundException, InfrastructureException
+from core.response import ErrorCode
+from core.settings import settings
+from domain.entity import PagingEntity, ProductCreateEntity, ProductDetailEntity, ProductEntity
+from domain.repository import ProductRepository
+from infrastructure.persistence.localized import localized
+from infrastructure.persistence.mappers import (
+    product_create_entity_to_model,
+    product_model_to_detail_entity,
+)
+from infrastructure.persistence.models import CategoryModel, ProductImageModel, ProductModel
+from infrastructure.persistence.models.product_model import product_tag
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from .base_repository import BaseRepository
+from .count_strategy import count_cache
+
+
+class ProductRepositoryImpl(BaseRepository[ProductModel, ProductDetailEntity], ProductRepository):
+    """
+    Products with explicit eager loading - no lazy loads under async
+
+    Detail (get_by_id / get_by_uuid / get_many_by_uuid) is always 3 queries,
+    however many products, tags or images:
+        1. products JOIN categories
+        2. tags       (selectinload, IN of product ids)
+        3. images     (selectinload, JOIN upload_files)
+    List is a column projection with the category name joined (+ the total count).
+
+    Writes take a ProductCreateEntity and return the id, lists return list
+    items - not the detail entity of BaseRepository (type: ignore[override]).
+    """
+
+    @inject
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=ProductModel)
+
+    def model_to_entity(self, model: ProductModel) -> ProductDetailEntity:
+        return product_model_to_detail_entity(model)
+
+    def entity_to_model(self, entity: ProductCreateEntity) -> ProductModel:  # type: ignore[override]
+        return product_create_entity_to_model(entity)
+
+    def _entity_select(self) -> Select[Any]:
+        return (
+            select(ProductModel)
+            .options(
+                joinedload(ProductModel.category),
+                selectinload(ProductModel.tags),
+                selectinload(ProductModel.images).joinedload(ProductImageModel.image),
+            )
+            # Relationship collections of products already in the session are stale after update()
+            .execution_options(populate_existing=True)
+        )
+
+    async def get_by_id(self, product_id: UUID) -> Optional[ProductDetailEntity]:
+        return await self.get_by_uuid(product_id)
+
+    async def list(  # type: ignore[override]
+            self,
+            skip: int = 1,
+            limit: int = 10,
+            cursor: Optional[str] = None,
+            created_after: Optional[datetime] = None,
+            created_before: Optional[datetime] = None,
+            lang: Optional[str] = None,
+    ) -> PagingEntity[ProductEntity]:
+        """
+        Product list items - 4 columns with the category name joined, no models
+
+        With `lang` the names are that locale only (`->>` in SQL).
+        """
+        return await self.list_projection(
+            (
+                ProductModel.uuid,
+                localized(ProductModel.name, lang),
+                localized(CategoryModel.name, lang),
+                ProductModel.price,
+            ),
+            ProductEntity,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            created_after=created_after,
+            created_before=created_before,
+            joins=(ProductModel.category,),
+        )
+
+    async def stream(  # type: ignore[override]
+            self,
+            fetch_size: int = settings.DB_STREAM_FETCH_SIZE,
+    ) -> AsyncIterator[ProductEntity]:
+        """Every product as a list item (all locales) - for exports"""
+        async for product in self.stream_projection(
+            (ProductModel.uuid, ProductModel.name, CategoryModel.name, ProductModel.price),
+            ProductEntity,
+            fetch_size=fetch_size,
+            joins=(ProductModel.category,),
+        ):
+            yield product
+
+    async def search(
+            self,
+            query: str,
+            lang: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+    ) -> PagingEntity[ProductEntity]:
+        """Ranked full-text search, same columns as the list in `lang` only"""
+        return await self.search_projection(
+            (
+                ProductModel.uuid,
+                localized(ProductModel.name, lang),
+                localized(CategoryModel.name, lang),
+                ProductModel.price,
+            ),
+            ProductEntity,
+            query=query,
+            locale=lang,
+            limit=limit,
+            cursor=cursor,
+            joins=(ProductModel.category,),
+        )
+
+    async def create(self, product: ProductCreateEntity) -> UUID:  # type: ignore[override]
+        """Product, its tags and images - one INSERT each"""
+        try:
+            result = await self.db.execute(
+                insert(ProductModel)
+                .values(**self._model_to_row(self.entity_to_model(product)))
+                .returning(ProductModel.uuid)
+            )
+            product_id = result.scalar_one()
+            await self._insert_relations(product_id, product.tags, product.images)
+
+            count_cache.invalidate(ProductModel.__tablename__)
+            self.loader.clear()
+            return product_id
+        except Exception as e:
+            raise InfrastructureException(
+                "Error creating ProductModel",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def update(self, product_id: UUID, product: ProductCreateEntity) -> UUID:  # type: ignore[override]
+        """Update columns and replace tags and images - a fixed number of statements"""
+        try:
+            result = await self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.uuid == product_id)
+                .values(**self._model_to_row(self.entity_to_model(product)))
+                .returning(ProductModel.uuid)
+            )
+            if result.scalar_one_or_none() is None:
+                raise EntityNotFoundException(ProductModel.__name__, str(product_id))
+
+            await self.db.execute(delete(product_tag).where(product_tag.c.product_id == product_id))
+            await self.db.execute(delete(ProductImageModel).where(ProductImageModel.product_id == product_id))
+            await self._insert_relations(product_id, product.tags, product.images)
+
+            self.loader.clear()
+            return product_id
+        except EntityNotFoundException:
+            raise
+        except Exception as e:
+            raise InfrastructureException(
+                "Error updating ProductModel",
+                ErrorCode.DATABASE_ERROR,
+                cause=e
+            )
+
+    async def _insert_relations(self, product_id: UUID, tag_ids: Sequence[UUID], image_ids: Sequence[UUID]) -> None:
+        if tag_ids:
+            await self.db.execute(
+                insert(product_tag),
+                [{"product_id": product_id, "tag_id": tag_id} for tag_id in dict.fromkeys(tag_ids)],
+            )
+        if image_ids:
+            await self.db.execute(
+                insert(ProductImageModel),
+                [{"product_id": product_id, "image_id": image_id} for image_id in image_ids],
+            )
@@ -1,20 +1,33 @@
 from injector import inject
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.entity import TagEntity
 from domain.repository import TagRepository
+from infrastructure.cache import CacheBackend
 from infrastructure.persistence.models import TagModel
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from .base_repository import BaseRepository
+from .cached_repository import CachedRepositoryMixin
+from .count_strategy import CountStrategy
 
 
 class TagRepositoryImpl(BaseRepository[TagModel, TagEntity], TagRepository):
+    count_strategy = CountStrategy.ESTIMATE
 
     @inject
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session=db_session, model_class=TagModel)
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=TagModel)
 
     def model_to_entity(self, model: TagModel) -> TagEntity:
         return TagEntity(uuid=model.uuid, name=model.name)
 
     def entity_to_model(self, entity: TagEntity) -> TagModel:
-        return TagModel(name=entity.name)
+        return TagModel(uuid=entity.uuid, name=entity.name)
+
+
+class CachedTagRepositoryImpl(CachedRepositoryMixin, TagRepositoryImpl):
+    """Tags are read on every product page and rarely written - served from the cache"""
+
+    @inject
+    def __init__(self, uow: SqlAlchemyUnitOfWork, cache: CacheBackend):
+        super().__init__(uow=uow)
+        self.cache = cache
@@ -2,21 +2,22 @@ import os
 from uuid import UUID
 
 from injector import inject
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 
 from core.exceptions import InfrastructureException
 from core.response import ErrorCode
 from core.settings import BASE_DIR
 from domain.repository import UploadFileRepository
 from infrastructure.persistence.models import UploadModel
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from .base_repository import BaseRepository, EntityType, ModelType
 
 
 class UploadFileRepositoryImpl(BaseRepository, UploadFileRepository):
 
     @inject
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session=db_session, model_class=UploadModel)
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=UploadModel)
 
     def model_to_entity(self, model: ModelType) -> EntityType:
         ...
@@ -33,13 +34,12 @@ class UploadFileRepositoryImpl(BaseRepository, UploadFileRepository):
             with open(file_path, "wb") as f:
                 f.write(file)
 
-            upload_model = UploadModel(url=file_path)
-            self.db.add(upload_model)
-            await self.db.commit()
-            await self.db.refresh(upload_model)
-            return upload_model.uuid
+            result = await self.db.execute(
+                insert(UploadModel).values(url=file_path).returning(UploadModel.uuid)
+            )
+            upload_uuid = result.scalar_one()
+            return upload_uuid
         except Exception as e:
-            await self.db.rollback()
             raise InfrastructureException(
                 f"Error uploading file {filename}",
                 ErrorCode.DATABASE_ERROR,
@@ -1,21 +1,50 @@
+from typing import AsyncIterator
+from uuid import UUID
+
 from injector import inject
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 
+from core.settings import settings
 from domain.entity import UserProfileEntity
 from domain.repository import UserProfileRepository
 from infrastructure.persistence.mappers import profile_model_to_entity
 from infrastructure.persistence.models import UserModel
+from infrastructure.persistence.routing import on_primary
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from .base_repository import BaseRepository, EntityType, ModelType
 
 
 class UserProfileRepositoryImpl(BaseRepository[UserModel, UserProfileEntity], UserProfileRepository):
 
     @inject
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session=db_session, model_class=UserModel)
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=UserModel)
 
-    def model_to_entity(self, model: ModelType) -> EntityType:
+    def model_to_entity(self, model: UserModel) -> UserProfileEntity:
         return profile_model_to_entity(model)
 
     def entity_to_model(self, entity: EntityType) -> ModelType:
         pass
+
+    async def is_superuser(self, uuid: UUID) -> bool:
+        """Permission check - always the primary, a lagging replica would keep a demoted user's rights"""
+        with on_primary():
+            result = await self.db.execute(select(UserModel.is_superuser).where(UserModel.uuid == uuid))
+        return bool(result.scalar_one_or_none())
+
+    async def stream(self, fetch_size: int = settings.DB_STREAM_FETCH_SIZE) -> AsyncIterator[UserProfileEntity]:
+        """Every user's profile columns - never the password hash"""
+        async for profile in self.stream_projection(
+            (
+                UserModel.uuid,
+                UserModel.first_name,
+                UserModel.last_name,
+                UserModel.username,
+                UserModel.email,
+                UserModel.phone_number,
+                UserModel.date_joined,
+            ),
+            UserProfileEntity,
+            fetch_size=fetch_size,
+        ):
+            yield profile
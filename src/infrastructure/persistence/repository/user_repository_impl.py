@@ -2,8 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from injector import inject
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert
 
 from core.exceptions import InfrastructureException
 from core.response import ErrorCode
@@ -11,14 +10,16 @@ from domain.entity import UserEntity
 from domain.repository import UserRepository
 from infrastructure.persistence.mappers import user_model_to_entity, user_entity_to_model
 from infrastructure.persistence.models import UserModel
+from infrastructure.persistence.routing import read_only
+from infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from .base_repository import BaseRepository
 
 
 class UserRepositoryImpl(BaseRepository[UserModel, UserEntity], UserRepository):
 
     @inject
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session=db_session, model_class=UserModel)
+    def __init__(self, uow: SqlAlchemyUnitOfWork):
+        super().__init__(uow=uow, model_class=UserModel)
 
     def model_to_entity(self, model: UserModel) -> UserEntity:
         return user_model_to_entity(model)
@@ -26,9 +27,11 @@ class UserRepositoryImpl(BaseRepository[UserModel, UserEntity], UserRepository):
     def entity_to_model(self, entity: UserEntity) -> UserModel:
         return user_entity_to_model(entity)
 
+    @read_only
     async def get_by_username(self, username: str) -> Optional[UserEntity]:
         return await self._get_by_filter(UserModel.username == username)
 
+    @read_only
     async def get_by_email(self, email: str) -> Optional[UserEntity]:
         return await self._get_by_filter(UserModel.email == email)
 
@@ -49,22 +52,21 @@ class UserRepositoryImpl(BaseRepository[UserModel, UserEntity], UserRepository):
 
     async def save(self, user: UserEntity) -> UUID:
         """
-        Save user entity and return the created user
+        Save user entity and return the created user id
 
-        IMPORTANT: Commit va rollback FastAPI dependency (get_db) tomonidan
-        avtomatik bajariladi. Bu yerda faqat flush qilamiz.
+        Single INSERT ... RETURNING uuid round trip - no refresh SELECT.
         """
         try:
-            user_model = user_entity_to_model(user)
-            self.db.add(user_model)
-            await self.db.commit()
-            await self.db.refresh(user_model)
-            return user_model.uuid
+            result = await self.db.execute(
+                insert(UserModel)
+                .values(**self._entity_to_row(user))
+                .returning(UserModel.uuid)
+            )
+            user_uuid = result.scalar_one()
+            return user_uuid
         except InfrastructureException:
-            await self.db.rollback()
             raise
         except Exception as e:
-            await self.db.rollback()
             raise InfrastructureException(
                 f"Error saving user with email {user.email}",
                 ErrorCode.DATABASE_ERROR,
@@ -0,0 +1,94 @@
+import functools
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional, Sequence, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Session.info keys
+REPLICA_KEY = "replica_engine"
+STICKY_PRIMARY_KEY = "sticky_primary"
+# Every SELECT of the session is read-only (dedicated streaming sessions)
+READ_ONLY_KEY = "read_only"
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+_on_primary: ContextVar[bool] = ContextVar("on_primary", default=False)
+
+
+def read_only(func: F) -> F:
+    """
+    Mark a repository method as read-only - its SELECTs may go to a read replica
+
+    Usage:
+        @read_only
+        async def get_by_email(self, email: str) -> Optional[UserEntity]: ...
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def on_primary() -> Iterator[None]:
+    """
+    Every SELECT in the block goes to the primary, @read_only methods included
+
+    For reads whose result outlives the request (cache fills) - a lagging
+    replica's row would be kept long after the primary changed.
+
+    Usage:
+        with on_primary():
+            category = await repository.get_by_uuid(category_id)
+    """
+    token = _on_primary.set(True)
+    try:
+        yield
+    finally:
+        _on_primary.reset(token)
+
+
+def stick_to_primary(session: Session) -> None:
+    """Send every following statement of this session (the request) to the primary"""
+    session.info[STICKY_PRIMARY_KEY] = True
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read-only SELECTs to a replica and everything else to the primary
+
+    - SELECT inside a @read_only method -> replica (one replica per session),
+      unless inside `on_primary()`
+    - INSERT/UPDATE/DELETE, flush, text() and anything outside @read_only -> primary
+    - After the first write the session sticks to the primary (read-your-writes
+      for the rest of the request)
+    """
+
+    def __init__(self, *args: Any, replicas: Sequence[Engine] = (), **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+
+    def get_bind(self, mapper: Optional[Any] = None, *, clause: Optional[Any] = None, **kw: Any) -> Any:
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if not self.replicas or self.info.get(STICKY_PRIMARY_KEY) or _on_primary.get():
+            return primary
+
+        if self._flushing or getattr(clause, "is_dml", False):
+            stick_to_primary(self)
+            return primary
+
+        if (_read_only.get() or self.info.get(READ_ONLY_KEY)) and getattr(clause, "is_select", False):
+            if REPLICA_KEY not in self.info:
+                self.info[REPLICA_KEY] = random.choice(self.replicas)
+            return self.info[REPLICA_KEY]
+
+        return primary
@@ -0,0 +1,104 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+
+from injector import inject
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.repository import UnitOfWork
+from infrastructure.persistence.db_session import DatabaseSessionManager
+from infrastructure.persistence.routing import READ_ONLY_KEY, stick_to_primary
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """
+    One AsyncSession per request, committed or rolled back once at the end
+
+    IMPORTANT: Repositories never commit themselves - they only execute
+    statements in `session`. The owner of the unit of work (the request scope,
+    see di.request_scope, or a `transaction()` block) decides when to commit.
+    """
+
+    @inject
+    def __init__(self, db_manager: DatabaseSessionManager):
+        self._db_manager = db_manager
+        self._session: Optional[AsyncSession] = None
+        self._transaction_depth = 0
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        """Session is created on first use - requests without queries never touch the pool"""
+        if self._session is None:
+            self._session = self._db_manager.session_factory()
+        return self._session
+
+    async def commit(self) -> None:
+        """Commit pending work, unless a transaction() block is still open"""
+        if self._session is not None and self._transaction_depth == 0:
+            await self._session.commit()
+            callbacks, self._after_commit = self._after_commit, []
+            for callback in callbacks:
+                await callback()
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        if self._session is not None:
+            await self._session.rollback()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run `callback` once the pending work is committed - dropped on rollback
+
+        Usage:
+            uow.after_commit(lambda: cache.delete(key))
+        """
+        self._after_commit.append(callback)
+
+    async def close(self) -> None:
+        """Return the connection to the pool"""
+        self._after_commit.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[None, None]:
+        """
+        Group several repository calls in one transaction
+
+        Usage:
+            async with uow.transaction():
+                await user_repo.get_by_email(...)
+                await user_repo.save(...)
+
+        Nested blocks join the outer one; the outermost block commits on
+        success and rolls back on error. Reads inside the block (and for the
+        rest of the request) go to the primary, never to a replica.
+        """
+        stick_to_primary(self.session.sync_session)
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            await self.rollback()
+            raise
+        self._transaction_depth -= 1
+        await self.commit()
+
+    @asynccontextmanager
+    async def stream_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Separate read-only session for streaming a large result
+
+        IMPORTANT: StreamingResponse body request scope yopilgandan keyin
+        yuboriladi - `session` allaqachon commit/close bo'lgan bo'ladi. Stream
+        o'z session ida, server-side cursor stream tugaguncha (yoki client
+        uzilguncha) shu session ning tranzaksiyasida yashaydi.
+        """
+        session = self._db_manager.session_factory()
+        session.info[READ_ONLY_KEY] = True
+        try:
+            yield session
+        finally:
+            await session.close()
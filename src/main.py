@@ -1,9 +1,14 @@
+from typing import Any
+
+from fastapi import Depends
+
+from presentation.dependencies import require_superuser
 from presentation.urls import app
 from core.settings import settings
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> dict[str, Any]:
     """Health check endpoint"""
     from infrastructure.persistence.db_session import get_db_session_manager
 
@@ -15,3 +20,22 @@ async def health_check():
         "database": "connected" if is_healthy else "disconnected",
         "version": settings.VERSION
     }
+
+
+# Only the liveness probe is public (`/health` prefix) - internal statistics need a superuser
+@app.get("/internal/db-pool", dependencies=[Depends(require_superuser)])
+async def db_pool_stats() -> dict[str, Any]:
+    """Internal: connection pool statistics of the primary and every read replica"""
+    from infrastructure.persistence.db_session import get_db_session_manager
+
+    return {"pools": get_db_session_manager().pool_stats()}
+
+
+@app.get("/internal/cache", dependencies=[Depends(require_superuser)])
+async def cache_stats() -> dict[str, Any]:
+    """Internal: repository cache hits / misses / invalidations per table, coalesced misses"""
+    from infrastructure.cache import get_cache_backend
+    from infrastructure.persistence.repository.cached_repository import cache_flights
+
+    backend = get_cache_backend()
+    return {"backend": backend.name, **backend.stats.snapshot(), "single_flight": cache_flights.snapshot()}
@@ -41,9 +41,22 @@ def makemigrations(message: str) -> None:
 
 
 @cli.command()
-def migrate() -> None:
-    """Applies all Alembic migrations"""
-    command = ["alembic", "upgrade", "head"]
+@click.option(
+    "--lock-timeout",
+    default="5s",
+    show_default=True,
+    help="Give up on a table lock after this long (e.g. 5s, 500ms, 0 - wait forever)",
+)
+def migrate(lock_timeout: str) -> None:
+    """
+    Applies all Alembic migrations
+
+    Every revision runs in its own transaction; CREATE INDEX CONCURRENTLY
+    revisions run outside one, so big tables stay writable while they build.
+    A DDL that can't get its lock within --lock-timeout fails instead of
+    queueing every write behind it - just run migrate again.
+    """
+    command = ["alembic", "-x", f"lock_timeout={lock_timeout}", "upgrade", "head"]
 
     click.echo("🚀 Applying migrations...")
     click.echo(f"📂 Working directory: {MIGRATIONS_DIR}")
@@ -61,6 +74,62 @@ def migrate() -> None:
         sys.exit(1)
 
 
+@cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--format",
+    "import_format",
+    type=click.Choice(["csv", "ndjson"]),
+    default=None,
+    help="Feed format (default: the file extension)",
+)
+@click.option("--chunk-size", default=None, type=int, help="Rows validated and COPYed at a time")
+def import_catalog(path: Path, import_format: str | None, chunk_size: int | None) -> None:
+    """
+    Bulk imports products (and their categories / tags) from a CSV or NDJSON file
+
+    Rows are COPYed into a staging table and merged in one transaction;
+    invalid rows are skipped and listed by line.
+    """
+    import asyncio
+
+    from application.dto import ImportFormat, ImportResultDTO
+    from application.usecases import CatalogImportUseCase
+    from core.settings import settings
+    from di import container, request_context
+    from infrastructure.persistence.db_session import shutdown_db
+
+    import_format = import_format or path.suffix.lstrip(".").lower()
+    if import_format not in ("csv", "ndjson"):
+        click.echo(f"❌ Unknown file type '{path.suffix}', pass --format csv|ndjson", err=True)
+        sys.exit(1)
+
+    async def run() -> ImportResultDTO:
+        try:
+            async with request_context():
+                use_case = container.get(CatalogImportUseCase)
+                with path.open(encoding="utf-8-sig", newline="") as file:
+                    return await use_case.import_file(
+                        file, ImportFormat(import_format), chunk_size or settings.IMPORT_CHUNK_SIZE
+                    )
+        finally:
+            await shutdown_db()
+
+    click.echo(f"📦 Importing {path} ({import_format})...")
+    started = utcnow()
+    result = asyncio.run(run())
+    elapsed = (utcnow() - started).total_seconds()
+
+    for error in result.errors:
+        click.echo(f"  line {error.line}: {error.message}", err=True)
+    if result.failed > len(result.errors):
+        click.echo(f"  ... and {result.failed - len(result.errors)} more", err=True)
+    click.echo(
+        f"✅ {result.rows} rows in {elapsed:.1f}s ({result.rows / max(elapsed, 1e-9):,.0f} rows/s): "
+        f"{result.created} created, {result.updated} updated, {result.failed} failed"
+    )
+
+
 @cli.command()
 def runserver() -> None:
     """Runs the FastAPI development server"""
@@ -1,16 +1,25 @@
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic, HTTPBearer
 
 from core.settings import settings
+from infrastructure.cache import startup_cache, shutdown_cache
 from infrastructure.persistence.db_session import startup_db, shutdown_db
-from presentation.middlewares import auth_middleware, handle_error_middleware
+from presentation.middlewares import (
+    auth_middleware,
+    compression_middleware,
+    handle_error_middleware,
+    http_cache_middleware,
+    query_stats_middleware,
+    request_scope_middleware,
+)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     """
     Application lifecycle manager
     - Startup: Database connection
@@ -19,12 +28,14 @@ async def lifespan(_app: FastAPI):
     # Startup
     print("🚀 Starting application...")
     await startup_db()
+    await startup_cache()
     print("✅ Application started successfully")
 
     yield  # Application is running
 
     # Shutdown
     print("🛑 Shutting down application...")
+    await shutdown_cache()
     await shutdown_db()
     print("✅ Application shutdown complete")
 
@@ -43,6 +54,12 @@ app = FastAPI(
     ]
 )
 
+# Innermost - ETag / 304 of the route's own response
+app.middleware("http")(http_cache_middleware)
+# ETag above is of the identity body - compression wraps it
+app.middleware("http")(compression_middleware)
+# Request scope (use cases, repositories, unit of work) closes before errors are rendered
+app.middleware("http")(request_scope_middleware)
 app.middleware("http")(auth_middleware)
 app.middleware("http")(handle_error_middleware)
 
@@ -54,12 +71,17 @@ app.add_middleware(
     allow_headers=settings.ALLOWED_HEADERS,
 )
 
+# Outermost - times the whole request; N+1 errors in strict mode are not swallowed by the error handler
+app.middleware("http")(query_stats_middleware)
+
 
 @app.on_event("startup")
-async def startup():
+async def startup() -> None:
     await startup_db()
+    await startup_cache()
 
 
 @app.on_event("shutdown")
-async def shutdown():
+async def shutdown() -> None:
+    await shutdown_cache()
     await shutdown_db()
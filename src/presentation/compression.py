@@ -0,0 +1,49 @@
+from typing import Any
+
+from fastapi import Depends, Request
+
+# Text formats worth compressing - everything else (images, archives, PDFs, uploads) already is
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """`Accept-Encoding` allows gzip - listed (or `*`) with a non-zero q"""
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def compression(level: int) -> Any:
+    """
+    Route dependency - gzip level of the route (CompressionMiddleware), 0 turns it off
+
+    Usage:
+        @product_router.get("/export/", dependencies=[compression(settings.COMPRESSION_EXPORT_LEVEL)])
+    """
+    def dependency(request: Request) -> None:
+        request.state.compression_level = level
+
+    return Depends(dependency)
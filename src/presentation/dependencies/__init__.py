@@ -0,0 +1,2 @@
+from .language import *
+from .superuser import *
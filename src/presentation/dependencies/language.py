@@ -0,0 +1,60 @@
+from typing import Optional
+
+from fastapi import Header, Query
+
+from core.exceptions import ValidationException
+from core.settings import settings
+
+
+def _parse_accept_language(header: str) -> Optional[str]:
+    """Best supported locale of an `Accept-Language` header (`uz-UZ,ru;q=0.8,en;q=0.5`)"""
+    ranked: list[tuple[float, int, str]] = []
+    for position, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        language = tag.strip().split("-")[0].lower()
+        if quality > 0 and language in settings.LANGUAGES:
+            ranked.append((-quality, position, language))
+    return min(ranked)[2] if ranked else None
+
+
+def get_language(
+        lang: Optional[str] = Query(None, description="Return localized fields in this locale only"),
+) -> Optional[str]:
+    """
+    Locale of localized fields - `?lang=` only, else None (every locale)
+
+    IMPORTANT: Accept-Language bu yerda hisobga olinmaydi - har brauzer uni
+    yuboradi, `name` / `description` esa `{locale: text}` dan `str` ga aylanib
+    qolardi. Projection faqat so'ralganda.
+
+    Usage:
+        async def list_products(lang: Optional[str] = Depends(get_language)): ...
+    """
+    if lang is not None and lang not in settings.LANGUAGES:
+        raise ValidationException("lang", f"Supported languages: {', '.join(settings.LANGUAGES)}")
+    return lang
+
+
+def get_preferred_language(
+        lang: Optional[str] = Query(None, description="Search / suggest in this locale"),
+        accept_language: Optional[str] = Header(None),
+) -> Optional[str]:
+    """
+    Locale of search and autocomplete - `?lang=`, else `Accept-Language`, else None
+
+    These responses are always in one locale, so the header can pick it.
+
+    Usage:
+        async def search_products(lang: Optional[str] = Depends(get_preferred_language)): ...
+    """
+    if lang is not None:
+        return get_language(lang)
+    if accept_language:
+        return _parse_accept_language(accept_language)
+    return None
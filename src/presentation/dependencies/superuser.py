@@ -0,0 +1,29 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Request
+
+from application.usecases import UserProfileUseCase
+from core.exceptions import ApplicationException
+from core.response import ErrorCode
+from di.fastapi_integration import resolve
+
+
+async def require_superuser(
+        request: Request,
+        use_case: UserProfileUseCase = resolve(UserProfileUseCase),
+) -> UUID:
+    """
+    Authenticated superuser - id of the requester, 403 for everyone else
+
+    IMPORTANT: path AuthenticationMiddleware.PUBLIC_PATHS ga tushmasligi kerak
+    (masalan `/health/...`) - aks holda user_id bo'lmaydi va har doim 401.
+
+    Usage:
+        @app.get("/internal/db-pool", dependencies=[Depends(require_superuser)])
+    """
+    user_id: Optional[UUID] = getattr(request.state, "user_id", None)
+    if user_id is None:
+        raise ApplicationException("User not authenticated", ErrorCode.UNAUTHORIZED)
+    await use_case.ensure_superuser(user_id)
+    return user_id
@@ -0,0 +1,114 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Depends, Request, Response
+
+from core.settings import settings
+
+ETAG_PATTERN = re.compile(r'(?:W/)?("[^"]*")')
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    `Cache-Control` of a route
+
+    max_age 0 is `no-cache` - stored, but revalidated (If-None-Match) before
+    every use. A shared max-age makes the response `public`: a CDN may keep it
+    even though the request was authenticated.
+    """
+    max_age: int = 0
+    shared_max_age: int = 0
+    stale_while_revalidate: int = 0
+    no_store: bool = False
+
+    @property
+    def header(self) -> str:
+        if self.no_store:
+            return "no-store"
+        directives = ["public" if self.shared_max_age else "private"]
+        directives.append(f"max-age={self.max_age}" if self.max_age else "no-cache")
+        if self.shared_max_age:
+            directives.append(f"s-maxage={self.shared_max_age}")
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+# Categories and tags - rarely written, cheap version query
+CATALOG_CACHE = CachePolicy(
+    max_age=settings.HTTP_CACHE_MAX_AGE,
+    shared_max_age=settings.HTTP_CACHE_SHARED_MAX_AGE,
+    stale_while_revalidate=settings.HTTP_CACHE_STALE_WHILE_REVALIDATE,
+)
+# Products - price and stock must be current, always revalidated (body hash ETag)
+PRODUCT_CACHE = CachePolicy()
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag - a hash of the parts (version and request, or the body)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match - weak comparison (RFC 9110): `W/` is ignored, `*` matches anything"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in ETAG_PATTERN.findall(if_none_match)
+
+
+def http_cache(policy: CachePolicy) -> Any:
+    """
+    Route dependency - conditional GET with `policy` (HttpCacheMiddleware)
+
+    Responses get `Cache-Control` and an ETag - the one `not_modified` made,
+    or else a hash of the body.
+
+    Usage:
+        @category_router.get("/list/", dependencies=[http_cache(CATALOG_CACHE)])
+    """
+    def dependency(request: Request) -> None:
+        request.state.cache_policy = policy
+
+    return Depends(dependency)
+
+
+def not_modified(request: Request, version: Optional[str]) -> Optional[Response]:
+    """
+    304 if the client's copy is still `version` - before the body is built
+
+    The ETag is the version plus what else the body depends on (path and
+    query - `?lang=` included). None - build the body, the middleware sends
+    the ETag with it. A missing version (no such row, no cheap version) is
+    never a match - the middleware hashes the body instead.
+
+    IMPORTANT: `version` must change with everything in the body - a row's
+    `updated_at` doesn't cover joined rows (product detail), those routes
+    rely on the body hash. Take it from the cache the body is read from
+    (CachedRepositoryMixin.version) - a database query per request would
+    cost more than the request it saves.
+
+    Usage:
+        unchanged = not_modified(request, await use_case.category_version(category_id))
+        if unchanged is not None:
+            return unchanged
+    """
+    if version is None:
+        return None
+    etag = make_etag(
+        version,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+    )
+    request.state.etag = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304)
+    return None
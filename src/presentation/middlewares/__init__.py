@@ -1,3 +1,17 @@
 from .json_renderer_middleware import json_renderer_middleware
 from .jwt_auth_middleware import auth_middleware
 from .error_middleware import handle_error_middleware
+from .request_scope_middleware import request_scope_middleware
+from .query_stats_middleware import query_stats_middleware
+from .http_cache_middleware import http_cache_middleware
+from .compression_middleware import compression_middleware
+
+__all__ = [
+    "json_renderer_middleware",
+    "auth_middleware",
+    "handle_error_middleware",
+    "request_scope_middleware",
+    "query_stats_middleware",
+    "http_cache_middleware",
+    "compression_middleware",
+]
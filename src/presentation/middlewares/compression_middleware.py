@@ -0,0 +1,85 @@
+import zlib
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import MutableHeaders
+
+from core.settings import settings
+from presentation.compression import accepts_gzip, is_compressible
+
+# zlib window with a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+async def _gzip(head: bytes, rest: AsyncIterator[bytes], level: int) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    # Sync flush per chunk - a streamed export reaches the client as it's read, not at the end
+    yield compressor.compress(head) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    async for chunk in rest:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    gzip of text responses of COMPRESSION_MIN_SIZE bytes and more
+
+    Only when `Accept-Encoding` allows gzip, for text media types (JSON,
+    NDJSON, CSV, ...) not encoded yet - images, archives and other uploads go
+    as they are, so does a `Cache-Control: no-transform` response. Level is
+    COMPRESSION_LEVEL, or the route's own (`compression` dependency).
+
+    Streams are never collected: the first chunks are held only until the
+    threshold is reached (a shorter body goes uncompressed), then every chunk
+    is compressed and sent as it comes. The ETag becomes weak - the bytes
+    differ from the identity body, If-None-Match still matches (weak comparison).
+    """
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        response = await call_next(request)
+        level: int = getattr(request.state, "compression_level", settings.COMPRESSION_LEVEL)
+        if (
+            not level
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or not accepts_gzip(request.headers.get("accept-encoding", ""))
+            or not is_compressible(response.headers.get("content-type", ""))
+            or "content-encoding" in response.headers
+            or "no-transform" in response.headers.get("cache-control", "")
+        ):
+            return response
+
+        content_length = response.headers.get("content-length")
+        if content_length is not None and int(content_length) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        # call_next answers with a streaming response
+        body: AsyncIterator[bytes] = response.body_iterator  # type: ignore[attr-defined]
+        head: list[bytes] = []
+        size = 0
+        async for chunk in body:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= settings.COMPRESSION_MIN_SIZE:
+                break
+        else:
+            # Whole body read, still below the threshold
+            return Response(content=b"".join(head), status_code=response.status_code, headers=response.headers)
+
+        headers = MutableHeaders(raw=list(response.raw_headers))
+        del headers["content-length"]
+        headers["Content-Encoding"] = "gzip"
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        return StreamingResponse(
+            _gzip(b"".join(head), body, level),
+            status_code=response.status_code,
+            headers=headers,
+        )
+
+
+compression_middleware = CompressionMiddleware()
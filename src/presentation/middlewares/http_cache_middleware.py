@@ -0,0 +1,46 @@
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request, Response
+
+from presentation.http_cache import etag_matches, make_etag
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+
+
+class HttpCacheMiddleware:
+    """
+    Conditional GET of routes with a cache policy (`http_cache` dependency)
+
+    Adds `Cache-Control` and `ETag` to their 200 and 304 responses.
+    When the route didn't compute the ETag from a version (`not_modified`),
+    the body is hashed and `If-None-Match` answered here - the query and the
+    serialization still run, only the transfer is saved.
+
+    IMPORTANT: the body is buffered to hash it - don't give a policy to
+    streaming (export) routes.
+    """
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        response = await call_next(request)
+        policy = getattr(request.state, "cache_policy", None)
+        if policy is None or request.method not in CACHEABLE_METHODS or response.status_code not in (200, 304):
+            return response
+
+        etag = getattr(request.state, "etag", None)
+        if etag is None and response.status_code == 200:
+            # call_next answers with a streaming response
+            body_iterator: AsyncIterator[bytes] = response.body_iterator  # type: ignore[attr-defined]
+            body = b"".join([chunk async for chunk in body_iterator])
+            etag = make_etag(body)
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                response = Response(status_code=304)
+            else:
+                response = Response(content=body, status_code=200, headers=response.headers)
+
+        response.headers["Cache-Control"] = policy.header
+        if etag is not None:
+            response.headers["ETag"] = etag
+        return response
+
+
+http_cache_middleware = HttpCacheMiddleware()
@@ -0,0 +1,78 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from core.exceptions import InfrastructureException
+from core.response import ErrorCode
+from core.settings import settings
+from infrastructure.persistence.query_stats import collect_query_stats
+from utils.logger import logger
+
+
+class QueryStatsMiddleware:
+    """
+    Per-request SQL statistics
+
+    Adds `Server-Timing` (db total, slowest statement, whole request) to the
+    response and logs one line per request with the statement count, total and
+    slowest timing. A request slower than SLOW_REQUEST_MS is logged as a warning
+    with its SLOW_REQUEST_TOP_QUERIES slowest statements - never every statement,
+    an export or an N+1 page runs thousands.
+    A statement shape repeated more than SQL_REPEATED_STATEMENT_THRESHOLD times
+    (N+1) is logged as a warning, or raises when SQL_REPEATED_STATEMENT_STRICT is on.
+    """
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        started = time.perf_counter()
+        with collect_query_stats() as stats:
+            response = await call_next(request)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        response.headers.append(
+            "Server-Timing", f"{stats.server_timing()}, app;dur={elapsed_ms:.2f}"
+        )
+        logger.info(
+            "request",
+            method=request.method,
+            path=request.url.path,
+            status=response.status_code,
+            duration_ms=round(elapsed_ms, 2),
+            db_queries=stats.count,
+            db_ms=round(stats.total_ms, 2),
+            db_max_ms=round(stats.max_ms, 2),
+        )
+        if elapsed_ms >= settings.SLOW_REQUEST_MS:
+            logger.warning(
+                "slow_request",
+                method=request.method,
+                path=request.url.path,
+                duration_ms=round(elapsed_ms, 2),
+                db_queries=stats.count,
+                db_ms=round(stats.total_ms, 2),
+                slowest_queries=[
+                    {"ms": round(elapsed, 2), "statement": shape}
+                    for shape, elapsed in stats.slowest(settings.SLOW_REQUEST_TOP_QUERIES)
+                ],
+            )
+
+        repeated = stats.repeated(settings.SQL_REPEATED_STATEMENT_THRESHOLD)
+        if repeated:
+            logger.warning(
+                "repeated_sql_statements",
+                method=request.method,
+                path=request.url.path,
+                threshold=settings.SQL_REPEATED_STATEMENT_THRESHOLD,
+                statements=[{"count": count, "statement": shape} for shape, count in repeated],
+            )
+            if settings.SQL_REPEATED_STATEMENT_STRICT:
+                shape, count = repeated[0]
+                raise InfrastructureException(
+                    f"N+1 in {request.method} {request.url.path}: statement repeated {count} times: {shape}",
+                    ErrorCode.DATABASE_ERROR,
+                )
+
+        return response
+
+
+query_stats_middleware = QueryStatsMiddleware()
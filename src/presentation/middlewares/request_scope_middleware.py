@@ -0,0 +1,27 @@
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from di import request_context
+
+
+class RequestScopeMiddleware:
+    """
+    Opens the DI request scope for every request
+
+    Use cases, repositories and the unit of work resolved during the request
+    are created once and dropped when the response is ready. The session opens
+    only if a query runs; successful responses are committed once, error
+    responses and exceptions are rolled back, and the connection always goes
+    back to the pool.
+    """
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        async with request_context() as context:
+            response = await call_next(request)
+            if response.status_code >= 400:
+                await context.rollback()
+        return response
+
+
+request_scope_middleware = RequestScopeMiddleware()
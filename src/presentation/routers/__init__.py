@@ -1,9 +1,15 @@
 from .auth import auth_router
 from .user import user_router
 from .category import category_router
+from .product import product_router
+from .search import search_router
+from .tag import tag_router
 
 routers = [
     auth_router,
     user_router,
     category_router,
+    product_router,
+    search_router,
+    tag_router,
 ]
\ No newline at end of file
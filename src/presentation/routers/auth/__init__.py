@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-auth_router = APIRouter(prefix="/auth", tags=["auth"])
+auth_router: APIRouter = APIRouter(prefix="/auth", tags=["auth"])
 
 from .login_router import *
 from .register_router import *
\ No newline at end of file
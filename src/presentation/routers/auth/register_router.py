@@ -1,8 +1,6 @@
-from fastapi import Depends
-
 from application.usecases import SignUpUseCase
 from core.response import ApiResponse
-from di import container
+from di.fastapi_integration import resolve
 from presentation.mappers import signup_req_to_dto
 from presentation.routers.auth import auth_router
 from presentation.routers.auth.schema.auth_schema import SignUpRequest
@@ -11,9 +9,7 @@ from presentation.routers.auth.schema.auth_schema import SignUpRequest
 @auth_router.post("/signup", response_model=ApiResponse)
 async def signup(
         data: SignUpRequest,
-        use_case: SignUpUseCase = Depends(
-            lambda: container.get(SignUpUseCase)
-        )
+        use_case: SignUpUseCase = resolve(SignUpUseCase)
 ):
     try:
         to_dto = signup_req_to_dto(data)
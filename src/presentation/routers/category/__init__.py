@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-category_router = APIRouter(prefix="/category", tags=["category"])
+category_router: APIRouter = APIRouter(prefix="/category", tags=["category"])
 
 from .category_post_router import *
 from .category_detail_router import *
 from .category_list_router import *
+from .category_export_router import *
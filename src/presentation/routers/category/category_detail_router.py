@@ -1,20 +1,29 @@
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Request, Response
 
 from application.usecases import CategoryUseCase
 from application.dto import CategoryDTO
 from core.response import ApiResponse
-from di import container
+from di.fastapi_integration import resolve
+from presentation.http_cache import CATALOG_CACHE, http_cache, not_modified
 from presentation.routers.category import category_router
 from .schema.category_schema import CategorySchema
 
 
-@category_router.get("/detail/{category_id}/")
+@category_router.get(
+    "/detail/{category_id}/",
+    response_model=ApiResponse[CategoryDTO],
+    dependencies=[http_cache(CATALOG_CACHE)],
+)
 async def get_category(
         category_id: UUID,
-        use_case=Depends(lambda: container.get(CategoryUseCase))
-) -> ApiResponse[CategoryDTO]:
+        request: Request,
+        use_case: CategoryUseCase = resolve(CategoryUseCase)
+) -> ApiResponse[CategoryDTO] | Response:
 
+    unchanged = not_modified(request, await use_case.category_version(category_id))
+    if unchanged is not None:
+        return unchanged
     result = await use_case.get_category(category_id)
-    return result
\ No newline at end of file
+    return result
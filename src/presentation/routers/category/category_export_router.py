@@ -0,0 +1,20 @@
+from fastapi.responses import StreamingResponse
+
+from application.usecases import CategoryUseCase
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.compression import compression
+from presentation.routers.category import category_router
+from presentation.streaming import ExportFormat, export_response
+
+
+@category_router.get(
+    "/export/",
+    status_code=200,
+    dependencies=[compression(settings.COMPRESSION_EXPORT_LEVEL)],
+)
+async def export_categories(
+        format: ExportFormat = ExportFormat.NDJSON,
+        use_case: CategoryUseCase = resolve(CategoryUseCase)
+) -> StreamingResponse:
+    return export_response(use_case.export_categories(), format, "categories")
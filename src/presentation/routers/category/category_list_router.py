@@ -1,18 +1,42 @@
-from fastapi import Depends
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends, Request, Response
 
 from application.usecases import CategoryUseCase
 from application.dto import CategoryDTO, PagingDTO
-from di import container
+from di.fastapi_integration import resolve
+from presentation.dependencies import get_language
+from presentation.http_cache import CATALOG_CACHE, http_cache, not_modified
 from presentation.routers.category import category_router
-from .schema.category_schema import CategorySchema
 
 
-@category_router.get("/list/", status_code=200, response_model=PagingDTO[CategoryDTO])
+@category_router.get(
+    "/list/",
+    status_code=200,
+    response_model=PagingDTO[CategoryDTO],
+    dependencies=[http_cache(CATALOG_CACHE)],
+)
 async def list_categories(
+        request: Request,
         page: int = 1,
         limit: int = 10,
-        use_case=Depends(lambda: container.get(CategoryUseCase))
-) -> PagingDTO[CategorySchema]:
+        cursor: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        lang: Optional[str] = Depends(get_language),
+        use_case: CategoryUseCase = resolve(CategoryUseCase)
+) -> PagingDTO[CategoryDTO] | Response:
 
-    result = await use_case.list_categories(skip=page, limit=limit)
+    unchanged = not_modified(request, await use_case.category_version())
+    if unchanged is not None:
+        return unchanged
+    result = await use_case.list_categories(
+        skip=page,
+        limit=limit,
+        cursor=cursor,
+        lang=lang,
+        created_after=created_after,
+        created_before=created_before,
+    )
     return result
@@ -1,9 +1,7 @@
-from fastapi import Depends
-
 from application.usecases import CategoryUseCase
 from application.dto import CategoryDTO
 from core.response import ApiResponse
-from di import container
+from di.fastapi_integration import resolve
 from presentation.routers.category import category_router
 from .schema.category_schema import CategorySchema
 
@@ -11,7 +9,7 @@ from .schema.category_schema import CategorySchema
 @category_router.post("/create/", status_code=201)
 async def create_category(
         data: CategorySchema,
-        use_case=Depends(lambda: container.get(CategoryUseCase))
+        use_case=resolve(CategoryUseCase)
 ) -> ApiResponse[CategoryDTO]:
 
     result = await use_case.create_category(data)
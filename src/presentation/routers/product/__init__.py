@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+product_router: APIRouter = APIRouter(prefix="/product", tags=["product"])
+
+from .product_post_router import *
+from .product_detail_router import *
+from .product_list_router import *
+from .product_update_router import *
+from .product_export_router import *
+from .product_import_router import *
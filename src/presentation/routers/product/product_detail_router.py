@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from application.usecases import ProductUseCase
+from application.dto import ProductDetailDTO
+from core.response import ApiResponse
+from di.fastapi_integration import resolve
+from presentation.http_cache import PRODUCT_CACHE, http_cache
+from presentation.routers.product import product_router
+
+
+@product_router.get("/detail/{product_id}/", dependencies=[http_cache(PRODUCT_CACHE)])
+async def get_product(
+        product_id: UUID,
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> ApiResponse[ProductDetailDTO]:
+
+    result = await use_case.get_product(product_id)
+    return result
@@ -0,0 +1,20 @@
+from fastapi.responses import StreamingResponse
+
+from application.usecases import ProductUseCase
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.compression import compression
+from presentation.routers.product import product_router
+from presentation.streaming import ExportFormat, export_response
+
+
+@product_router.get(
+    "/export/",
+    status_code=200,
+    dependencies=[compression(settings.COMPRESSION_EXPORT_LEVEL)],
+)
+async def export_products(
+        format: ExportFormat = ExportFormat.NDJSON,
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> StreamingResponse:
+    return export_response(use_case.export_products(), format, "products")
@@ -0,0 +1,51 @@
+import io
+from typing import Optional
+
+from fastapi import File, Request, UploadFile
+
+from application.dto import ImportFormat, ImportResultDTO
+from application.usecases import CatalogImportUseCase
+from core.exceptions import ValidationException
+from core.response import ApiResponse
+from di.fastapi_integration import resolve
+from presentation.routers.product import product_router
+
+
+@product_router.post("/import/", status_code=200)
+async def import_products(
+        request: Request,
+        file: UploadFile = File(...),
+        format: Optional[ImportFormat] = None,
+        use_case: CatalogImportUseCase = resolve(CatalogImportUseCase)
+) -> ApiResponse[ImportResultDTO | None]:
+    """
+    Bulk import of a CSV / NDJSON product feed - superusers only
+
+    `format` defaults to the file extension. Categories and tags are created
+    by name when missing; products with a known uuid are updated.
+    """
+    if not hasattr(request.state, "user_id"):
+        return ApiResponse.error_response(
+            message="User not authenticated",
+            error_code=401
+        )
+    await use_case.ensure_can_import(request.state.user_id)
+
+    if format is None:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        try:
+            format = ImportFormat(extension)
+        except ValueError:
+            raise ValidationException("format", f"Unknown file type '.{extension}', pass ?format=csv|ndjson")
+
+    # Starlette already spooled the upload to a temporary file - read it as text, row by row
+    text_file = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        result = await use_case.import_file(text_file, format)
+    finally:
+        text_file.detach()
+
+    return ApiResponse.success_response(
+        data=result,
+        message="Catalogue imported successfully"
+    )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends
+
+from application.usecases import ProductUseCase
+from application.dto import ProductDTO, PagingDTO
+from di.fastapi_integration import resolve
+from presentation.dependencies import get_language
+from presentation.http_cache import PRODUCT_CACHE, http_cache
+from presentation.routers.product import product_router
+
+
+@product_router.get(
+    "/list/",
+    status_code=200,
+    response_model=PagingDTO[ProductDTO],
+    dependencies=[http_cache(PRODUCT_CACHE)],
+)
+async def list_products(
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        lang: Optional[str] = Depends(get_language),
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> PagingDTO[ProductDTO]:
+
+    result = await use_case.list_products(
+        skip=page,
+        limit=limit,
+        cursor=cursor,
+        lang=lang,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    return result
@@ -0,0 +1,16 @@
+from application.usecases import ProductUseCase
+from application.dto import ProductCreateDTO, ProductDetailDTO
+from core.response import ApiResponse
+from di.fastapi_integration import resolve
+from presentation.routers.product import product_router
+from .schema.product_schema import ProductSchema
+
+
+@product_router.post("/create/", status_code=201)
+async def create_product(
+        data: ProductSchema,
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> ApiResponse[ProductDetailDTO]:
+
+    result = await use_case.create_product(ProductCreateDTO(**data.model_dump()))
+    return result
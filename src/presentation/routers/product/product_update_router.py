@@ -0,0 +1,19 @@
+from uuid import UUID
+
+from application.usecases import ProductUseCase
+from application.dto import ProductCreateDTO, ProductDetailDTO
+from core.response import ApiResponse
+from di.fastapi_integration import resolve
+from presentation.routers.product import product_router
+from .schema.product_schema import ProductSchema
+
+
+@product_router.put("/update/{product_id}/")
+async def update_product(
+        product_id: UUID,
+        data: ProductSchema,
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> ApiResponse[ProductDetailDTO]:
+
+    result = await use_case.update_product(product_id, ProductCreateDTO(**data.model_dump()))
+    return result
@@ -0,0 +1,22 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ProductSchema(BaseModel):
+    name: dict[str, str] = {
+        "en": "Smartphone",
+        "ru": "Смартфон",
+        "uz": "Smartfon"
+    }
+    description: dict[str, str] = {
+        "en": "6.1 inch display, 128 GB",
+        "ru": "Дисплей 6.1 дюйма, 128 ГБ",
+        "uz": "6.1 dyuymli displey, 128 GB"
+    }
+    price: float = 0.0
+    stock: int = 0
+    category_id: UUID
+    tags: List[UUID] = []
+    images: List[UUID] = []
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+search_router: APIRouter = APIRouter(prefix="/search", tags=["search"])
+
+from .product_search_router import *
+from .category_search_router import *
+from .autocomplete_router import *
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from fastapi import Depends, Query
+
+from application.usecases import AutocompleteUseCase
+from application.dto import AutocompleteDTO
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.dependencies import get_preferred_language
+from presentation.routers.search import search_router
+
+
+@search_router.get("/autocomplete/", status_code=200, response_model=AutocompleteDTO)
+async def autocomplete(
+        q: str = Query(..., min_length=1, max_length=100),
+        limit: int = Query(settings.AUTOCOMPLETE_LIMIT, ge=1, le=20),
+        lang: Optional[str] = Depends(get_preferred_language),
+        use_case: AutocompleteUseCase = resolve(AutocompleteUseCase)
+) -> AutocompleteDTO:
+
+    result = await use_case.suggest(q, lang or settings.LANGUAGES[0], limit=limit)
+    return result
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from fastapi import Depends, Query
+
+from application.usecases import ProductUseCase
+from application.dto import ProductDTO, PagingDTO
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.dependencies import get_preferred_language
+from presentation.routers.search import search_router
+
+
+@search_router.get("/products/", status_code=200, response_model=PagingDTO[ProductDTO])
+async def search_products(
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = None,
+        lang: Optional[str] = Depends(get_preferred_language),
+        use_case: ProductUseCase = resolve(ProductUseCase)
+) -> PagingDTO[ProductDTO]:
+
+    result = await use_case.search_products(q, lang or settings.LANGUAGES[0], limit=limit, cursor=cursor)
+    return result
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+tag_router: APIRouter = APIRouter(prefix="/tag", tags=["tag"])
+
+from .tag_detail_router import *
+from .tag_list_router import *
+from .tag_export_router import *
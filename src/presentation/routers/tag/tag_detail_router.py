@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from fastapi import Request, Response
+
+from application.usecases import TagUseCase
+from application.dto import TagDTO
+from core.response import ApiResponse
+from di.fastapi_integration import resolve
+from presentation.http_cache import CATALOG_CACHE, http_cache, not_modified
+from presentation.routers.tag import tag_router
+
+
+@tag_router.get(
+    "/detail/{tag_id}/",
+    response_model=ApiResponse[TagDTO],
+    dependencies=[http_cache(CATALOG_CACHE)],
+)
+async def get_tag(
+        tag_id: UUID,
+        request: Request,
+        use_case: TagUseCase = resolve(TagUseCase)
+) -> ApiResponse[TagDTO | None] | Response:
+
+    unchanged = not_modified(request, await use_case.version(tag_id))
+    if unchanged is not None:
+        return unchanged
+    result = await use_case.get_by_id(tag_id)
+    return result
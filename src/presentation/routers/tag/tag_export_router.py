@@ -0,0 +1,20 @@
+from fastapi.responses import StreamingResponse
+
+from application.usecases import TagUseCase
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.compression import compression
+from presentation.routers.tag import tag_router
+from presentation.streaming import ExportFormat, export_response
+
+
+@tag_router.get(
+    "/export/",
+    status_code=200,
+    dependencies=[compression(settings.COMPRESSION_EXPORT_LEVEL)],
+)
+async def export_tags(
+        format: ExportFormat = ExportFormat.NDJSON,
+        use_case: TagUseCase = resolve(TagUseCase)
+) -> StreamingResponse:
+    return export_response(use_case.export(), format, "tags")
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from application.usecases import TagUseCase
+from application.dto import TagDTO, PagingDTO
+from di.fastapi_integration import resolve
+from presentation.http_cache import CATALOG_CACHE, http_cache, not_modified
+from presentation.routers.tag import tag_router
+
+
+@tag_router.get(
+    "/list/",
+    status_code=200,
+    response_model=PagingDTO[TagDTO],
+    dependencies=[http_cache(CATALOG_CACHE)],
+)
+async def list_tags(
+        request: Request,
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        use_case: TagUseCase = resolve(TagUseCase)
+) -> PagingDTO[TagDTO] | Response:
+
+    unchanged = not_modified(request, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    result = await use_case.list(
+        skip=page,
+        limit=limit,
+        cursor=cursor,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    return result
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
-user_router = APIRouter(prefix="/user", tags=["user"])
+user_router: APIRouter = APIRouter(prefix="/user", tags=["user"])
 
 from .me_router import *
+from .user_export_router import *
@@ -1,10 +1,10 @@
 from uuid import UUID
 
-from fastapi import Depends, Request
+from fastapi import Request
 
 from application.usecases import UserProfileUseCase
 from core.response import ApiResponse
-from di import container
+from di.fastapi_integration import resolve
 from presentation.routers.user import user_router
 from presentation.routers.user.schema import UserProfileSchema
 
@@ -12,7 +12,7 @@ from presentation.routers.user.schema import UserProfileSchema
 @user_router.get("/me", status_code=200)
 async def get_user_me(
         request: Request,
-        use_case: UserProfileUseCase = Depends(lambda: container.get(UserProfileUseCase))
+        use_case: UserProfileUseCase = resolve(UserProfileUseCase)
 ) -> ApiResponse[UserProfileSchema | None]:
     if not hasattr(request.state, "user_id"):
         return ApiResponse.error_response(
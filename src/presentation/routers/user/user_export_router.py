@@ -0,0 +1,31 @@
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from application.usecases import UserProfileUseCase
+from core.response import ApiResponse
+from core.settings import settings
+from di.fastapi_integration import resolve
+from presentation.compression import compression
+from presentation.routers.user import user_router
+from presentation.streaming import ExportFormat, export_response
+
+
+@user_router.get(
+    "/export/",
+    status_code=200,
+    dependencies=[compression(settings.COMPRESSION_EXPORT_LEVEL)],
+    response_model=None,
+)
+async def export_users(
+        request: Request,
+        format: ExportFormat = ExportFormat.NDJSON,
+        use_case: UserProfileUseCase = resolve(UserProfileUseCase)
+) -> ApiResponse[None] | StreamingResponse:
+    if not hasattr(request.state, "user_id"):
+        return ApiResponse.error_response(
+            message="User not authenticated",
+            error_code=401
+        )
+
+    users = await use_case.export_users(request.state.user_id)
+    return export_response(users, format, "users")
@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# Bytes buffered before a chunk is sent - one write per row would be one send() per row
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+async def _ndjson_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def _csv_cell(value: Any) -> Any:
+    # Localized {locale: text} fields stay machine readable
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def _csv_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = None
+    async for item in items:
+        row = item.model_dump(mode="json")
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow({key: _csv_cell(value) for key, value in row.items()})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+async def _chunked(lines: AsyncIterator[str], chunk_size: int) -> AsyncIterator[bytes]:
+    chunk: list[bytes] = []
+    size = 0
+    async for line in lines:
+        data = line.encode()
+        chunk.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+def export_response(
+        items: AsyncIterator[BaseModel],
+        export_format: ExportFormat,
+        filename: str,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> StreamingResponse:
+    """
+    Stream DTOs as NDJSON (one JSON object per line) or CSV (header + rows)
+
+    Rows are encoded as they come off the server-side cursor, nothing is
+    collected - memory stays flat however large the export.
+
+    IMPORTANT: headers are sent before the first row is read - an error in the
+    middle of the stream can only cut the body short. Do permission checks
+    before building the response.
+
+    Usage:
+        return export_response(use_case.export_categories(), ExportFormat.CSV, "categories")
+    """
+    lines = _ndjson_lines(items) if export_format is ExportFormat.NDJSON else _csv_lines(items)
+    return StreamingResponse(
+        _chunked(lines, chunk_size),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
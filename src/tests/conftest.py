@@ -1,10 +1,17 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from core.settings import settings
 from infrastructure.persistence.models import BaseModel
 from main import app
 
 
+@pytest.fixture(autouse=True)
+def fail_on_repeated_statements(monkeypatch: pytest.MonkeyPatch) -> None:
+    """N+1 (a statement shape repeated too often in one request) fails the test instead of a warning"""
+    monkeypatch.setattr(settings, "SQL_REPEATED_STATEMENT_STRICT", True)
+
+
 @pytest.fixture
 @pytest.mark.asyncio
 async def test_db():
@@ -0,0 +1,53 @@
+"""
+Batch loader (DataLoader style coalescing) tests
+"""
+import asyncio
+from typing import List, Mapping, Optional, Sequence
+
+from infrastructure.persistence.batch_loader import BatchLoader
+
+
+def test_loads_in_same_tick_share_one_batch() -> None:
+    """gather() over load() issues one batch call; duplicates and misses are handled"""
+    calls: List[List[int]] = []
+
+    async def batch_fn(keys: Sequence[int]) -> Mapping[int, int]:
+        calls.append(list(keys))
+        return {key: key * 10 for key in keys if key != 3}
+
+    async def main() -> tuple[Sequence[Optional[int]], Optional[int], Optional[int]]:
+        loader = BatchLoader(batch_fn)
+        first = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+        # Memoized - no second query
+        second = await loader.load(2)
+        loader.clear()
+        third = await loader.load(2)
+        return first, second, third
+
+    first, second, third = asyncio.run(main())
+
+    assert first == [10, 20, 10, None]
+    assert second == 20
+    assert third == 20
+    assert calls == [[1, 2, 3], [2]]
+
+
+def test_batch_failure_is_raised_to_every_caller_and_not_cached() -> None:
+    attempts: List[List[int]] = []
+
+    async def batch_fn(keys: Sequence[int]) -> Mapping[int, int]:
+        attempts.append(list(keys))
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return {key: key for key in keys}
+
+    async def main() -> tuple[Sequence[Optional[int] | BaseException], Optional[int]]:
+        loader = BatchLoader(batch_fn)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        return results, await loader.load(1)
+
+    results, retried = asyncio.run(main())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retried == 1
+    assert attempts == [[1, 2], [1]]
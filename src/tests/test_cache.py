@@ -0,0 +1,36 @@
+"""
+In-process LRU + TTL cache tests
+"""
+import time
+
+import pytest
+
+from utils.cache import TTLCache
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Reads refresh recency, the oldest untouched entry goes first"""
+    lru: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+
+
+def test_entry_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Expired entries are dropped on read"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    ttl: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+    ttl.set("phone", 1)
+
+    now[0] += 29
+    assert ttl.get("phone") == 1
+    now[0] += 2
+    assert ttl.get("phone") is None
+    assert len(ttl) == 0
@@ -0,0 +1,113 @@
+"""
+Catalogue import tests - feed decoding, row validation and error reporting
+"""
+import asyncio
+import csv
+import io
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Sequence, TextIO, cast
+
+import pytest
+
+from application.dto import ImportFormat, ImportResultDTO
+from application.services.catalog_reader import read_records
+from application.usecases import CatalogImportUseCase
+from core.exceptions import ValidationException
+from domain.entity import ImportErrorEntity, ImportResultEntity, ImportRowEntity
+from domain.repository import CatalogImportRepository, UnitOfWork, UserProfileRepository
+
+CSV_FEED = """uuid,name,price,stock,category,tags
+,Phone,10.5,3,Phones,"[""new"", {""en"": ""sale"", ""ru"": ""скидка""}]"
+,"{""en"": ""Laptop"", ""ru"": ""Ноутбук""}",-1,,Laptops,
+,Tablet,20,,"{""ru"": ""Планшеты""}",
+"""
+
+
+class FakeImportRepository(CatalogImportRepository):
+    def __init__(self) -> None:
+        self.staged: list[ImportRowEntity] = []
+
+    async def stage(self, rows: Sequence[ImportRowEntity]) -> None:
+        self.staged.extend(rows)
+
+    async def merge(self) -> ImportResultEntity:
+        return ImportResultEntity(
+            created=len(self.staged),
+            errors=[ImportErrorEntity(line=1, message="Superseded by a later row with the same uuid")],
+        )
+
+
+class FakeUnitOfWork(UnitOfWork):
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+def test_csv_cells_are_json_decoded_and_empty_cells_dropped() -> None:
+    records = list(read_records(io.StringIO(CSV_FEED), ImportFormat.CSV))
+
+    line, first = records[0]
+    assert line == 2 and isinstance(first, dict)
+    assert first["tags"] == ["new", {"en": "sale", "ru": "скидка"}]
+    assert "uuid" not in first and first["name"] == "Phone"
+    second = records[1][1]
+    assert isinstance(second, dict) and second["name"] == {"en": "Laptop", "ru": "Ноутбук"}
+
+
+def test_ndjson_reports_undecodable_lines() -> None:
+    feed = '{"name": "Phone", "price": 1, "category": "Phones"}\n\nnot json\n[1]\n'
+    records = list(read_records(io.StringIO(feed), ImportFormat.NDJSON))
+
+    assert [line for line, _ in records] == [1, 3, 4]
+    assert isinstance(records[1][1], ValueError) and isinstance(records[2][1], ValueError)
+
+
+def test_valid_rows_are_staged_and_invalid_ones_reported_by_line() -> None:
+    repository = FakeImportRepository()
+    # users - only the permission check reads it, import_file doesn't
+    use_case = CatalogImportUseCase(repository, users=cast(UserProfileRepository, None), uow=FakeUnitOfWork())
+
+    result = asyncio.run(use_case.import_file(io.StringIO(CSV_FEED), ImportFormat.CSV, chunk_size=2))
+
+    assert [row.line for row in repository.staged] == [2]
+    staged = repository.staged[0]
+    assert staged.name == {"en": "Phone"} and staged.uuid is not None
+    assert staged.tags == [{"en": "new"}, {"en": "sale", "ru": "скидка"}]
+
+    assert (result.rows, result.created, result.failed) == (3, 1, 3)
+    assert [error.line for error in result.errors] == [1, 3, 4]
+    assert result.errors[1].message.startswith("price:")
+    assert "'en' name is required" in result.errors[2].message
+
+
+def _import(feed: TextIO, import_format: ImportFormat = ImportFormat.CSV) -> tuple[FakeImportRepository, ImportResultDTO]:
+    repository = FakeImportRepository()
+    use_case = CatalogImportUseCase(repository, users=cast(UserProfileRepository, None), uow=FakeUnitOfWork())
+    return repository, asyncio.run(use_case.import_file(feed, import_format))
+
+
+def test_unreadable_file_is_a_validation_error() -> None:
+    latin1 = io.BytesIO("name,price,category\nCafé,1,Drinks\n".encode("latin-1"))
+    with pytest.raises(ValidationException, match="not UTF-8"):
+        _import(io.TextIOWrapper(latin1, encoding="utf-8-sig", newline=""))
+
+    limit = csv.field_size_limit(10)
+    try:
+        with pytest.raises(ValidationException, match="malformed CSV"):
+            _import(io.StringIO(f"name,price,category\n{'x' * 20},1,Phones\n"))
+    finally:
+        csv.field_size_limit(limit)
+
+
+def test_nul_character_is_rejected_by_line() -> None:
+    feed = '{"name": "a\\u0000b", "price": 1, "category": "Phones"}\n{"name": "ab", "price": 1, "category": "Phones"}\n'
+    repository, result = _import(io.StringIO(feed), ImportFormat.NDJSON)
+
+    assert [row.line for row in repository.staged] == [2]
+    assert [error.line for error in result.errors if "NUL character" in error.message] == [1]
@@ -0,0 +1,98 @@
+"""
+Response compression middleware tests
+"""
+import gzip
+import zlib
+from typing import AsyncIterator
+
+import httpx
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from core.settings import settings
+from presentation.compression import accepts_gzip, compression
+from presentation.middlewares import compression_middleware
+
+LARGE = "x" * (settings.COMPRESSION_MIN_SIZE * 4)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.middleware("http")(compression_middleware)
+
+    @app.get("/large/")
+    async def large() -> Response:
+        return Response(LARGE, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small/")
+    async def small() -> dict[str, str]:
+        return {"value": "x"}
+
+    @app.get("/image/")
+    async def image() -> Response:
+        return Response(LARGE.encode(), media_type="image/png")
+
+    @app.get("/off/", dependencies=[compression(0)])
+    async def off() -> Response:
+        return Response(LARGE, media_type="application/json")
+
+    @app.get("/stream/", dependencies=[compression(1)])
+    async def stream(rows: int = 100) -> StreamingResponse:
+        async def lines() -> AsyncIterator[bytes]:
+            for i in range(rows):
+                yield f'{{"row": {i}}}\n'.encode()
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def _raw(client: TestClient, path: str, encoding: str = "gzip") -> tuple[httpx.Response, bytes]:
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_accept_encoding() -> None:
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, *;q=0.5")
+    assert not accepts_gzip("gzip;q=0, *")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("")
+
+
+def test_large_text_response_is_gzipped_with_weak_etag() -> None:
+    response, body = _raw(_client(), "/large/")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["etag"] == 'W/"abc"'
+    assert gzip.decompress(body).decode() == LARGE
+    assert len(body) < len(LARGE)
+
+
+def test_skipped_responses() -> None:
+    client = _client()
+
+    for path, encoding in (("/small/", "gzip"), ("/image/", "gzip"), ("/off/", "gzip"), ("/large/", "identity")):
+        response, _ = _raw(client, path, encoding)
+        assert "content-encoding" not in response.headers, path
+
+
+def test_stream_is_compressed_chunk_by_chunk() -> None:
+    response, body = _raw(_client(), "/stream/?rows=1000")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body).decode().splitlines()[-1] == '{"row": 999}'
+
+    # Every chunk is sync-flushed - each one decodes without the rest of the stream
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(body[:len(body) // 2])
+
+
+def test_short_stream_goes_uncompressed() -> None:
+    response, body = _raw(_client(), "/stream/?rows=2")
+
+    assert "content-encoding" not in response.headers
+    assert body == b'{"row": 0}\n{"row": 1}\n'
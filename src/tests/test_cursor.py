@@ -0,0 +1,35 @@
+"""
+Keyset pagination cursor tests
+"""
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from core.exceptions import ValidationException
+from infrastructure.persistence.cursor import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """Cursor decodes back to the same keyset values"""
+    created_at = datetime(2025, 10, 1, 17, 1, 39, 221148)
+    uuid = uuid4()
+
+    cursor = encode_cursor(created_at, uuid)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime, UUID) == (created_at, uuid)
+
+
+def test_cursor_supports_rank_values() -> None:
+    """Float keys (e.g. search rank) survive the round trip exactly"""
+    cursor = encode_cursor(0.0607927, uuid4())
+    rank, _ = decode_cursor(cursor, float, UUID)
+    assert rank == 0.0607927
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor("x"), encode_cursor("x", "y")])
+def test_invalid_cursor_raises_validation_error(cursor: str) -> None:
+    """Malformed or foreign cursors are rejected as validation errors"""
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor, datetime, UUID)
@@ -0,0 +1,94 @@
+"""
+Conditional GET (ETag / If-None-Match) and Cache-Control tests
+"""
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from presentation.http_cache import CachePolicy, etag_matches, http_cache, make_etag, not_modified
+from presentation.middlewares import http_cache_middleware
+
+POLICY = CachePolicy(max_age=60)
+built: list[str] = []
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.middleware("http")(http_cache_middleware)
+
+    @app.get("/versioned/", response_model=None, dependencies=[http_cache(POLICY)])
+    async def versioned(request: Request, version: str = "1") -> Response | dict[str, str]:
+        unchanged = not_modified(request, version)
+        if unchanged is not None:
+            return unchanged
+        built.append(version)
+        return {"version": version}
+
+    @app.get("/hashed/", dependencies=[http_cache(CachePolicy())])
+    async def hashed(value: str = "a") -> dict[str, str]:
+        return {"value": value}
+
+    @app.get("/plain/")
+    async def plain() -> dict[str, str]:
+        return {}
+
+    return TestClient(app)
+
+
+def test_policy_header() -> None:
+    assert CachePolicy().header == "private, no-cache"
+    assert POLICY.header == "private, max-age=60"
+    assert CachePolicy(max_age=60, shared_max_age=600, stale_while_revalidate=30).header == (
+        "public, max-age=60, s-maxage=600, stale-while-revalidate=30"
+    )
+    assert CachePolicy(max_age=60, no_store=True).header == "no-store"
+
+
+def test_if_none_match_is_weak_comparison() -> None:
+    etag = make_etag("v1")
+
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_version_etag_answers_304_before_the_body_is_built() -> None:
+    client = _client()
+    built.clear()
+
+    first = client.get("/versioned/")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, max-age=60"
+
+    again = client.get("/versioned/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert again.headers["cache-control"] == "private, max-age=60"
+    assert built == ["1"]
+
+    # New version - and the same version with another query (?lang=) - is a new representation
+    assert client.get("/versioned/?version=2", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/versioned/?lang=ru", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_body_hash_etag() -> None:
+    client = _client()
+
+    first = client.get("/hashed/")
+    etag = first.headers["etag"]
+    assert first.json() == {"value": "a"}
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    assert client.get("/hashed/", headers={"If-None-Match": etag}).status_code == 304
+    changed = client.get("/hashed/?value=b", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_routes_without_policy_are_untouched() -> None:
+    response = _client().get("/plain/")
+
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
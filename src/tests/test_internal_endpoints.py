@@ -0,0 +1,65 @@
+"""
+Internal statistics endpoints are not public
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from application.usecases import UserProfileUseCase
+from core.exceptions import ApplicationException
+from infrastructure.persistence import routing
+from infrastructure.persistence.repository import UserProfileRepositoryImpl
+from presentation.dependencies import require_superuser
+from presentation.middlewares.jwt_auth_middleware import AuthenticationMiddleware
+
+
+class _Users:
+    def __init__(self, superusers: set[UUID]) -> None:
+        self.superusers = superusers
+
+    async def is_superuser(self, uuid: UUID) -> bool:
+        return uuid in self.superusers
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.on_primary: list[bool] = []
+
+    async def execute(self, statement: Any) -> Any:
+        self.on_primary.append(routing._on_primary.get())
+        return SimpleNamespace(scalar_one_or_none=lambda: True)
+
+
+def _require(user_id: Any, superusers: set[UUID]) -> UUID:
+    request: Any = SimpleNamespace(state=SimpleNamespace(user_id=user_id))
+    use_case = UserProfileUseCase(_Users(superusers))  # type: ignore[arg-type]
+    return asyncio.run(require_superuser(request, use_case))
+
+
+def test_only_liveness_is_public() -> None:
+    middleware = AuthenticationMiddleware()
+
+    assert middleware._is_public_path("/api/v1/health")
+    assert not middleware._is_public_path("/api/v1/internal/db-pool")
+    assert not middleware._is_public_path("/api/v1/internal/cache")
+
+
+def test_require_superuser() -> None:
+    admin, user = UUID(int=1), UUID(int=2)
+
+    assert _require(admin, {admin}) == admin
+    with pytest.raises(ApplicationException):
+        _require(user, {admin})
+    with pytest.raises(ApplicationException):
+        _require(None, {admin})
+
+
+def test_superuser_check_reads_the_primary() -> None:
+    session = _Session()
+    repository = UserProfileRepositoryImpl(SimpleNamespace(session=session))  # type: ignore[arg-type]
+
+    assert asyncio.run(repository.is_superuser(UUID(int=1)))
+    assert session.on_primary == [True]
@@ -0,0 +1,31 @@
+"""
+Locale selection tests
+"""
+import pytest
+
+from core.exceptions import ValidationException
+from presentation.dependencies.language import get_language, get_preferred_language
+
+
+def test_accept_language_picks_best_supported_locale() -> None:
+    """Highest q among supported locales wins, region subtags are ignored"""
+    assert get_preferred_language(lang=None, accept_language="fr, en;q=0.2, ru-RU;q=0.9") == "ru"
+    assert get_preferred_language(lang=None, accept_language="fr, de") is None
+    assert get_preferred_language(lang=None, accept_language=None) is None
+
+
+def test_lang_query_overrides_header() -> None:
+    """?lang= wins over Accept-Language and must be supported"""
+    assert get_preferred_language(lang="uz", accept_language="ru") == "uz"
+
+    with pytest.raises(ValidationException):
+        get_preferred_language(lang="de", accept_language=None)
+
+
+def test_lists_project_only_on_explicit_lang() -> None:
+    """Lists keep the `{locale: text}` shape unless ?lang= asks for one locale"""
+    assert get_language(lang=None) is None
+    assert get_language(lang="ru") == "ru"
+
+    with pytest.raises(ValidationException):
+        get_language(lang="de")
@@ -0,0 +1,41 @@
+"""
+Per-request SQL statistics / N+1 detection tests
+"""
+from infrastructure.persistence.query_stats import QueryStats, statement_shape
+
+
+def test_statement_shape_ignores_parameters_and_list_lengths() -> None:
+    assert statement_shape("SELECT * FROM tags\n WHERE uuid = $1") == statement_shape(
+        "SELECT * FROM tags WHERE uuid = $2"
+    )
+    assert statement_shape("SELECT 1 WHERE name = 'a' AND id IN ($1, $2, $3)") == (
+        "SELECT ? WHERE name = ? AND id IN (?)"
+    )
+    assert statement_shape("INSERT INTO t (a) VALUES ($1), ($2), ($3)") == "INSERT INTO t (a) VALUES (?)"
+
+
+def test_repeated_shapes_above_threshold() -> None:
+    stats = QueryStats()
+    for i in range(12):
+        stats.record(f"SELECT * FROM product_images WHERE product_id = $1 /* {i} */", 0.5)
+    stats.record("SELECT * FROM products", 2.0)
+
+    assert stats.count == 13
+    assert [count for _, count in stats.repeated(10)] == [12]
+    assert stats.repeated(12) == []
+    assert stats.server_timing().startswith('db;dur=8.00;desc="13 queries"')
+
+
+def test_slowest_statements_only() -> None:
+    stats = QueryStats()
+    for i in range(1000):
+        stats.record(f"SELECT * FROM products WHERE uuid = $1 /* {i} */", i / 100)
+    stats.record("SELECT count(*) FROM products", 50.0)
+
+    assert stats.max_ms == 50.0
+    assert stats.slowest(3) == [
+        ("SELECT count(*) FROM products", 50.0),
+        ("SELECT * FROM products WHERE uuid = ? /* ? */", 9.99),
+        ("SELECT * FROM products WHERE uuid = ? /* ? */", 9.98),
+    ]
+    assert QueryStats().slowest(3) == [] and QueryStats().max_ms == 0.0
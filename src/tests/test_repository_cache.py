@@ -0,0 +1,218 @@
+"""
+Repository read-through cache tests - memory backend and a Redis stand-in
+"""
+import asyncio
+import fnmatch
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from uuid import UUID
+
+from infrastructure.cache import CacheBackend, CacheEntry, CacheInvalidationListener, MemoryCacheBackend, RedisCacheBackend
+from infrastructure.cache.invalidation import notification_payloads
+from infrastructure.persistence import routing
+from infrastructure.persistence.repository import CachedRepositoryMixin
+
+
+class FakeUnitOfWork:
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self.callbacks.append(callback)
+
+    async def commit(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            await callback()
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.notifications: list[dict[str, Any]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any]) -> None:
+        self.notifications.append(params)
+
+
+class FakeRepository:
+    """Stands in for BaseRepository - counts the queries it would run"""
+    model_class = SimpleNamespace(__tablename__="tags")
+
+    def __init__(self) -> None:
+        self.rows = {UUID(int=1): "first", UUID(int=2): "second"}
+        self.queries = 0
+        self.on_primary: list[bool] = []
+        self.db = FakeSession()
+
+    async def get_by_uuid(self, entity_id: UUID) -> Optional[str]:
+        self.queries += 1
+        self.on_primary.append(routing._on_primary.get())
+        return self.rows.get(entity_id)
+
+    async def list(self, skip: int = 1, limit: int = 10, cursor: Optional[str] = None) -> list[str]:
+        self.queries += 1
+        return sorted(self.rows.values())[(skip - 1) * limit:skip * limit]
+
+    async def update(self, entity_id: UUID, entity: str) -> str:
+        self.rows[entity_id] = entity
+        return entity
+
+
+class CachedFakeRepository(CachedRepositoryMixin, FakeRepository):
+    def __init__(self, cache: CacheBackend, uow: FakeUnitOfWork) -> None:
+        super().__init__()
+        self.cache = cache
+        self.uow = uow
+
+
+class FakeRedis:
+    """Local stand-in for redis.asyncio.Redis - the calls RedisCacheBackend makes"""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, px: Optional[int] = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match: str) -> AsyncIterator[str]:
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+def test_reads_are_served_from_cache_and_counted() -> None:
+    backend = MemoryCacheBackend(maxsize=100, ttl=60)
+
+    async def main() -> int:
+        repo = CachedFakeRepository(backend, FakeUnitOfWork())
+        assert await repo.get_by_uuid(UUID(int=1)) == "first"
+        assert await repo.get_by_uuid(UUID(int=1)) == "first"
+        assert await repo.list(1, limit=10) == ["first", "second"]
+        assert await repo.list(skip=1) == ["first", "second"]  # same page, other spelling
+        return repo.queries
+
+    assert asyncio.run(main()) == 2
+    assert backend.stats.snapshot()["namespaces"]["tags"] == {
+        "hits": 2, "misses": 2, "invalidations": 0, "early_refreshes": 0, "hit_ratio": 0.5,
+    }
+
+
+def test_misses_are_filled_from_the_primary() -> None:
+    """A lagging replica's row would stay cached for the whole TTL"""
+    async def main() -> list[bool]:
+        repo = CachedFakeRepository(MemoryCacheBackend(maxsize=100, ttl=60), FakeUnitOfWork())
+        await repo.get_by_uuid(UUID(int=1))
+        repo._cache_bypass = True
+        await repo.get_by_uuid(UUID(int=2))
+        return repo.on_primary
+
+    assert asyncio.run(main()) == [True, False]
+
+
+def test_versions_come_from_the_cache() -> None:
+    """ETag sources - no query on a hit, new versions after a write"""
+    backend = MemoryCacheBackend(maxsize=100, ttl=60)
+    uow = FakeUnitOfWork()
+
+    async def main() -> tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+        reader = CachedFakeRepository(backend, FakeUnitOfWork())
+        list_version = await reader.version()
+        entity_version = await reader.version(UUID(int=1))
+        assert await reader.version() == list_version
+        assert await reader.version(UUID(int=1)) == entity_version
+        assert await reader.get_by_uuid(UUID(int=1)) == "first"
+        assert reader.queries == 1
+        assert await reader.version(UUID(int=3)) is None
+
+        writer = CachedFakeRepository(backend, uow)
+        writer.rows = reader.rows
+        await writer.update(UUID(int=1), "changed")
+        await uow.commit()
+        return list_version, entity_version, await reader.version(), await reader.version(UUID(int=1))
+
+    old_list, old_entity, new_list, new_entity = asyncio.run(main())
+    assert new_list != old_list
+    assert new_entity != old_entity
+
+
+def test_write_invalidates_entity_and_pages_now_and_after_commit() -> None:
+    backend = MemoryCacheBackend(maxsize=100, ttl=60)
+    uow = FakeUnitOfWork()
+
+    async def main() -> tuple[Optional[str], list[str]]:
+        reader = CachedFakeRepository(backend, FakeUnitOfWork())
+        await reader.get_by_uuid(UUID(int=1))
+        await reader.list()
+
+        writer = CachedFakeRepository(backend, uow)
+        writer.rows = reader.rows
+        await writer.update(UUID(int=1), "changed")
+        assert json.loads(writer.db.notifications[0]["payload"]) == {"table": "tags", "keys": [str(UUID(int=1))]}
+        # The writing request never caches (or reads cached) uncommitted rows
+        assert await writer.get_by_uuid(UUID(int=1)) == "changed"
+        assert await backend.get("tags:uuid:" + str(UUID(int=1))) is None
+
+        # Another request re-caches before the commit ...
+        await backend.set("tags:uuid:" + str(UUID(int=1)), CacheEntry("first", 0.0, time.time() + 60), 60)
+        await uow.commit()
+        # ... the after-commit eviction drops it again
+        return await reader.get_by_uuid(UUID(int=1)), await reader.list()
+
+    assert asyncio.run(main()) == ("changed", ["changed", "second"])
+
+
+def test_redis_backend_round_trips_pickled_values() -> None:
+    client = FakeRedis()
+    backend = RedisCacheBackend(client=client, prefix="test:")
+
+    async def main() -> tuple[Any, Any]:
+        await backend.set("tags:uuid:1", {"en": "Phones"}, ttl=5)
+        value = await backend.get("tags:uuid:1")
+        await backend.clear()
+        return value, await backend.get("tags:uuid:1")
+
+    assert asyncio.run(main()) == ({"en": "Phones"}, None)
+    assert client.data == {}
+
+
+def test_redis_errors_are_misses() -> None:
+    class BrokenRedis(FakeRedis):
+        async def get(self, key: str) -> Optional[bytes]:
+            raise ConnectionError("redis is down")
+
+    backend = RedisCacheBackend(client=BrokenRedis())
+    assert asyncio.run(backend.get("tags:uuid:1")) is None
+    assert backend.stats.errors == 1
+
+
+def test_notifications_are_split_under_the_payload_limit() -> None:
+    payloads = notification_payloads("categories", [UUID(int=i) for i in range(250)])
+
+    assert [len(json.loads(payload)["keys"]) for payload in payloads] == [100, 100, 50]
+    assert all(len(payload) < 8000 for payload in payloads)
+    assert notification_payloads("categories") == ['{"table": "categories", "keys": []}']
+
+
+def test_listener_evicts_named_keys_and_pages() -> None:
+    backend = MemoryCacheBackend(maxsize=100, ttl=60)
+    listener = CacheInvalidationListener(backend, dsn="postgresql://unused", channel="cache_invalidation")
+
+    async def main() -> list[Any]:
+        await backend.set("categories:uuid:1", "phones", 60)
+        await backend.set("categories:uuid:2", "laptops", 60)
+        await backend.set("categories:version", "v1", None)
+        await listener.handle('{"table": "categories", "keys": ["1"]}')
+        await listener.handle("not json")
+        return [await backend.get(f"categories:{key}") for key in ("uuid:1", "uuid:2", "version")]
+
+    assert asyncio.run(main()) == [None, "laptops", None]
+    assert listener.received == 2
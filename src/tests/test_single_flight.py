@@ -0,0 +1,78 @@
+"""
+Single-flight coalescing and XFetch early refresh tests
+"""
+import asyncio
+from typing import Any
+
+import pytest
+
+from infrastructure.cache import CacheEntry
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    executions: list[int] = []
+
+    async def load() -> str:
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return "category"
+
+    async def main() -> tuple[list[str], str]:
+        first = await asyncio.gather(*(flights.do("category:1", load) for _ in range(50)))
+        second = await flights.do("category:1", load)  # finished calls are not remembered
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == ["category"] * 50 and second == "category"
+    assert len(executions) == 2
+    assert flights.snapshot() == {
+        "calls": 51, "executions": 2, "coalesced": 49, "coalescing_ratio": 49 / 51, "in_flight": 0,
+    }
+
+
+def test_exception_reaches_every_waiter() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+
+    async def load() -> str:
+        await asyncio.sleep(0.01)
+        raise LookupError("database is down")
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(*(flights.do("k", load) for _ in range(3)), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(main())] == [LookupError] * 3
+
+
+def test_waiters_retry_when_the_leader_is_cancelled() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    started: list[int] = []
+
+    async def load() -> str:
+        started.append(1)
+        await asyncio.sleep(0.05 if len(started) == 1 else 0)
+        return "value"
+
+    async def main() -> str:
+        leader = asyncio.create_task(flights.do("k", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "value"
+    assert len(started) == 2
+
+
+def test_xfetch_refreshes_early_only_near_expiry() -> None:
+    entry = CacheEntry("value", delta=0.5, expires_at=1000.0)
+
+    # ln(0.5) * 0.5 = -0.35s - refreshed within the last 0.35s only
+    assert not entry.refresh_due(beta=1.0, now=999.0, rand=lambda: 0.5)
+    assert entry.refresh_due(beta=1.0, now=999.7, rand=lambda: 0.5)
+    assert entry.refresh_due(beta=1.0, now=1000.0, rand=lambda: 1.0)
+    assert not entry.refresh_due(beta=0.0, now=999.99, rand=lambda: 0.0001)
@@ -0,0 +1,55 @@
+"""
+Streaming export encoding tests
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from fastapi.responses import StreamingResponse
+
+from application.dto import CategoryDTO
+from presentation.streaming import ExportFormat, export_response
+
+CATEGORIES = [
+    CategoryDTO(uuid=UUID(int=1), name={"en": "Phones", "ru": "Телефоны"}, description=None),
+    CategoryDTO(uuid=UUID(int=2), name={"en": "Laptops, tablets"}, description={"en": "All"}),
+]
+
+
+async def _items() -> AsyncIterator[CategoryDTO]:
+    for category in CATEGORIES:
+        yield category
+
+
+def _body(export_format: ExportFormat, chunk_size: int = 64 * 1024) -> tuple[StreamingResponse, list[Any]]:
+    response = export_response(_items(), export_format, "categories", chunk_size=chunk_size)
+
+    async def main() -> list[Any]:
+        return [chunk async for chunk in response.body_iterator]
+
+    return response, asyncio.run(main())
+
+
+def test_ndjson_is_one_object_per_line() -> None:
+    response, chunks = _body(ExportFormat.NDJSON)
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert response.media_type == "application/x-ndjson"
+    assert 'filename="categories.ndjson"' in response.headers["content-disposition"]
+    assert [json.loads(line)["name"] for line in lines] == [c.name for c in CATEGORIES]
+
+
+def test_csv_has_header_and_json_encoded_localized_cells() -> None:
+    _, chunks = _body(ExportFormat.CSV)
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert lines[0] == "uuid,name,description"
+    assert lines[1].startswith(f'{UUID(int=1)},"{{""en"": ""Phones"", ""ru"": ""Телефоны""}}",')
+    assert len(lines) == 3
+
+
+def test_rows_are_batched_into_chunks() -> None:
+    """Small chunk size - one chunk per row, default - a single chunk"""
+    assert len(_body(ExportFormat.NDJSON, chunk_size=1)[1]) == 2
+    assert len(_body(ExportFormat.NDJSON)[1]) == 1
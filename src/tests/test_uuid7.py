@@ -0,0 +1,27 @@
+"""
+UUIDv7 generator tests
+"""
+import time
+from uuid import UUID
+
+from utils.uuid7 import uuid7
+
+
+def test_uuid7_layout() -> None:
+    """Version 7, RFC 4122 variant and the current unix time in the first 48 bits"""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert isinstance(value, UUID)
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_uuid7_is_monotonic() -> None:
+    """Values generated in a row sort in generation order, also within one millisecond"""
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
@@ -0,0 +1,50 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache with a per-entry time to live
+
+    At most `maxsize` entries - the least recently used one is evicted first.
+    Expired entries are dropped when read.
+
+    IMPORTANT: Har bir process (worker) ning o'z cache i bor - faqat qisqa TTL
+    bilan, eskirgan qiymat zarar qilmaydigan joylarda ishlating.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[K, tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """`ttl` overrides the cache's default for this entry"""
+        self._items[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Concurrent calls with the same key share one execution
+
+    The first caller (leader) runs `fn`; callers arriving while it is in
+    flight wait for its result (or exception) instead of running `fn` again.
+    Nothing is remembered once the call finishes - pair it with a cache.
+
+    If the leader is cancelled (client went away), waiting callers retry -
+    one of them becomes the new leader.
+
+    Usage:
+        flights: SingleFlight[CategoryEntity] = SingleFlight()
+        category = await flights.do(("category", uuid), lambda: repo.get_by_uuid(uuid))
+
+    IMPORTANT: Bitta process (event loop) ichida ishlaydi - boshqa worker lar
+    o'z so'rovini yuboradi.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+        self.calls = 0
+        self.executions = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            try:
+                # shield - a cancelled follower must not cancel the shared result
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if future.cancelled() and not (current and current.cancelling()):
+                    self.calls -= 1
+                    return await self.do(key, fn)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting - don't log "exception was never retrieved"
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[key] = future
+        self.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Calls, executions and the share of calls that were coalesced"""
+        coalesced = self.calls - self.executions
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": coalesced,
+            "coalescing_ratio": coalesced / self.calls if self.calls else 0.0,
+            "in_flight": len(self._in_flight),
+        }
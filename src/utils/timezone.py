@@ -4,3 +4,9 @@ from datetime import datetime
 def utcnow() -> datetime:
     return datetime.now(pytz.utc)
 
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Naive UTC datetime for `timestamp without time zone` columns (naive input is taken as UTC)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(pytz.utc).replace(tzinfo=None)
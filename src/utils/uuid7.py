@@ -0,0 +1,49 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID version 7 (RFC 9562)
+
+    48 bit unix milliseconds | version 7 | 12 bit counter | variant | 62 random bits
+
+    New values sort after older ones, so primary key inserts append to the
+    right edge of the B-tree instead of splitting random pages (uuid4).
+    Within one millisecond the counter keeps values of this process monotonic;
+    it starts at a random point in its lower half, on overflow the timestamp
+    borrows the next millisecond.
+
+    IMPORTANT: Oddiy UUID - mavjud uuid4 qiymatlar bilan bir ustunda ishlaydi,
+    faqat vaqt bo'yicha tartib beradi (timestamp qiymatning ichida ko'rinadi).
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & (_COUNTER_MAX >> 1)
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return UUID(int=(
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits
+    ))